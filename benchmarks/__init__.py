@@ -0,0 +1 @@
+"""Benchmarks for PyGInvaders, run as modules from the repository root."""
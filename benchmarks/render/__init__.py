@@ -0,0 +1,14 @@
+"""Microbenchmarks comparing ways of drawing the game's scenes.
+
+Every strategy draws the same scenes of moving entities offscreen, under
+SDL's dummy video driver unless another driver is configured, at increasing
+entity counts:
+
+    uv run python -m benchmarks.render
+    uv run python -m benchmarks.render --group sprites --counts 100 1000
+
+The first strategy of each group is the naive one, and the others are
+reported as speedups against it. The dummy driver has no real
+display, so presenting costs less than it would in a window; compare
+strategies within a run rather than against frame budgets.
+"""
@@ -0,0 +1,86 @@
+"""Run the render benchmarks and print a table per group of strategies."""
+
+import argparse
+import os
+import time
+
+import pygame
+
+from benchmarks.render.strategies import GROUPS, STRATEGIES, Scene, Strategy
+from pyginvaders.config import DEFAULT_CONFIG
+
+DEFAULT_COUNTS = (50, 200, 800, 3200)
+
+
+def time_strategy(
+    strategy: Strategy, screen: pygame.Surface, scene: Scene, frames: int
+) -> float:
+    """Time a strategy drawing a scene.
+
+    Args:
+        strategy: The strategy
+        screen: Display surface to draw on
+        scene: The scene to draw
+        frames: Frames to time, after a few untimed ones
+
+    Returns:
+        Mean time per frame in microseconds, the best of three runs
+    """
+    draw = strategy.setup(screen, scene)
+    for frame in range(min(frames, 10)):
+        draw(frame)
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for frame in range(frames):
+            draw(frame)
+        best = min(best, (time.perf_counter() - start) / frames)
+    return best * 1_000_000
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the render benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--group", choices=GROUPS, action="append", help="groups to run (default: all)"
+    )
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=DEFAULT_COUNTS,
+        help="entity counts to draw",
+    )
+    parser.add_argument("--frames", type=int, default=100, help="frames per timing")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    config = DEFAULT_CONFIG
+    screen = pygame.display.set_mode((config.screen_width, config.screen_height))
+    scenes = [Scene(count, config) for count in args.counts]
+    groups = args.group or GROUPS
+
+    print(f"Microseconds per frame ({pygame.display.get_driver()} driver)")
+    for group in groups:
+        strategies = [s for s in STRATEGIES if s.group == group]
+        header = "".join(f"{count:>16}" for count in args.counts)
+        print(f"\n{group:<20}{header}")
+        baseline: list[float] = []
+        for strategy in strategies:
+            times = [
+                time_strategy(strategy, screen, scene, args.frames) for scene in scenes
+            ]
+            if not baseline:
+                baseline = times
+            cells = "".join(
+                f"{us:>9.0f} {base / us:>5.2f}x" for us, base in zip(times, baseline)
+            )
+            print(f"{strategy.name:<20}{cells}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
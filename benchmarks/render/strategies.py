@@ -0,0 +1,307 @@
+"""Drawing strategies compared by the render benchmarks.
+
+A strategy is set up once for a scene and then draws frames of it. Setup may
+prebuild sprites, surfaces or text, which is the point of several of the
+strategies, so only drawing frames is timed.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import pygame
+
+from pyginvaders.config import DEFAULT_CONFIG, Config
+from pyginvaders.particles import PARTICLE_SIZE, ParticleSystem
+
+# Frames of movement in a scene, replayed in a loop
+SCENE_FRAMES = 16
+# Pixels every entity moves per frame
+_SPEED = 2
+# Craters eroded from each shield of a scene
+_CRATERS_PER_SHIELD = 6
+
+BLACK = (0, 0, 0)
+
+DrawFrame = Callable[[int], None]
+
+
+class Scene:
+    """Entities moving across the screen, precomputed for a few frames."""
+
+    def __init__(self, count: int, config: Config = DEFAULT_CONFIG, seed: int = 1):
+        """Place the entities at random and precompute their movement.
+
+        Args:
+            count: Number of entities
+            config: Settings for the screen and sprite sizes
+            seed: Seed for the placement, so runs draw the same scene
+        """
+        self.count = count
+        self.config = config
+        rng = np.random.default_rng(seed)
+        width, height = config.invader_width, config.invader_height
+        x = rng.integers(0, config.screen_width - width, count)
+        y = rng.integers(0, config.screen_height - height, count)
+        direction = rng.choice((-1, 1), count)
+
+        # Rectangles of every entity, for every frame of the loop
+        self.frames: list[list[pygame.Rect]] = []
+        for frame in range(SCENE_FRAMES):
+            # Move back and forth, so the loop has no jump
+            step = frame if frame < SCENE_FRAMES // 2 else SCENE_FRAMES - frame
+            frame_x = x + direction * step * _SPEED
+            self.frames.append(
+                [
+                    pygame.Rect(left, top, width, height)
+                    for left, top in zip(frame_x.tolist(), y.tolist())
+                ]
+            )
+
+        # Intact pixels of a shield per entity, eroded like a game in progress
+        shape = (config.shield_height, config.shield_width)
+        rows, cols = np.indices(shape)
+        self.shields: list[np.ndarray] = []
+        for _ in range(count):
+            intact = np.ones(shape, dtype=bool)
+            radius = config.shield_crater_radius
+            for row, col in zip(
+                rng.integers(0, shape[0], _CRATERS_PER_SHIELD),
+                rng.integers(0, shape[1], _CRATERS_PER_SHIELD),
+            ):
+                intact &= (rows - row) ** 2 + (cols - col) ** 2 > radius * radius
+            self.shields.append(intact)
+
+    def rects(self, frame: int) -> list[pygame.Rect]:
+        """Get the entities' rectangles in a frame."""
+        return self.frames[frame % SCENE_FRAMES]
+
+
+@dataclass(frozen=True)
+class Strategy:
+    """A way of drawing one kind of scene content."""
+
+    group: str
+    name: str
+    # Prepares to draw a scene on a surface and returns the frame drawer
+    setup: Callable[[pygame.Surface, Scene], DrawFrame]
+
+
+def _solid_sprite(scene: Scene) -> pygame.Surface:
+    """Prebuild an invader sprite in the display's pixel format."""
+    config = scene.config
+    sprite = pygame.Surface((config.invader_width, config.invader_height)).convert()
+    sprite.fill(config.invader_color)
+    return sprite
+
+
+# Sprites: one invader-sized rectangle per entity
+
+
+def draw_rects(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Draw every entity with pygame.draw.rect, as the game does without sprites."""
+    color = scene.config.invader_color
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        for rect in scene.rects(frame):
+            pygame.draw.rect(screen, color, rect)
+
+    return draw
+
+
+def blit_sprites(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Blit a prebuilt sprite once per entity, as the game does with its atlas."""
+    sprite = _solid_sprite(scene)
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        for rect in scene.rects(frame):
+            screen.blit(sprite, rect)
+
+    return draw
+
+
+def batch_blits(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Blit a prebuilt sprite for every entity with one Surface.blits call."""
+    sprite = _solid_sprite(scene)
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        screen.blits([(sprite, rect) for rect in scene.rects(frame)], doreturn=False)
+
+    return draw
+
+
+def batch_fblits(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Blit a prebuilt sprite for every entity with one Surface.fblits call."""
+    sprite = _solid_sprite(scene)
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        screen.fblits([(sprite, rect) for rect in scene.rects(frame)])
+
+    return draw
+
+
+# Shields: one eroded, translucent shield per entity
+
+
+def _shield_surface(scene: Scene, intact: np.ndarray, alpha: int) -> pygame.Surface:
+    """Build a shield surface with its eroded pixels transparent."""
+    surface = pygame.Surface(intact.shape[::-1], pygame.SRCALPHA)
+    surface.fill(scene.config.shield_color)
+    pygame.surfarray.pixels_alpha(surface)[:] = intact.T * alpha
+    return surface
+
+
+def build_shields(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Build every shield's SRCALPHA surface again in every frame."""
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        for rect, intact in zip(scene.rects(frame), scene.shields):
+            screen.blit(_shield_surface(scene, intact, 192), rect)
+
+    return draw
+
+
+def cached_shields(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Build each shield's surface once and blit it, as the game does."""
+    surfaces = [_shield_surface(scene, intact, 192) for intact in scene.shields]
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        for rect, surface in zip(scene.rects(frame), surfaces):
+            screen.blit(surface, rect)
+
+    return draw
+
+
+# Presenting: the display surface after drawing every entity
+
+
+def full_flip(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Clear and redraw the whole screen, then flip all of it, as the game does."""
+    sprite = _solid_sprite(scene)
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        screen.fblits([(sprite, rect) for rect in scene.rects(frame)])
+        pygame.display.flip()
+
+    return draw
+
+
+def dirty_rects(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Erase and redraw only where entities were and are, and update those."""
+    sprite = _solid_sprite(scene)
+    screen.fill(BLACK)
+
+    def draw(frame: int) -> None:
+        previous, current = scene.rects(frame - 1), scene.rects(frame)
+        for rect in previous:
+            screen.fill(BLACK, rect)
+        screen.fblits([(sprite, rect) for rect in current])
+        pygame.display.update(previous + current)
+
+    return draw
+
+
+# Text: one score-like label per entity
+
+
+def _labels(scene: Scene) -> list[str]:
+    """Get a distinct label per entity."""
+    return [f"SCORE: {index * 10}" for index in range(scene.count)]
+
+
+def render_text(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Render every label with font.render in every frame."""
+    config = scene.config
+    font = pygame.font.Font(None, config.score_text_font_point_size)
+    labels = _labels(scene)
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        for rect, label in zip(scene.rects(frame), labels):
+            screen.blit(font.render(label, True, config.text_color), rect)
+
+    return draw
+
+
+def cached_text(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Render every label once and blit it, as the game does for the score."""
+    config = scene.config
+    font = pygame.font.Font(None, config.score_text_font_point_size)
+    texts = [font.render(label, True, config.text_color) for label in _labels(scene)]
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        for rect, text in zip(scene.rects(frame), texts):
+            screen.blit(text, rect)
+
+    return draw
+
+
+# Particles: one particle per entity, moving with it
+
+
+def _particles(scene: Scene, frame: int) -> ParticleSystem:
+    """Get particles at the entities' positions in a frame."""
+    config = scene.config
+    particles = ParticleSystem(
+        max(scene.count, 1), config.screen_width, config.screen_height
+    )
+    storage = particles.storage
+    rects = scene.rects(frame)
+    storage["x"][: scene.count] = [rect.x for rect in rects]
+    storage["y"][: scene.count] = [rect.y for rect in rects]
+    storage["r"][: scene.count] = 255
+    storage.active[: scene.count] = True
+    return particles
+
+
+def fill_particles(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Fill a small rectangle per particle."""
+    frames = [_particles(scene, frame) for frame in range(SCENE_FRAMES)]
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        storage = frames[frame % SCENE_FRAMES].storage
+        live = np.flatnonzero(storage.active)
+        for x, y, r, g, b in zip(
+            *(storage[column][live].tolist() for column in ("x", "y", "r", "g", "b"))
+        ):
+            screen.fill((r, g, b), (x, y, PARTICLE_SIZE, PARTICLE_SIZE))
+
+    return draw
+
+
+def scatter_particles(screen: pygame.Surface, scene: Scene) -> DrawFrame:
+    """Write every particle into the pixel buffer at once, as the game does."""
+    frames = [_particles(scene, frame) for frame in range(SCENE_FRAMES)]
+
+    def draw(frame: int) -> None:
+        screen.fill(BLACK)
+        frames[frame % SCENE_FRAMES].draw(screen)
+
+    return draw
+
+
+STRATEGIES: tuple[Strategy, ...] = (
+    Strategy("sprites", "draw.rect", draw_rects),
+    Strategy("sprites", "blit", blit_sprites),
+    Strategy("sprites", "blits", batch_blits),
+    Strategy("sprites", "fblits", batch_fblits),
+    Strategy("shields", "SRCALPHA per frame", build_shields),
+    Strategy("shields", "cached surface", cached_shields),
+    Strategy("present", "flip", full_flip),
+    Strategy("present", "dirty rects", dirty_rects),
+    Strategy("text", "font.render", render_text),
+    Strategy("text", "cached text", cached_text),
+    Strategy("particles", "fill per particle", fill_particles),
+    Strategy("particles", "pixel buffer", scatter_particles),
+)
+
+GROUPS: tuple[str, ...] = tuple(dict.fromkeys(s.group for s in STRATEGIES))
@@ -1,12 +1,97 @@
 """Main entry point for PyGInvaders."""
 
+import argparse
+
+from pyginvaders.capture import CAPTURE_FORMATS, FrameRecorder
+from pyginvaders.config import DEFAULT_CONFIG
+from pyginvaders.event_log import EventLog
 from pyginvaders.game import Game
+from pyginvaders.metrics import GameMetrics, MetricsFileWriter, MetricsServer
+from pyginvaders.render_backend import RENDER_BACKENDS
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Run the game."""
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Play PyGInvaders")
+    parser.add_argument(
+        "--record", metavar="PATH", help="record the game to a file or directory"
+    )
+    parser.add_argument(
+        "--record-format",
+        choices=CAPTURE_FORMATS,
+        default="raw",
+        help="raw RGB stream or PNG sequence (default: raw)",
+    )
+    parser.add_argument(
+        "--low-latency",
+        action="store_true",
+        help="pace frames precisely, sample input late and report input lag",
+    )
+    parser.add_argument(
+        "--render-backend",
+        choices=RENDER_BACKENDS,
+        default=DEFAULT_CONFIG.render_backend,
+        help="draw with surfaces or with GPU textures (default: surface)",
+    )
+    parser.add_argument(
+        "--event-log",
+        metavar="PATH",
+        help="append gameplay events to a JSON lines file",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="rewrite a file with Prometheus metrics every few seconds",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="serve Prometheus metrics at http://127.0.0.1:PORT/metrics",
+    )
+    args = parser.parse_args(argv)
+
+    game = Game(DEFAULT_CONFIG.with_overrides(render_backend=args.render_backend))
+    if args.record:
+        game.recorder = FrameRecorder(
+            game.screen.get_size(), args.record, args.record_format
+        )
+    if args.event_log:
+        game.event_log = EventLog(args.event_log)
+    exporters: list[MetricsFileWriter | MetricsServer] = []
+    if args.metrics_file or args.metrics_port is not None:
+        game.metrics = GameMetrics()
+        if args.metrics_file:
+            exporters.append(MetricsFileWriter(game.metrics, args.metrics_file))
+        if args.metrics_port is not None:
+            exporters.append(MetricsServer(game.metrics, args.metrics_port))
+        for exporter in exporters:
+            exporter.start()
+    game.run(low_latency=args.low_latency)
+
+    for exporter in exporters:
+        exporter.stop()
+    if game.metrics is not None:
+        game.metrics.close()
+
+    report = game.latency_report()
+    if report is not None:
+        mean, p95, worst = report
+        print(
+            f"Input-to-present latency: mean {mean:.2f} ms, "
+            f"p95 {p95:.2f} ms, max {worst:.2f} ms"
+        )
+
+    if game.event_log is not None:
+        game.event_log.close()
+        print(f"Logged {game.event_log.events_written} events to {args.event_log}")
+
+    if game.recorder is not None:
+        game.recorder.close()
+        print(
+            f"Recorded {game.recorder.frames_written} frames "
+            f"({game.recorder.frames_dropped} dropped) to {args.record}"
+        )
 
 
 if __name__ == "__main__":
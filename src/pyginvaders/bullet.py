@@ -1,45 +1,191 @@
 """Bullet base class for managing projectiles."""
 
 from abc import ABC, abstractmethod
+from typing import Self
 
 import pygame
 
+from pyginvaders.config import DEFAULT_CONFIG, Config
+from pyginvaders.ecs import Archetype, World
 from pyginvaders.game_object import GameObject
 
+# Components stored for every bullet
+BULLET_COMPONENTS = ("position", "size", "velocity", "team", "color")
+
+# Size, speed and color of a type of bullet as (width, height, speed, color)
+BulletSettings = tuple[int, int, int, tuple[int, int, int]]
+
 
 class Bullet(GameObject, ABC):
-    """Abstract base class for bullets."""
+    """Abstract base class for bullets.
+
+    A bullet is a view onto one slot of an archetype, so a whole pool of
+    bullets can be moved, culled, collided and drawn by the ECS systems.
+    """
+
+    # Team component value, provided by subclasses
+    TEAM: int
+
+    def __init__(
+        self,
+        storage: Archetype | None = None,
+        index: int = 0,
+        config: Config = DEFAULT_CONFIG,
+    ) -> None:
+        """Initialize an inactive bullet.
 
-    def __init__(self) -> None:
-        """Initialize an inactive bullet."""
+        Args:
+            storage: Archetype holding the bullet's components; a private
+                single-slot archetype is created if omitted
+            index: Slot of the bullet within the archetype
+            config: Game settings
+        """
+        if storage is None:
+            storage = self.create_storage(1, config)
+        self.storage = storage
+        self.index = index
+        self.config = config
         super().__init__(0, 0)
         self.active = False
+        # Position at the start of the current tick, used for swept collisions
+        self.prev_y = 0
+
+    @classmethod
+    @abstractmethod
+    def get_settings(cls, config: Config) -> BulletSettings:
+        """Get the size, speed and color of bullets of this type.
+
+        Returns:
+            A tuple of (width, height, speed, color)
+        """
+        pass
+
+    @classmethod
+    def create_storage(
+        cls, capacity: int, config: Config = DEFAULT_CONFIG
+    ) -> Archetype:
+        """Create an archetype for bullets of this type.
+
+        Args:
+            capacity: Number of bullet slots
+            config: Game settings
+
+        Returns:
+            An archetype with every slot inactive
+        """
+        width, height, speed, color = cls.get_settings(config)
+        storage = Archetype(BULLET_COMPONENTS, capacity)
+        storage["width"][:] = width
+        storage["height"][:] = height
+        storage["vy"][:] = speed
+        storage["team"][:] = cls.TEAM
+        storage["r"][:], storage["g"][:], storage["b"][:] = color
+        return storage
+
+    @classmethod
+    def create_pool(
+        cls, world: World, name: str, capacity: int, config: Config = DEFAULT_CONFIG
+    ) -> list[Self]:
+        """Create a pool of bullets stored in a new archetype of the world.
+
+        Args:
+            world: World to register the archetype with
+            name: Name of the archetype
+            capacity: Number of bullets in the pool
+            config: Game settings
+
+        Returns:
+            Views onto every slot of the archetype
+        """
+        storage = world.add_archetype(name, cls.create_storage(capacity, config))
+        return [cls(storage, index, config) for index in range(capacity)]
+
+    @property
+    def x(self) -> int:
+        """X coordinate of the bullet."""
+        return int(self.storage["x"][self.index])
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self.storage["x"][self.index] = value
+
+    @property
+    def y(self) -> int:
+        """Y coordinate of the bullet."""
+        return int(self.storage["y"][self.index])
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self.storage["y"][self.index] = value
+
+    @property
+    def prev_y(self) -> int:
+        """Y coordinate of the bullet at the start of the current tick."""
+        return int(self.storage["prev_y"][self.index])
+
+    @prev_y.setter
+    def prev_y(self, value: int) -> None:
+        self.storage["prev_y"][self.index] = value
+
+    @property
+    def active(self) -> bool:
+        """Whether the bullet is in flight."""
+        return bool(self.storage.active[self.index])
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        self.storage.active[self.index] = value
 
     def activate(self, x: int, y: int) -> None:
         """Activate the bullet at the given position."""
         self.x = x
         self.y = y
+        self.prev_y = y
         self.active = True
+        self.storage.note_spawn(self.index)
 
     def deactivate(self) -> None:
         """Deactivate the bullet."""
         self.active = False
 
-    @abstractmethod
     def update(self) -> None:
-        """Update bullet position and state."""
-        pass
+        """Update bullet position and deactivate if off screen."""
+        if self.active:
+            self.prev_y = self.y
+            self.y += int(self.storage["vy"][self.index])
+            if self.is_off_screen():
+                self.deactivate()
 
     @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the bullet on the screen."""
+    def is_off_screen(self) -> bool:
+        """Check if the bullet has left the screen.
+
+        Returns:
+            True if the bullet has passed the edge it is heading towards
+        """
         pass
 
-    @abstractmethod
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the bullet on the screen if active."""
+        if self.active:
+            storage, index = self.storage, self.index
+            color = (
+                int(storage["r"][index]),
+                int(storage["g"][index]),
+                int(storage["b"][index]),
+            )
+            pygame.draw.rect(screen, color, self.get_rectangle())
+
     def get_rectangle(self) -> tuple[int, int, int, int]:
         """Get the bullet's bounding rectangle.
 
         Returns:
             A tuple of (x, y, width, height)
         """
-        pass
+        storage, index = self.storage, self.index
+        return (
+            self.x,
+            self.y,
+            int(storage["width"][index]),
+            int(storage["height"][index]),
+        )
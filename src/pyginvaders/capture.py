@@ -0,0 +1,131 @@
+"""Video capture of presented frames on a background writer thread.
+
+Each captured frame is copied into one of a fixed ring of preallocated
+buffers and handed to a writer thread, which saves it either as one raw RGB
+stream or as a sequence of PNG files. When every buffer is still waiting to
+be written, the frame is dropped and counted, so capture never holds up the
+game loop.
+
+A raw stream has no header; its frames are width x height x 3 bytes in row
+order. It can be encoded with, for example:
+
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x600 -r 60 -i capture.rgb out.mp4
+"""
+
+import queue
+import threading
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+import numpy as np
+import pygame
+
+CaptureFormat = Literal["raw", "png"]
+CAPTURE_FORMATS: tuple[CaptureFormat, ...] = ("raw", "png")
+
+
+class FrameRecorder:
+    """Copies frames into a ring of buffers and writes them on a thread."""
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        path: str | Path,
+        capture_format: CaptureFormat = "raw",
+        buffers: int = 8,
+    ) -> None:
+        """Allocate the buffers and start the writer thread.
+
+        Args:
+            size: Width and height of the frames
+            path: File for a raw stream, or directory for a PNG sequence
+            capture_format: "raw" or "png"
+            buffers: Number of frames that can wait to be written
+        """
+        if capture_format not in CAPTURE_FORMATS:
+            raise ValueError(
+                f"Unknown capture format {capture_format!r}; "
+                f"choose from {CAPTURE_FORMATS}"
+            )
+        self.size = size
+        self.path = Path(path)
+        self.capture_format = capture_format
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.error: BaseException | None = None
+
+        # Buffers are indexed like pygame.surfarray, as (x, y, channel)
+        width, height = size
+        self._buffers = [
+            np.empty((width, height, 3), dtype=np.uint8) for _ in range(buffers)
+        ]
+        self._free: queue.SimpleQueue[int] = queue.SimpleQueue()
+        for index in range(buffers):
+            self._free.put(index)
+        self._filled: queue.SimpleQueue[tuple[int, int] | None] = queue.SimpleQueue()
+
+        self._file: BinaryIO | None = None
+        if capture_format == "raw":
+            self._file = open(self.path, "wb")
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._thread.start()
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """Copy a frame for writing, unless every buffer is in use.
+
+        Args:
+            surface: The frame, with the recorder's size
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            self.frames_dropped += 1
+            return False
+
+        np.copyto(self._buffers[index], pygame.surfarray.pixels3d(surface))
+        self._filled.put((index, self.frames_captured))
+        self.frames_captured += 1
+        return True
+
+    def close(self) -> None:
+        """Write every queued frame, then stop the writer thread.
+
+        Raises:
+            RuntimeError: If writing a frame failed
+        """
+        self._filled.put(None)
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+        if self.error is not None:
+            raise RuntimeError("Writing captured frames failed") from self.error
+
+    def _run(self) -> None:
+        """Write frames until closed."""
+        while True:
+            item = self._filled.get()
+            if item is None:
+                return
+            index, frame_number = item
+            if self.error is None:
+                try:
+                    self._write(self._buffers[index], frame_number)
+                    self.frames_written += 1
+                except Exception as error:
+                    self.error = error  # Reported by close(); keep freeing buffers
+            self._free.put(index)
+
+    def _write(self, frame: np.ndarray, frame_number: int) -> None:
+        """Write one frame in the recorder's format."""
+        if self._file is not None:
+            # Raw streams are stored row by row
+            self._file.write(np.ascontiguousarray(frame.transpose(1, 0, 2)).data)
+        else:
+            path = self.path / f"frame_{frame_number:06d}.png"
+            pygame.image.save(pygame.surfarray.make_surface(frame), str(path))
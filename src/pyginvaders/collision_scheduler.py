@@ -0,0 +1,205 @@
+"""Collision scheduling from predicted impact ticks.
+
+Bullets move in straight vertical lines at constant speed, shields never move
+and the formation only moves when it marches. So the first tick at which a
+bullet could touch a target can be predicted, and the bullet needs no
+collision checks until then. The scheduler keeps those ticks in a priority
+queue and hands the game only the bullets that are due each tick.
+
+Predictions are conservative: targets only shrink between predictions
+(invaders die, shields erode), so a bullet is never due later than its first
+real collision. A due bullet that survives its checks is predicted again on
+the next tick. Predictions are also recomputed when:
+
+- a bullet is spawned into a slot, which the archetype's generation shows
+- the formation marches or loses an invader, for player bullets
+- the game is restored from a snapshot, for every bullet
+
+Player bullets are predicted against each column of the formation, from the
+bottom of its lowest invader upwards. Invader bullets are predicted against
+the shields and the whole player line rather than the player itself, so the
+player moving never invalidates a prediction.
+"""
+
+import heapq
+from collections.abc import Sequence
+
+import numpy as np
+
+from pyginvaders.ecs import Archetype
+from pyginvaders.formation import Formation
+from pyginvaders.player import Player
+from pyginvaders.shield import Shield
+
+# Stand-in for target edges that extend off the screen
+_FAR = 1 << 30
+
+# Archetypes the scheduler tracks, by their position in its tables
+_PLAYER_BULLETS = 0
+_INVADER_BULLETS = 1
+
+# Queue entries allowed per bullet slot before superseded ones are dropped
+_QUEUE_SLACK = 4
+
+
+class CollisionScheduler:
+    """Tracks when each bullet next needs collision checks."""
+
+    def __init__(self, player_bullets: Archetype, invader_bullets: Archetype) -> None:
+        """Initialize the scheduler with every bullet due for a prediction.
+
+        Args:
+            player_bullets: Archetype of the player's bullets
+            invader_bullets: Archetype of the invaders' bullets
+        """
+        self.tick = 0
+        self.archetypes = (player_bullets, invader_bullets)
+        # Entries of (tick, archetype, slot, generation); superseded entries
+        # are skipped when they come up
+        self._queue: list[tuple[int, int, int, int]] = []
+        # Tick each slot is due, or -1 if no collision is predicted
+        self._due = [np.full(a.capacity, -1, dtype=np.int64) for a in self.archetypes]
+        # Spawn totals seen, generations predicted for, and slots to predict
+        self._spawns = [a.spawns for a in self.archetypes]
+        self._generation = [a.generation.copy() for a in self.archetypes]
+        self._recheck: list[np.ndarray] = [np.empty(0, dtype=np.int64)] * 2
+        self._predict_all = [True, True]
+        self.bullets_checked = 0  # bullets handed out for checks, for profiling
+
+    def invalidate(self) -> None:
+        """Predict every bullet again, e.g. after restoring a snapshot."""
+        self._predict_all = [True, True]
+
+    def invalidate_player_bullets(self) -> None:
+        """Predict every player bullet again after the formation changed."""
+        self._predict_all[_PLAYER_BULLETS] = True
+
+    def due(
+        self, formation: Formation, shields: Sequence[Shield], player: Player
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Advance one tick and get the bullets to check for collisions.
+
+        Call once per tick, after the bullets have moved.
+
+        Args:
+            formation: The invader formation
+            shields: Shields still standing
+            player: The player's ship
+
+        Returns:
+            Slots of the player bullets and of the invader bullets that may
+            collide this tick, each in increasing order
+        """
+        self.tick += 1
+        for kind, archetype in enumerate(self.archetypes):
+            slots = self._stale_slots(kind, archetype)
+            if len(slots) == 0:
+                continue
+            if kind == _PLAYER_BULLETS:
+                targets = [
+                    (x, -_FAR, width, y + height + _FAR)
+                    for x, y, width, height in (
+                        invader.get_rectangle() for invader in formation.shooters()
+                    )
+                ]
+            else:
+                _, player_y, _, player_height = player.get_rectangle()
+                targets = [shield.get_rectangle() for shield in shields]
+                targets.append((-_FAR, player_y, 2 * _FAR, player_height))
+            self._predict(kind, archetype, slots, targets)
+
+        if len(self._queue) > _QUEUE_SLACK * sum(a.capacity for a in self.archetypes):
+            self._compact()
+
+        due: tuple[list[int], list[int]] = ([], [])
+        queue = self._queue
+        while queue and queue[0][0] <= self.tick:
+            tick, kind, slot, generation = heapq.heappop(queue)
+            archetype = self.archetypes[kind]
+            if (
+                self._due[kind][slot] == tick
+                and archetype.generation[slot] == generation
+                and archetype.active[slot]
+            ):
+                self._due[kind][slot] = -1
+                due[kind].append(slot)
+
+        player_slots = np.array(sorted(due[0]), dtype=np.int64)
+        invader_slots = np.array(sorted(due[1]), dtype=np.int64)
+        # Bullets that survive their checks are predicted again next tick
+        self._recheck = [player_slots, invader_slots]
+        self.bullets_checked += len(player_slots) + len(invader_slots)
+        return player_slots, invader_slots
+
+    def _compact(self) -> None:
+        """Drop superseded entries, which build up as predictions change."""
+        self._queue = [
+            entry
+            for entry in self._queue
+            if self._due[entry[1]][entry[2]] == entry[0]
+            and self.archetypes[entry[1]].generation[entry[2]] == entry[3]
+        ]
+        heapq.heapify(self._queue)
+
+    def _stale_slots(self, kind: int, archetype: Archetype) -> np.ndarray:
+        """Get the live slots of an archetype whose predictions are out of date."""
+        if self._predict_all[kind]:
+            self._predict_all[kind] = False
+            self._spawns[kind] = archetype.spawns
+            self._generation[kind][:] = archetype.generation
+            return np.flatnonzero(archetype.active)
+
+        slots = self._recheck[kind]
+        if archetype.spawns != self._spawns[kind]:
+            self._spawns[kind] = archetype.spawns
+            spawned = np.flatnonzero(archetype.generation != self._generation[kind])
+            self._generation[kind][spawned] = archetype.generation[spawned]
+            slots = np.union1d(slots, spawned)
+        return slots[archetype.active[slots]]
+
+    def _predict(
+        self,
+        kind: int,
+        archetype: Archetype,
+        slots: np.ndarray,
+        targets: Sequence[tuple[int, int, int, int]],
+    ) -> None:
+        """Queue the first tick each bullet may touch any of the targets.
+
+        A bullet at y moving vy per tick sweeps from y + (k - 1) * vy to
+        y + k * vy during the k-th tick from now, where k = 0 is the current
+        tick. Bounds are inclusive, so a prediction is never late.
+        """
+        due = self._due[kind]
+        if len(targets) == 0:
+            due[slots] = -1
+            return
+
+        # Bullets down the rows, targets across the columns
+        x = archetype["x"][slots].astype(np.int64)[:, None]
+        y = archetype["y"][slots].astype(np.int64)[:, None]
+        width = archetype["width"][slots].astype(np.int64)[:, None]
+        height = archetype["height"][slots].astype(np.int64)[:, None]
+        vy = archetype["vy"][slots].astype(np.int64)[:, None]
+        tx, ty, tw, th = np.asarray(targets, dtype=np.int64).T
+
+        speed = np.maximum(np.abs(vy), 1)
+        down = vy >= 0
+        # Ticks until the leading edge reaches the target, and until the
+        # trailing edge has left it
+        lead = np.where(down, ty - height - y, y - ty - th)
+        trail = np.where(down, ty + th - y, y + height - ty)
+        first = np.maximum(-(-lead // speed), 0)
+        last = trail // speed + 1
+
+        reachable = (x <= tx + tw) & (x + width >= tx) & (first <= last)
+        reachable |= vy == 0  # Stationary bullets are checked every tick
+        ticks = np.where(reachable, first, _FAR).min(axis=1)
+
+        hit = ticks < _FAR
+        due[slots] = np.where(hit, self.tick + ticks, -1)
+        generation = archetype.generation
+        for slot, tick in zip(slots[hit].tolist(), ticks[hit].tolist()):
+            heapq.heappush(
+                self._queue, (self.tick + tick, kind, slot, int(generation[slot]))
+            )
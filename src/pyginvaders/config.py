@@ -1,4 +1,12 @@
-"""Game configuration constants."""
+"""Game configuration constants.
+
+The module-level constants are the default settings. A Config object bundles
+all of them so that games with different settings can run side by side in one
+process; named profiles provide ready-made variations.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any
 
 import pygame
 
@@ -22,6 +30,15 @@ TEXT_COLOR = (255, 255, 255)  # White
 SCORE_TEXT_POSITION = (20, 20)
 SCORE_TEXT_FONT_POINT_SIZE = int(25 / PIXELS_PER_POINT)  # points
 GAME_OVER_TEXT_FONT_POINT_SIZE = int(50 / PIXELS_PER_POINT)  # points
+RENDER_BACKEND = "surface"  # "surface" or "texture"; see render_backend
+IDLE_WAIT_MS = 1000  # longest wait for input while nothing on screen changes
+SPRITES = True  # draw entities with the sprite atlas; see sprites
+PAUSE_ON_BLUR = False  # pause the game while its window does not have focus
+
+# Simulation settings
+WORKER_THREADS = 1  # threads sharing the per-tick systems on free-threaded builds
+ADAPTIVE_QUALITY = False  # lower visual quality when frames overrun their budget
+SCHEDULED_COLLISIONS = True  # check bullets only when a collision is predicted
 
 # Player settings
 PLAYER_WIDTH = 50
@@ -50,7 +67,7 @@ INVADER_SPACING_Y = 40
 INVADER_MOVE_DELAY = 30  # frames
 INVADER_DROP_DISTANCE = 20
 INVADER_SHOOT_DELAY = 60  # frames
-INVADER_SHOOT_CHANCE = 5  # percent chance per delay interval per live invader
+INVADER_SHOOT_CHANCE = 5  # percent chance per delay interval per bottom invader
 
 KILL_SCORE = 10  # Points per invader killed
 
@@ -71,3 +88,150 @@ SHIELD_SPACING_X = 150
 SHIELD_START_Y = 450
 SHIELD_INITIAL_HEALTH = 10  # Number of hits shield can take before being destroyed
 SHIELD_ALPHA_REDUCTION = 20  # Alpha reduction per hit (makes shields more visible)
+SHIELD_CRATER_RADIUS = 6  # Radius of the hole a hit carves out of a shield
+
+# Effect settings
+PARTICLE_CAPACITY = 20000  # most live particles; 0 turns particle effects off
+KILL_PARTICLES = 40  # particles in the burst when an invader is killed
+SHIELD_HIT_PARTICLES = 12  # particles in the burst when a shield is hit
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable set of game settings, defaulting to the constants above."""
+
+    # Screen settings
+    screen_width: int = SCREEN_WIDTH
+    screen_height: int = SCREEN_HEIGHT
+    fps: int = FPS
+    text_color: tuple[int, int, int] = TEXT_COLOR
+    score_text_position: tuple[int, int] = SCORE_TEXT_POSITION
+    score_text_font_point_size: int = SCORE_TEXT_FONT_POINT_SIZE
+    game_over_text_font_point_size: int = GAME_OVER_TEXT_FONT_POINT_SIZE
+    render_backend: str = RENDER_BACKEND
+    idle_wait_ms: int = IDLE_WAIT_MS
+    sprites: bool = SPRITES
+    pause_on_blur: bool = PAUSE_ON_BLUR
+
+    # Simulation settings
+    worker_threads: int = WORKER_THREADS
+    adaptive_quality: bool = ADAPTIVE_QUALITY
+    scheduled_collisions: bool = SCHEDULED_COLLISIONS
+
+    # Player settings
+    player_width: int = PLAYER_WIDTH
+    player_height: int = PLAYER_HEIGHT
+    player_speed: int = PLAYER_SPEED
+    player_color: tuple[int, int, int] = PLAYER_COLOR
+
+    # Player bullet settings
+    player_bullet_width: int = PLAYER_BULLET_WIDTH
+    player_bullet_height: int = PLAYER_BULLET_HEIGHT
+    player_bullet_speed: int = PLAYER_BULLET_SPEED
+    player_bullet_color: tuple[int, int, int] = PLAYER_BULLET_COLOR
+    player_bullet_pool_size: int = PLAYER_BULLET_POOL_SIZE
+
+    # Invader settings
+    invader_width: int = INVADER_WIDTH
+    invader_height: int = INVADER_HEIGHT
+    invader_speed_x: int = INVADER_SPEED_X
+    invader_color: tuple[int, int, int] = INVADER_COLOR
+    invader_rows: int = INVADER_ROWS
+    invader_cols: int = INVADER_COLS
+    invader_start_x: int = INVADER_START_X
+    invader_start_y: int = INVADER_START_Y
+    invader_spacing_x: int = INVADER_SPACING_X
+    invader_spacing_y: int = INVADER_SPACING_Y
+    invader_move_delay: int = INVADER_MOVE_DELAY
+    invader_drop_distance: int = INVADER_DROP_DISTANCE
+    invader_shoot_delay: int = INVADER_SHOOT_DELAY
+    invader_shoot_chance: int = INVADER_SHOOT_CHANCE
+
+    kill_score: int = KILL_SCORE
+
+    # Invader bullet settings
+    invader_bullet_width: int = INVADER_BULLET_WIDTH
+    invader_bullet_height: int = INVADER_BULLET_HEIGHT
+    invader_bullet_speed: int = INVADER_BULLET_SPEED
+    invader_bullet_color: tuple[int, int, int] = INVADER_BULLET_COLOR
+    invader_bullet_pool_size: int = INVADER_BULLET_POOL_SIZE
+
+    # Shield settings
+    shield_width: int = SHIELD_WIDTH
+    shield_height: int = SHIELD_HEIGHT
+    shield_color: tuple[int, int, int] = SHIELD_COLOR
+    shield_start_count: int = SHIELD_START_COUNT
+    shield_start_x: int = SHIELD_START_X
+    shield_spacing_x: int = SHIELD_SPACING_X
+    shield_start_y: int = SHIELD_START_Y
+    shield_initial_health: int = SHIELD_INITIAL_HEALTH
+    shield_alpha_reduction: int = SHIELD_ALPHA_REDUCTION
+    shield_crater_radius: int = SHIELD_CRATER_RADIUS
+
+    # Effect settings
+    particle_capacity: int = PARTICLE_CAPACITY
+    kill_particles: int = KILL_PARTICLES
+    shield_hit_particles: int = SHIELD_HIT_PARTICLES
+
+    def with_overrides(self, **overrides: Any) -> "Config":
+        """Get a copy with some settings changed.
+
+        Args:
+            **overrides: New values keyed by setting name
+
+        Returns:
+            The new configuration
+
+        Raises:
+            TypeError: If a setting name is unknown
+        """
+        return replace(self, **overrides)
+
+
+DEFAULT_CONFIG = Config()
+
+# Named variations of the default settings
+PROFILES: dict[str, Config] = {
+    "default": DEFAULT_CONFIG,
+    # Half the tick rate with every per-tick speed and delay rescaled, for
+    # cheaper headless simulation of the same game
+    "coarse": DEFAULT_CONFIG.with_overrides(
+        fps=FPS // 2,
+        player_speed=PLAYER_SPEED * 2,
+        player_bullet_speed=PLAYER_BULLET_SPEED * 2,
+        invader_bullet_speed=INVADER_BULLET_SPEED * 2,
+        invader_move_delay=INVADER_MOVE_DELAY // 2,
+        invader_shoot_delay=INVADER_SHOOT_DELAY // 2,
+    ),
+    # A wider screen with a bigger formation and more shields
+    "large": DEFAULT_CONFIG.with_overrides(
+        screen_width=1280,
+        screen_height=720,
+        invader_rows=6,
+        invader_cols=16,
+        shield_start_count=6,
+        shield_start_y=570,
+        player_bullet_pool_size=30,
+        invader_bullet_pool_size=30,
+    ),
+}
+
+
+def get_profile(name: str, **overrides: Any) -> Config:
+    """Get a named configuration profile, optionally with some settings changed.
+
+    Args:
+        name: Name of a profile in PROFILES
+        **overrides: New values keyed by setting name
+
+    Returns:
+        The configuration
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown config profile {name!r}; choose from {list(PROFILES)}"
+        )
+    return PROFILES[name].with_overrides(**overrides)
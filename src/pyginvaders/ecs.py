@@ -0,0 +1,358 @@
+"""Entity-component-system storage with columnar component arrays.
+
+Entities that share the same set of components live in one archetype, which
+stores every component field as a fixed-capacity NumPy column. Systems operate
+on whole columns at once, so adding more entities or more entity types does not
+add another Python loop to every frame.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+
+import numpy as np
+import pygame
+
+# Component name -> the column names that store it
+COMPONENTS: dict[str, tuple[str, ...]] = {
+    # prev_y is the vertical position at the start of the tick (swept collisions)
+    "position": ("x", "y", "prev_y"),
+    "size": ("width", "height"),
+    "velocity": ("vx", "vy"),
+    "health": ("health",),
+    "team": ("team",),
+    "color": ("r", "g", "b"),
+    "lifetime": ("ttl",),  # ticks left before the entity despawns
+}
+
+# Team component values
+TEAM_PLAYER = 0
+TEAM_INVADERS = 1
+
+
+class Archetype:
+    """Fixed-capacity columnar storage for entities with the same components."""
+
+    def __init__(
+        self,
+        components: Sequence[str],
+        capacity: int,
+        dtype: type[np.generic] = np.int32,
+    ) -> None:
+        """Initialize storage with every slot inactive.
+
+        Args:
+            components: Names of the components every entity has
+            capacity: Maximum number of live entities
+            dtype: NumPy type used for every column
+        """
+        self.components = frozenset(components)
+        self.capacity = capacity
+        self.active = np.zeros(capacity, dtype=bool)
+        # Times each slot has been spawned into, so a new entity in a reused
+        # slot can be told apart from the one before it
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.spawns = 0  # total spawns, to notice new entities cheaply
+        self.columns: dict[str, np.ndarray] = {
+            column: np.zeros(capacity, dtype=dtype)
+            for component in components
+            for column in COMPONENTS[component]
+        }
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Get the array holding one column of every slot."""
+        return self.columns[column]
+
+    def copy(self) -> "Archetype":
+        """Get an independent copy of the storage.
+
+        Returns:
+            An archetype with copies of every column
+        """
+        clone = Archetype.__new__(Archetype)
+        clone.components = self.components
+        clone.capacity = self.capacity
+        clone.active = self.active.copy()
+        clone.generation = self.generation.copy()
+        clone.spawns = self.spawns
+        clone.columns = {name: array.copy() for name, array in self.columns.items()}
+        return clone
+
+    def has(self, *components: str) -> bool:
+        """Check if the archetype has all of the given components.
+
+        Returns:
+            True if every component is stored, False otherwise
+        """
+        return self.components.issuperset(components)
+
+    def spawn(self, **values: int | float) -> int:
+        """Activate the first free slot with the given column values.
+
+        Returns:
+            Index of the new entity, or -1 if the archetype is full
+        """
+        free = np.flatnonzero(~self.active)
+        if len(free) == 0:
+            return -1
+
+        index = int(free[0])
+        for column, value in values.items():
+            self.columns[column][index] = value
+        self.active[index] = True
+        self.note_spawn(index)
+        return index
+
+    def note_spawn(self, index: int) -> None:
+        """Count a spawn into a slot, e.g. one activated through a view."""
+        self.generation[index] += 1
+        self.spawns += 1
+
+    def despawn(self, index: int) -> None:
+        """Deactivate the entity in the given slot."""
+        self.active[index] = False
+
+    def count(self) -> int:
+        """Get the number of live entities.
+
+        Returns:
+            The number of active slots
+        """
+        return int(np.count_nonzero(self.active))
+
+
+class World:
+    """Collection of named archetypes that systems run over."""
+
+    def __init__(self) -> None:
+        """Initialize an empty world."""
+        self.archetypes: dict[str, Archetype] = {}
+
+    def add_archetype(self, name: str, archetype: Archetype) -> Archetype:
+        """Register an archetype under a name.
+
+        Returns:
+            The registered archetype
+        """
+        self.archetypes[name] = archetype
+        return archetype
+
+    def __getitem__(self, name: str) -> Archetype:
+        """Get an archetype by name."""
+        return self.archetypes[name]
+
+    def copy(self) -> "World":
+        """Get an independent copy of the world.
+
+        Returns:
+            A world with copies of every archetype
+        """
+        clone = World()
+        for name, archetype in self.archetypes.items():
+            clone.add_archetype(name, archetype.copy())
+        return clone
+
+    def query(self, *components: str) -> list[Archetype]:
+        """Get every archetype that has all of the given components.
+
+        Returns:
+            The matching archetypes in registration order
+        """
+        return [
+            archetype
+            for archetype in self.archetypes.values()
+            if archetype.has(*components)
+        ]
+
+
+def movement_system(world: World, start: int = 0, stop: int | None = None) -> None:
+    """Move every live entity by its velocity.
+
+    Args:
+        world: The world to update
+        start: First slot of each archetype to update
+        stop: Slot to stop before (default: the end of each archetype)
+    """
+    for archetype in world.query("position", "velocity"):
+        slots = slice(start, stop)
+        active = archetype.active[slots]
+        archetype["prev_y"][slots][active] = archetype["y"][slots][active]
+        archetype["x"][slots][active] += archetype["vx"][slots][active]
+        archetype["y"][slots][active] += archetype["vy"][slots][active]
+
+
+def lifetime_system(
+    world: World, width: int, height: int, start: int = 0, stop: int | None = None
+) -> None:
+    """Despawn entities that have expired or left the screen.
+
+    An entity leaves the screen once its position passes the edge it is
+    heading towards.
+
+    Args:
+        world: The world to update
+        width: Screen width in pixels
+        height: Screen height in pixels
+        start: First slot of each archetype to update
+        stop: Slot to stop before (default: the end of each archetype)
+    """
+    slots = slice(start, stop)
+    for archetype in world.query("lifetime"):
+        ttl = archetype["ttl"][slots]
+        active = archetype.active[slots]
+        ttl[active] -= 1
+        active &= ttl > 0
+
+    for archetype in world.query("position", "velocity"):
+        x, y = archetype["x"][slots], archetype["y"][slots]
+        vx, vy = archetype["vx"][slots], archetype["vy"][slots]
+        off_screen = (
+            ((x < 0) & (vx < 0))
+            | ((x > width) & (vx > 0))
+            | ((y < 0) & (vy < 0))
+            | ((y > height) & (vy > 0))
+        )
+        archetype.active[slots] &= ~off_screen
+
+
+def sweep_rect_collision(
+    rect1: tuple[int, int, int, int], dy: int, rect2: tuple[int, int, int, int]
+) -> float | None:
+    """Find when a vertically moving rectangle first overlaps a stationary one.
+
+    The moving rectangle travels from rect1 to rect1 shifted by dy, so a fast
+    object cannot tunnel through a thin target between two ticks. This is the
+    scalar reference that collision_system computes for whole arrays at once.
+
+    Args:
+        rect1: Moving rectangle at the start of the move as (x, y, width, height)
+        dy: Vertical distance moved during the tick
+        rect2: Stationary rectangle as (x, y, width, height)
+
+    Returns:
+        Time of impact as a fraction of the move in [0, 1), or None if the
+        rectangles never overlap during the move
+    """
+    x1, y1, w1, h1 = rect1
+    x2, y2, w2, h2 = rect2
+    if not (x1 < x2 + w2 and x1 + w1 > x2):
+        return None
+    if dy == 0:
+        return 0.0 if y1 < y2 + h2 and y1 + h1 > y2 else None
+
+    # Overlap holds while y2 - h1 < y1 + t * dy < y2 + h2
+    t_enter = (y2 - h1 - y1) / dy
+    t_exit = (y2 + h2 - y1) / dy
+    if dy < 0:
+        t_enter, t_exit = t_exit, t_enter
+    if t_enter >= 1 or t_exit <= 0:
+        return None
+    return max(0.0, t_enter)
+
+
+def collision_system(
+    archetype: Archetype,
+    targets: Sequence[tuple[int, int, int, int]],
+    start: int = 0,
+    stop: int | None = None,
+    slots: np.ndarray | None = None,
+) -> list[tuple[float, int, int]]:
+    """Find swept collisions between live entities and stationary rectangles.
+
+    Each entity is swept vertically from prev_y to y, matching
+    sweep_rect_collision for every entity/target pair at once.
+
+    Args:
+        archetype: Moving entities with position and size components
+        targets: Stationary rectangles as (x, y, width, height)
+        start: First slot of the archetype to check
+        stop: Slot to stop before (default: the end of the archetype)
+        slots: Check only these slots, in increasing order, instead of a range
+
+    Returns:
+        (time of impact, entity index, target index) for every colliding pair,
+        ordered by time of impact, then entity index, then target index
+    """
+    if slots is None:
+        movers = np.flatnonzero(archetype.active[start:stop]) + start
+    else:
+        movers = slots[archetype.active[slots]]
+    if len(movers) == 0 or len(targets) == 0:
+        return []
+
+    # Entities down the rows, targets across the columns
+    x1 = archetype["x"][movers][:, None]
+    y1 = archetype["prev_y"][movers][:, None]
+    w1 = archetype["width"][movers][:, None]
+    h1 = archetype["height"][movers][:, None]
+    dy = (archetype["y"][movers] - archetype["prev_y"][movers])[:, None]
+    x2, y2, w2, h2 = np.asarray(targets).T
+
+    # Overlap holds while y2 - h1 < y1 + t * dy < y2 + h2
+    moving = dy != 0
+    safe_dy = np.where(moving, dy, 1)
+    t_a = (y2 - h1 - y1) / safe_dy
+    t_b = (y2 + h2 - y1) / safe_dy
+    t_enter = np.where(moving, np.minimum(t_a, t_b), 0.0)
+    t_exit = np.where(moving, np.maximum(t_a, t_b), 1.0)
+    overlap_y = np.where(
+        moving, (t_enter < 1) & (t_exit > 0), (y1 < y2 + h2) & (y1 + h1 > y2)
+    )
+    hit = (x1 < x2 + w2) & (x1 + w1 > x2) & overlap_y
+
+    rows, cols = np.nonzero(hit)
+    toi = np.maximum(t_enter[rows, cols], 0.0)
+    order = np.argsort(toi, kind="stable")
+    return [(float(toi[i]), int(movers[rows[i]]), int(cols[i])) for i in order.tolist()]
+
+
+def visible_entities(
+    world: World,
+) -> Iterator[tuple[str, list[int], list[int]]]:
+    """Get the archetype, color and rectangle of every drawable live entity.
+
+    Yields:
+        The name of the entity's archetype, its color as [r, g, b] and its
+        rectangle as [x, y, width, height]
+    """
+    for name, archetype in world.archetypes.items():
+        if not archetype.has("position", "size", "color"):
+            continue
+        indices = np.flatnonzero(archetype.active)
+        if len(indices) == 0:
+            continue
+
+        rects = np.stack(
+            [
+                archetype["x"][indices],
+                archetype["y"][indices],
+                archetype["width"][indices],
+                archetype["height"][indices],
+            ],
+            axis=1,
+        ).tolist()
+        colors = np.stack(
+            [archetype["r"][indices], archetype["g"][indices], archetype["b"][indices]],
+            axis=1,
+        ).tolist()
+        for color, rect in zip(colors, rects):
+            yield name, color, rect
+
+
+def render_system(
+    world: World,
+    screen: pygame.Surface,
+    sprite_for: Callable[[str, list[int]], pygame.Surface | None] | None = None,
+) -> None:
+    """Draw every live entity, as a filled rectangle in its color.
+
+    Args:
+        world: The entities
+        screen: Surface to draw on
+        sprite_for: Called with an entity's archetype name and rectangle to
+            get a sprite to blit instead of its rectangle, or None
+    """
+    for name, color, rect in visible_entities(world):
+        sprite = sprite_for(name, rect) if sprite_for is not None else None
+        if sprite is None:
+            pygame.draw.rect(screen, color, rect)
+        else:
+            screen.blit(sprite, (rect[0], rect[1]))
@@ -0,0 +1,127 @@
+"""Structured log of gameplay events, written on a background thread.
+
+Each event is one JSON object per line, with the simulation tick, the event
+type and the event's own fields:
+
+    {"tick": 412, "type": "kill", "row": 4, "col": 7, "x": 505, "y": 210, ...}
+
+Logging an event only puts it on an in-memory queue. A writer thread takes
+events off the queue in batches and writes each batch with one call, so the
+frame thread never waits for a disk. Events are rare compared to frames, so
+the queue is unbounded and no event is dropped.
+
+Event types:
+
+- kill: a player bullet killed an invader (row, col, x, y, score)
+- shield_hit: an invader bullet eroded a shield (shield, x, y, health)
+- shield_destroyed: a shield lost its last health (shield)
+- player_death: the game was lost (cause "shot" or "invaded", score)
+- win: the last invader was killed (score)
+- restart: the game was reset (score of the game that ended)
+"""
+
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Any, TextIO
+
+EventType = str
+Event = dict[str, Any]
+
+EVENT_TYPES: tuple[EventType, ...] = (
+    "kill",
+    "shield_hit",
+    "shield_destroyed",
+    "player_death",
+    "win",
+    "restart",
+)
+
+
+class EventLog:
+    """Queues gameplay events and writes them as JSON lines on a thread."""
+
+    def __init__(self, path: str | Path, batch_size: int = 256) -> None:
+        """Open the log file and start the writer thread.
+
+        Args:
+            path: File to write; an existing file is appended to, so one log
+                can span several sessions
+            batch_size: Most events written with one call
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.events_logged = 0
+        self.events_written = 0
+        self.batches_written = 0
+        self.error: BaseException | None = None
+
+        self._queue: queue.SimpleQueue[Event | None] = queue.SimpleQueue()
+        self._file: TextIO = open(self.path, "a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self._thread.start()
+
+    def log(self, tick: int, event_type: EventType, **fields: Any) -> None:
+        """Queue an event for writing.
+
+        Args:
+            tick: Simulation tick the event happened on
+            event_type: One of EVENT_TYPES
+            **fields: The event's own fields, which must be JSON-serializable
+        """
+        self._queue.put({"tick": tick, "type": event_type, **fields})
+        self.events_logged += 1
+
+    def close(self) -> None:
+        """Write every queued event, then stop the writer thread.
+
+        Raises:
+            RuntimeError: If writing events failed
+        """
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self.error is not None:
+            raise RuntimeError("Writing the event log failed") from self.error
+
+    def _run(self) -> None:
+        """Write batches of events until closed."""
+        closed = False
+        while not closed:
+            # Wait for one event, then take whatever else is already queued
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            closed = batch[-1] is None
+            events = [event for event in batch if event is not None]
+            if events and self.error is None:
+                try:
+                    self._write(events)
+                except Exception as error:
+                    self.error = error  # Reported by close(); keep draining
+
+    def _write(self, events: list[Event]) -> None:
+        """Write a batch of events with one call."""
+        self._file.write(
+            "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        )
+        self._file.flush()
+        self.events_written += len(events)
+        self.batches_written += 1
+
+
+def read_events(path: str | Path) -> list[Event]:
+    """Read a log written by EventLog.
+
+    Args:
+        path: The log file
+
+    Returns:
+        The events in the order they were logged
+    """
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
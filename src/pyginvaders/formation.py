@@ -0,0 +1,147 @@
+"""Formation module for tracking the extent of the invader grid."""
+
+from pyginvaders.config import DEFAULT_CONFIG, Config
+from pyginvaders.invader import Invader
+
+
+class Formation:
+    """Tracks which invaders of the grid are still alive.
+
+    The leftmost and rightmost alive columns, the bottom-most alive row and the
+    lowest alive invader of each column are maintained as invaders are killed,
+    so the formation's bounding box and its shooters are available without
+    scanning every invader.
+    """
+
+    def __init__(self, rows: int, cols: int, config: Config = DEFAULT_CONFIG) -> None:
+        """Initialize an empty formation.
+
+        Args:
+            rows: Number of invader rows
+            cols: Number of invader columns
+            config: Game settings
+        """
+        self.config = config
+        self.grid: list[list[Invader | None]] = [[None] * cols for _ in range(rows)]
+        self.row_counts = [0] * rows  # alive invaders per row
+        self.col_counts = [0] * cols  # alive invaders per column
+        # Lowest alive invader per column
+        self.lowest: list[Invader | None] = [None] * cols
+        self.left_col = cols
+        self.right_col = -1
+        self.bottom_row = -1
+        self.alive = 0
+
+        # Displacement of the whole grid from its starting position
+        self.offset_x = 0
+        self.offset_y = 0
+
+    def add(self, invader: Invader) -> None:
+        """Place an invader in the grid at its row and column.
+
+        Args:
+            invader: The invader to add
+        """
+        row, col = invader.row, invader.col
+        self.grid[row][col] = invader
+        self.row_counts[row] += 1
+        self.col_counts[col] += 1
+        lowest = self.lowest[col]
+        if lowest is None or row > lowest.row:
+            self.lowest[col] = invader
+        self.left_col = min(self.left_col, col)
+        self.right_col = max(self.right_col, col)
+        self.bottom_row = max(self.bottom_row, row)
+        self.alive += 1
+
+    def remove(self, invader: Invader) -> None:
+        """Record that an invader has been killed.
+
+        Args:
+            invader: The invader that was removed from the grid
+        """
+        row, col = invader.row, invader.col
+        if self.grid[row][col] is not invader:
+            return  # Not part of this formation
+
+        self.grid[row][col] = None
+        self.col_counts[col] -= 1
+        self.row_counts[row] -= 1
+        self.alive -= 1
+
+        # The next invader up the column becomes its shooter
+        if self.lowest[col] is invader:
+            self.lowest[col] = None
+            for above in range(row - 1, -1, -1):
+                if self.grid[above][col] is not None:
+                    self.lowest[col] = self.grid[above][col]
+                    break
+
+        if self.alive == 0:
+            return
+
+        # Shrink the bounds past any emptied columns and rows
+        while self.col_counts[self.left_col] == 0:
+            self.left_col += 1
+        while self.col_counts[self.right_col] == 0:
+            self.right_col -= 1
+        while self.row_counts[self.bottom_row] == 0:
+            self.bottom_row -= 1
+
+    def shooters(self) -> list[Invader]:
+        """Get the lowest alive invader of each column.
+
+        Returns:
+            The invaders with a clear line of fire, from left to right
+        """
+        return [invader for invader in self.lowest if invader is not None]
+
+    def is_empty(self) -> bool:
+        """Check if every invader in the formation has been killed.
+
+        Returns:
+            True if no invaders are alive, False otherwise
+        """
+        return self.alive == 0
+
+    def move(self, dx: int, dy: int) -> None:
+        """Record that the whole grid has moved.
+
+        Args:
+            dx: Horizontal distance moved
+            dy: Vertical distance moved
+        """
+        self.offset_x += dx
+        self.offset_y += dy
+
+    @property
+    def left(self) -> int:
+        """X coordinate of the left edge of the leftmost alive column."""
+        config = self.config
+        return (
+            config.invader_start_x
+            + self.left_col * config.invader_spacing_x
+            + self.offset_x
+        )
+
+    @property
+    def right(self) -> int:
+        """X coordinate of the right edge of the rightmost alive column."""
+        config = self.config
+        return (
+            config.invader_start_x
+            + self.right_col * config.invader_spacing_x
+            + config.invader_width
+            + self.offset_x
+        )
+
+    @property
+    def bottom(self) -> int:
+        """Y coordinate of the bottom edge of the bottom-most alive row."""
+        config = self.config
+        return (
+            config.invader_start_y
+            + self.bottom_row * config.invader_spacing_y
+            + config.invader_height
+            + self.offset_y
+        )
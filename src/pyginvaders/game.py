@@ -1,47 +1,72 @@
 """Game module containing the main game loop."""
 
+import asyncio
 import random
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
 
+import numpy as np
 import pygame
 
-from pyginvaders.config import (
-    FPS,
-    GAME_OVER_TEXT_FONT_POINT_SIZE,
-    INVADER_BULLET_POOL_SIZE,
-    INVADER_BULLET_WIDTH,
-    INVADER_COLS,
-    INVADER_DROP_DISTANCE,
-    INVADER_HEIGHT,
-    INVADER_MOVE_DELAY,
-    INVADER_ROWS,
-    INVADER_SHOOT_CHANCE,
-    INVADER_SHOOT_DELAY,
-    INVADER_SPACING_X,
-    INVADER_SPACING_Y,
-    INVADER_SPEED_X,
-    INVADER_START_X,
-    INVADER_START_Y,
-    INVADER_WIDTH,
-    KILL_SCORE,
-    PLAYER_BULLET_HEIGHT,
-    PLAYER_BULLET_POOL_SIZE,
-    PLAYER_BULLET_WIDTH,
-    PLAYER_WIDTH,
-    SCORE_TEXT_FONT_POINT_SIZE,
-    SCORE_TEXT_POSITION,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-    SHIELD_SPACING_X,
-    SHIELD_START_COUNT,
-    SHIELD_START_X,
-    SHIELD_START_Y,
-    TEXT_COLOR,
+from pyginvaders.capture import FrameRecorder
+from pyginvaders.collision_scheduler import CollisionScheduler
+from pyginvaders.config import DEFAULT_CONFIG, Config
+from pyginvaders.ecs import (
+    Archetype,
+    World,
+    collision_system,
+    lifetime_system,
+    movement_system,
 )
+from pyginvaders.event_log import EventLog
+from pyginvaders.formation import Formation
+from pyginvaders.governor import FULL_QUALITY, FrameGovernor, Quality
 from pyginvaders.invader import Invader
 from pyginvaders.invader_bullet import InvaderBullet
+from pyginvaders.metrics import GameMetrics
+from pyginvaders.particles import ParticleSystem
+from pyginvaders.parallel import SystemPool, get_system_pool, is_free_threaded
 from pyginvaders.player import Player
 from pyginvaders.player_bullet import PlayerBullet
+from pyginvaders.render_backend import RenderBackend, SurfaceBackend, create_backend
+from pyginvaders.render_thread import RenderState, RenderThread
 from pyginvaders.shield import Shield
+from pyginvaders.snapshot import restore_snapshot, take_snapshot
+from pyginvaders.sprites import SpriteAtlas
+
+# Invader shooting rolls are drawn as fixed-width slices of one random integer
+_SHOOT_ROLL_BITS = 16
+_SHOOT_ROLL_MASK = (1 << _SHOOT_ROLL_BITS) - 1
+
+# Window events that hide or show the game
+_WINDOW_HIDDEN_EVENTS = (pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED)
+_WINDOW_SHOWN_EVENTS = (
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWMAXIMIZED,
+)
+
+# Event types the game handles; the low-latency loop blocks all others
+_INPUT_EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWFOCUSLOST,
+    *_WINDOW_HIDDEN_EVENTS,
+    *_WINDOW_SHOWN_EVENTS,
+)
+
+# Input-to-present latencies kept for reporting
+_LATENCY_SAMPLES = 600
+
+# The async loop sleeps until this long before a frame is due, then yields in a
+# tight loop, since event loop timers are only accurate to about a millisecond
+_ASYNC_SPIN_SECONDS = 0.002
+# How often the async loop polls for input while the game is idle
+_ASYNC_IDLE_SECONDS = 0.05
 
 
 def check_rect_collision(
@@ -64,73 +89,201 @@ def check_rect_collision(
 class Game:
     """Main game class that manages the game state and loop."""
 
-    def __init__(self) -> None:
-        """Initialize the game."""
+    def __init__(
+        self,
+        config: Config = DEFAULT_CONFIG,
+        headless: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the game.
+
+        Args:
+            config: Game settings
+            headless: Draw to an offscreen surface instead of opening the
+                display, so several games can run side by side in one process;
+                headless games always use the surface backend, draw
+                entities as rectangles and have no particle effects
+            seed: Seed for the game's random generator, which decides when
+                invaders shoot
+        """
+        self.config = config
+        self.headless = headless
+        # The game's own random stream, so games in one process and their
+        # snapshots never disturb each other
+        self.random = random.Random(seed)
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("PygInvaders")
+        self.backend: RenderBackend
+        if headless:
+            size = (config.screen_width, config.screen_height)
+            self.backend = SurfaceBackend(pygame.Surface(size), flip=False)
+        else:
+            self.backend = create_backend(config.render_backend, config)
+            if config.sprites:
+                # Loaded once the display is open, to convert to its format
+                self.backend.sprites = SpriteAtlas(config=config)
         self.clock = pygame.time.Clock()
         self.running = False
+        # Whether the window can be seen and takes input; the game idles while
+        # it is hidden, and pauses without focus if pause_on_blur is set
+        self.window_shown = True
+        self.window_focused = True
+        # Records every presented frame when set
+        self.recorder: FrameRecorder | None = None
+        # Collects telemetry when set
+        self.metrics: GameMetrics | None = None
+        # Logs gameplay events when set
+        self.event_log: EventLog | None = None
+
+        # Frame counter and the time each phase of the last frame took
+        self.frame = 0
+        self.phase_ms = {"step": 0.0, "draw": 0.0, "present": 0.0}
+        # Time from sampling input to presenting the frame, in the low-latency loop
+        self.input_latency_ms: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+        # Optional visual costs, lowered by the governor when frames overrun
+        self.quality: Quality = FULL_QUALITY
+        self.governor: FrameGovernor | None = None
+        if config.adaptive_quality:
+            self.governor = FrameGovernor(1000 / config.fps)
+        self._score_text: tuple[int, pygame.Surface] | None = None
+
+        # Explosions and hit effects, which only ever affect what is drawn
+        self.particles: ParticleSystem | None = None
+        if config.particle_capacity > 0 and not headless:
+            self.particles = ParticleSystem(
+                config.particle_capacity, config.screen_width, config.screen_height
+            )
+        # Set while replaying ticks that were already shown, e.g. in a rollback,
+        # so their effects are not spawned or advanced a second time
+        self.resimulating = False
+
+        # Share the per-tick systems across threads where that uses more cores
+        self.systems: SystemPool | None = None
+        if config.worker_threads > 1 and is_free_threaded():
+            self.systems = get_system_pool(config.worker_threads)
 
         # Initialize fonts (only needed once)
-        self.font = pygame.font.Font(None, SCORE_TEXT_FONT_POINT_SIZE)
-        self.game_over_font = pygame.font.Font(None, GAME_OVER_TEXT_FONT_POINT_SIZE)
+        self.font = pygame.font.Font(None, config.score_text_font_point_size)
+        self.game_over_font = pygame.font.Font(
+            None, config.game_over_text_font_point_size
+        )
 
         # Initialize game state
         self.reset_game()
 
+    @property
+    def screen(self) -> pygame.Surface:
+        """The last drawn frame (read back from the GPU by the texture backend)."""
+        return self.backend.read_frame()
+
     def reset_game(self) -> None:
         """Reset game state to starting conditions."""
+        if self.event_log is not None:
+            self.event_log.log(self.tick, "restart", score=self.score)
+        if self.particles is not None:
+            self.particles.clear()
+        config = self.config
+
         # Create player at bottom center of screen
-        player_x = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
-        player_y = SCREEN_HEIGHT - 60  # 60 pixels from bottom
-        self.player = Player(player_x, player_y)
+        player_x = config.screen_width // 2 - config.player_width // 2
+        player_y = config.screen_height - 60  # 60 pixels from bottom
+        self.player = Player(player_x, player_y, config)
+
+        # Entity storage shared by the ECS systems
+        self.world = World()
 
         # Create player bullet pool
-        self.player_bullets = [PlayerBullet() for _ in range(PLAYER_BULLET_POOL_SIZE)]
+        self.player_bullets = PlayerBullet.create_pool(
+            self.world, "player_bullets", config.player_bullet_pool_size, config
+        )
 
         # Create invader bullet pool
-        self.invader_bullets = [
-            InvaderBullet() for _ in range(INVADER_BULLET_POOL_SIZE)
-        ]
+        self.invader_bullets = InvaderBullet.create_pool(
+            self.world, "invader_bullets", config.invader_bullet_pool_size, config
+        )
+
+        # Collision checks only for bullets predicted to hit something
+        self.scheduler: CollisionScheduler | None = None
+        if config.scheduled_collisions:
+            self.scheduler = CollisionScheduler(
+                self.world["player_bullets"], self.world["invader_bullets"]
+            )
 
         # Create invader grid
         self.invaders = []
-        for row in range(INVADER_ROWS):
-            for col in range(INVADER_COLS):
-                x = INVADER_START_X + col * INVADER_SPACING_X
-                y = INVADER_START_Y + row * INVADER_SPACING_Y
-                self.invaders.append(Invader(x, y))
+        self.formation = Formation(config.invader_rows, config.invader_cols, config)
+        for row in range(config.invader_rows):
+            for col in range(config.invader_cols):
+                x = config.invader_start_x + col * config.invader_spacing_x
+                y = config.invader_start_y + row * config.invader_spacing_y
+                invader = Invader(x, y, row, col, config)
+                self.invaders.append(invader)
+                self.formation.add(invader)
+        # Every invader of the starting grid, including those since killed
+        self.all_invaders = tuple(self.invaders)
 
         # Create shields
         self.shields = []
-        for i in range(SHIELD_START_COUNT):
-            x = SHIELD_START_X + i * SHIELD_SPACING_X
-            y = SHIELD_START_Y
-            self.shields.append(Shield(x, y))
+        for i in range(config.shield_start_count):
+            x = config.shield_start_x + i * config.shield_spacing_x
+            y = config.shield_start_y
+            self.shields.append(Shield(x, y, config))
+        # Every shield of the starting row, including those since destroyed
+        self.all_shields = tuple(self.shields)
 
         # Invader movement state
         self.invader_direction = 1  # 1 for right, -1 for left
         self.invader_move_counter = 0  # counts frames until next move
         self.invader_shoot_counter = 0  # counts frames until next shooting decision
 
-        # Score
+        # Score and simulation ticks played
         self.score = 0
+        self.tick = 0
 
         # Game state
         self.game_lost = False
         self.player_won = False
 
+        # Whether the presented frame still shows the game
+        self.screen_current = False
+
+    def snapshot(self) -> bytes:
+        """Capture the simulation state, without the display objects.
+
+        Returns:
+            The state as a flat buffer (see the snapshot module)
+        """
+        return take_snapshot(self)
+
+    def restore(self, snapshot: bytes) -> None:
+        """Put the simulation back into a captured state.
+
+        Args:
+            snapshot: A buffer from snapshot() of a game with the same settings
+        """
+        restore_snapshot(self, snapshot)
+        self.screen_current = False
+        if self.scheduler is not None:
+            self.scheduler.invalidate()
+
     def fire_bullet(self) -> None:
         """Fire a bullet from the player if one is available in the pool."""
         # Find first inactive bullet
         for bullet in self.player_bullets:
             if not bullet.active:
                 # Position bullet centered on player, just above it
-                bullet_x = self.player.x + PLAYER_WIDTH // 2 - PLAYER_BULLET_WIDTH // 2
-                bullet_y = self.player.y - PLAYER_BULLET_HEIGHT
+                config = self.config
+                bullet_x = (
+                    self.player.x
+                    + config.player_width // 2
+                    - config.player_bullet_width // 2
+                )
+                bullet_y = self.player.y - config.player_bullet_height
                 bullet.activate(bullet_x, bullet_y)
                 break
+        else:
+            if self.metrics is not None:
+                self.metrics.pool_exhausted["player_bullets"].inc()
 
     def fire_invader_bullet(self, x: int, y: int) -> None:
         """Fire a bullet from an invader if one is available in the pool.
@@ -144,224 +297,795 @@ class Game:
             if not bullet.active:
                 bullet.activate(x, y)
                 break
+        else:
+            if self.metrics is not None:
+                self.metrics.pool_exhausted["invader_bullets"].inc()
 
-    def draw_game(self) -> None:
-        """Draw the game scene."""
-        # Fill screen with black
-        self.screen.fill((0, 0, 0))
+    def capture_render_state(self, copy: bool = False) -> RenderState:
+        """Capture what the next frame should show.
+
+        Args:
+            copy: Copy the entities, so the state stays valid while the
+                simulation carries on
 
-        # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, TEXT_COLOR)
-        self.screen.blit(score_text, SCORE_TEXT_POSITION)
+        Returns:
+            The state of the game for drawing
+        """
+        message = None
+        if self.game_lost:
+            message = "Game over"
+        elif self.player_won:
+            message = "You won!"
+
+        state = RenderState(
+            score=self.score,
+            player=self.player,
+            invaders=self.invaders,
+            shields=self.shields,
+            world=self.world,
+            message=message,
+            particles=self.particles,
+        )
+        return state.copy() if copy else state
+
+    def draw_render_state(self, state: RenderState) -> None:
+        """Draw a captured game state.
+
+        Args:
+            state: The state to draw
+        """
+        if state.message is not None:
+            self.draw_game_over(state.message, state.score)
+            return
+
+        backend = self.backend
+        # Fill screen with black
+        backend.clear()
+
+        # Draw score, rendering the text again only when it changes
+        if self._score_text is None or (
+            self._score_text[0] != state.score
+            and self.frame % self.quality.hud_interval == 0
+        ):
+            score_text = self.font.render(
+                f"Score: {state.score}", True, self.config.text_color
+            )
+            self._score_text = (state.score, score_text)
+        backend.draw_text(self._score_text[1], self.config.score_text_position)
 
         # Draw invaders
-        for invader in self.invaders:
-            invader.draw(self.screen)
+        backend.draw_invaders(state.invaders)
 
         # Draw shields
-        for shield in self.shields:
-            shield.draw(self.screen)
+        backend.draw_shields(state.shields, self.quality.shield_transparency)
 
         # Draw player
-        self.player.draw(self.screen)
+        backend.draw_player(state.player)
 
-        # Draw bullets
-        for bullet in self.player_bullets:
-            bullet.draw(self.screen)
+        # Draw bullets and any other ECS entities
+        backend.draw_world(state.world)
 
-        # Draw invader bullets
-        for bullet in self.invader_bullets:
-            bullet.draw(self.screen)
+        # Draw explosions and hit effects
+        if state.particles is not None and self.quality.effects:
+            backend.draw_particles(state.particles)
 
-    def draw_game_over(self, message: str) -> None:
+    def draw_game(self) -> None:
+        """Draw the game scene."""
+        self.draw_render_state(self.capture_render_state())
+
+    def draw_game_over(self, message: str, score: int | None = None) -> None:
         """Draw the game over scene with a custom message.
 
         Args:
             message: The message to display (e.g., "Game over" or "You won!")
+            score: The score to display; defaults to the current score
         """
+        if score is None:
+            score = self.score
+        config = self.config
+        center_x = config.screen_width // 2
+        center_y = config.screen_height // 2
+
         # Fill screen with black
-        self.screen.fill((0, 0, 0))
+        self.backend.clear()
 
         # Render message text
-        message_text = self.game_over_font.render(message, True, TEXT_COLOR)
-        message_rect = message_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
-        )
+        message_text = self.game_over_font.render(message, True, config.text_color)
+        message_rect = message_text.get_rect(center=(center_x, center_y - 40))
 
         # Render score text
         score_text = self.game_over_font.render(
-            f"Score: {self.score}", True, TEXT_COLOR
+            f"Score: {score}", True, config.text_color
         )
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        score_rect = score_text.get_rect(center=(center_x, center_y))
 
         # Render restart prompt
-        restart_text = self.font.render("Press R to restart", True, TEXT_COLOR)
-        restart_rect = restart_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
-        )
+        restart_text = self.font.render("Press R to restart", True, config.text_color)
+        restart_rect = restart_text.get_rect(center=(center_x, center_y + 40))
 
         # Draw all texts
-        self.screen.blit(message_text, message_rect)
-        self.screen.blit(score_text, score_rect)
-        self.screen.blit(restart_text, restart_rect)
+        self.backend.draw_text(message_text, message_rect)
+        self.backend.draw_text(score_text, score_rect)
+        self.backend.draw_text(restart_text, restart_rect)
+
+    def find_collisions(
+        self,
+        archetype: Archetype,
+        targets: Sequence[tuple[int, int, int, int]],
+        slots: np.ndarray | None = None,
+    ) -> list[tuple[float, int, int]]:
+        """Find swept collisions, on the system pool if there is one.
 
-    def check_player_bullet_collisions(self) -> None:
-        """Check for collisions between player bullets and invaders."""
-        for bullet in self.player_bullets:
-            if not bullet.active:
-                continue
+        Args:
+            archetype: Moving entities
+            targets: Stationary rectangles as (x, y, width, height)
+            slots: Check only these slots of the archetype, in increasing order
+
+        Returns:
+            The hits in the order collision_system reports them
+        """
+        if self.systems is not None:
+            return self.systems.collisions(archetype, targets, slots)
+        return collision_system(archetype, targets, slots=slots)
 
-            bullet_rect = bullet.get_rectangle()
-            for invader in self.invaders.copy():
-                if check_rect_collision(bullet_rect, invader.get_rectangle()):
-                    # Collision detected
-                    self.invaders.remove(invader)
-                    bullet.deactivate()
-                    self.score += KILL_SCORE
+    def check_player_bullet_collisions(self, slots: np.ndarray | None = None) -> None:
+        """Check for collisions between player bullets and invaders.
 
-                    # Check if all invaders are destroyed
-                    if len(self.invaders) == 0:
-                        self.player_won = True
+        Hits are resolved in time-of-impact order, so each bullet kills the first
+        invader on its path and each invader is killed by the earliest bullet.
 
-                    return  # Bullet hit something, stop checking this bullet
+        Args:
+            slots: Check only these bullet slots (default: every bullet)
+        """
+        if slots is not None and len(slots) == 0:
+            return
+        invaders = self.invaders.copy()
+        hits = self.find_collisions(
+            self.world["player_bullets"],
+            [invader.get_rectangle() for invader in invaders],
+            slots,
+        )
 
-    def check_invader_bullet_collisions(self) -> bool:
+        killed = set()
+        for _, bullet_index, invader_index in hits:
+            bullet = self.player_bullets[bullet_index]
+            invader = invaders[invader_index]
+            if not bullet.active or invader in killed:
+                continue  # Bullet or invader already used up by an earlier hit
+
+            killed.add(invader)
+            self.invaders.remove(invader)
+            self.formation.remove(invader)
+            bullet.deactivate()
+            self.score += self.config.kill_score
+            x, y, width, height = invader.get_rectangle()
+            self.burst(
+                x + width / 2,
+                y + height / 2,
+                self.config.kill_particles,
+                self.config.invader_color,
+            )
+            if self.event_log is not None:
+                self.event_log.log(
+                    self.tick,
+                    "kill",
+                    row=invader.row,
+                    col=invader.col,
+                    x=invader.x,
+                    y=invader.y,
+                    score=self.score,
+                )
+
+        if killed and self.scheduler is not None:
+            self.scheduler.invalidate_player_bullets()
+
+        # Check if all invaders are destroyed
+        if hits and len(self.invaders) == 0:
+            self.player_won = True
+            if self.event_log is not None:
+                self.event_log.log(self.tick, "win", score=self.score)
+
+    def check_invader_bullet_collisions(self, slots: np.ndarray | None = None) -> bool:
         """Check for collisions between invader bullets and player.
 
+        Args:
+            slots: Check only these bullet slots (default: every bullet)
+
         Returns:
             True if player was hit (game should end), False otherwise
         """
-        player_rect = self.player.get_rectangle()
-        for bullet in self.invader_bullets:
-            if not bullet.active:
-                continue
+        if slots is not None and len(slots) == 0:
+            return False
+        hits = self.find_collisions(
+            self.world["invader_bullets"], [self.player.get_rectangle()], slots
+        )
+        if not hits:
+            return False
 
-            if check_rect_collision(bullet.get_rectangle(), player_rect):
-                # Collision detected - game is lost
-                bullet.deactivate()
-                return True
+        # Collision detected - game is lost
+        _, bullet_index, _ = hits[0]
+        self.invader_bullets[bullet_index].deactivate()
+        return True
+
+    def check_invader_bullet_shield_collisions(
+        self, slots: np.ndarray | None = None
+    ) -> None:
+        """Check for collisions between invader bullets and shields.
+
+        A bullet can only hit one shield: the first one on its path whose
+        intact pixels it touches. Each hit carves a crater where it lands.
+
+        Args:
+            slots: Check only these bullet slots (default: every bullet)
+        """
+        if slots is not None and len(slots) == 0:
+            return
+        shields = self.shields.copy()
+        hits = self.find_collisions(
+            self.world["invader_bullets"],
+            [shield.get_rectangle() for shield in shields],
+            slots,
+        )
 
+        for _, bullet_index, shield_index in hits:
+            bullet = self.invader_bullets[bullet_index]
+            shield = shields[shield_index]
+            if not bullet.active or shield not in self.shields:
+                continue  # Bullet already stopped or shield already destroyed
+
+            x, y, width, height = bullet.get_rectangle()
+            impact = shield.find_impact(
+                (x, bullet.prev_y, width, height), y - bullet.prev_y
+            )
+            if impact is None:
+                continue  # Bullet passes through a crater
+
+            # Collision detected
+            bullet.deactivate()
+            shield.take_damage()
+            shield.erode(*impact)
+            self._log_shield_hit(shield, impact)
+            self.burst(
+                *impact,
+                self.config.shield_hit_particles,
+                self.config.shield_color,
+                speed=2.0,
+            )
+
+            # Remove shield if destroyed
+            if shield.is_destroyed():
+                self.shields.remove(shield)
+
+    def burst(
+        self,
+        x: float,
+        y: float,
+        count: int,
+        color: tuple[int, int, int],
+        speed: float = 3.0,
+    ) -> None:
+        """Spawn a burst of particles, unless effects are off or ticks are replayed.
+
+        Args:
+            x: X coordinate of the burst's center
+            y: Y coordinate of the burst's center
+            count: Particles to spawn
+            color: Color of the particles
+            speed: Fastest speed of a particle, in pixels per tick
+        """
+        if (
+            self.particles is not None
+            and self.quality.effects
+            and not self.resimulating
+        ):
+            self.particles.burst(x, y, count, color, speed)
+
+    def _log_shield_hit(self, shield: Shield, impact: tuple[int, int]) -> None:
+        """Log a hit on a shield, and its destruction if it was the last.
+
+        Args:
+            shield: The shield that was hit
+            impact: Screen position of the crater
+        """
+        if self.event_log is None:
+            return
+        index = self.all_shields.index(shield)
+        x, y = impact
+        self.event_log.log(
+            self.tick, "shield_hit", shield=index, x=x, y=y, health=shield.health
+        )
+        if shield.is_destroyed():
+            self.event_log.log(self.tick, "shield_destroyed", shield=index)
+
+    def _log_death(self, cause: str) -> None:
+        """Log the loss of the game, if events are logged.
+
+        Args:
+            cause: "shot" or "invaded"
+        """
+        if self.event_log is not None:
+            self.event_log.log(self.tick, "player_death", cause=cause, score=self.score)
+
+    def move_invaders(self) -> None:
+        """March the invader formation one step.
+
+        The formation moves sideways until its next step would reach a screen
+        edge; then it drops down and reverses direction instead. The game is
+        lost if the formation reaches the player's line.
+        """
+        if self.formation.is_empty():
+            return
+
+        config = self.config
+        dx = self.invader_direction * config.invader_speed_x
+        hit_edge = (
+            self.formation.left + dx <= 0
+            or self.formation.right + dx >= config.screen_width
+        )
+
+        if hit_edge:
+            # Drop and reverse direction instead of moving sideways
+            for invader in self.invaders:
+                invader.y += config.invader_drop_distance
+            self.formation.move(0, config.invader_drop_distance)
+            self.invader_direction *= -1
+
+            if self.formation.bottom >= self.player.y:
+                self.game_lost = True
+                self._log_death("invaded")
+        else:
+            if self.systems is not None:
+                self.systems.map_ranges(self.march_invaders, len(self.invaders))
+            else:
+                self.march_invaders(0, len(self.invaders))
+            self.formation.move(dx, 0)
+
+        # Player bullets aim at where the formation was
+        if self.scheduler is not None:
+            self.scheduler.invalidate_player_bullets()
+
+    def march_invaders(self, start: int, stop: int) -> None:
+        """Move a range of the invaders one step sideways.
+
+        Args:
+            start: Index of the first invader to move
+            stop: Index to stop before
+        """
+        for invader in self.invaders[start:stop]:
+            invader.update(self.invader_direction, self.config.invader_speed_x)
+
+    def invaders_shoot(self) -> None:
+        """Give the lowest invader of each column a chance to shoot.
+
+        The random rolls for the whole volley are drawn in a single call and
+        sliced into one fixed-width roll per shooter.
+        """
+        shooters = self.formation.shooters()
+        if not shooters:
+            return
+
+        # Each shooter has invader_shoot_chance% chance to shoot
+        config = self.config
+        threshold = config.invader_shoot_chance * (1 << _SHOOT_ROLL_BITS) // 100
+        rolls = self.random.getrandbits(_SHOOT_ROLL_BITS * len(shooters))
+        for invader in shooters:
+            if rolls & _SHOOT_ROLL_MASK < threshold:
+                self.invader_shoot(invader)
+            rolls >>= _SHOOT_ROLL_BITS
+
+    def invader_shoot(self, invader: Invader) -> None:
+        """Fire a bullet from the bottom center of an invader.
+
+        Args:
+            invader: The invader that shoots
+        """
+        config = self.config
+        bullet_x = (
+            invader.x + config.invader_width // 2 - config.invader_bullet_width // 2
+        )
+        bullet_y = invader.y + config.invader_height
+        self.fire_invader_bullet(bullet_x, bullet_y)
+
+    def step(
+        self,
+        left: bool = False,
+        right: bool = False,
+        fire: bool = False,
+        invader_fire: int | None = None,
+    ) -> None:
+        """Advance the simulation by one tick.
+
+        Nothing happens once the game has been lost or won.
+
+        Args:
+            left: Whether the player is moving left
+            right: Whether the player is moving right
+            fire: Whether the player fires a bullet this tick
+            invader_fire: In versus mode, the column a second player fires
+                from this tick (-1 to hold fire); None lets the invaders
+                shoot at random
+        """
+        if self.game_lost or self.player_won:
+            return
+        self.tick += 1
+
+        if fire:
+            self.fire_bullet()
+
+        # Handle continuous key presses
+        if left:
+            self.player.move_left()
+        if right:
+            self.player.move_right()
+
+        # Keep player within bounds
+        self.player.clamp_to_bounds()
+
+        # Move bullets and remove those that left the screen
+        width, height = self.config.screen_width, self.config.screen_height
+        if self.systems is not None:
+            self.systems.movement(self.world)
+            self.systems.lifetime(self.world, width, height)
+        else:
+            movement_system(self.world)
+            lifetime_system(self.world, width, height)
+        if self.particles is not None and not self.resimulating:
+            self.particles.update()
+
+        # Check for collisions, only for bullets that may hit something if
+        # collisions are scheduled
+        player_slots = invader_slots = None
+        if self.scheduler is not None:
+            player_slots, invader_slots = self.scheduler.due(
+                self.formation, self.shields, self.player
+            )
+        self.check_invader_bullet_shield_collisions(invader_slots)
+        self.check_player_bullet_collisions(player_slots)
+
+        if self.check_invader_bullet_collisions(invader_slots):
+            self.game_lost = True
+            self._log_death("shot")
+            return
+
+        # Update invaders
+        self.invader_move_counter += 1
+        if self.invader_move_counter >= self.config.invader_move_delay:
+            self.invader_move_counter = 0
+            self.move_invaders()
+
+        # Invader shooting logic
+        self.invader_shoot_counter += 1
+        if self.invader_shoot_counter >= self.config.invader_shoot_delay:
+            if invader_fire is None:
+                self.invader_shoot_counter = 0
+                self.invaders_shoot()
+            elif 0 <= invader_fire < len(self.formation.lowest):
+                # The second player may fire once the shooting delay has passed
+                shooter = self.formation.lowest[invader_fire]
+                if shooter is not None:
+                    self.invader_shoot_counter = 0
+                    self.invader_shoot(shooter)
+
+    def process_events(self) -> bool:
+        """Handle pending window and keyboard events.
+
+        Returns:
+            True if the player pressed fire, False otherwise
+        """
+        fire = False
+        for event in pygame.event.get():
+            fire |= self.handle_event(event)
+        return fire
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Handle one window or keyboard event.
+
+        Args:
+            event: The event
+
+        Returns:
+            True if the player pressed fire, False otherwise
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                return True
+            elif event.key == pygame.K_r:
+                # Restart the game if in game over or win state
+                if self.game_lost or self.player_won:
+                    self.reset_game()
+        elif event.type in _WINDOW_HIDDEN_EVENTS:
+            self.window_shown = False
+        elif event.type in _WINDOW_SHOWN_EVENTS:
+            self.window_shown = True
+            self.screen_current = False
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.screen_current = False  # Parts of the window need redrawing
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.window_focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_focused = True
         return False
 
-    def check_invader_bullet_shield_collisions(self) -> None:
-        """Check for collisions between invader bullets and shields."""
-        for bullet in self.invader_bullets:
-            if not bullet.active:
-                continue
+    def is_idle(self) -> bool:
+        """Check if frames can be skipped until an event arrives.
 
-            bullet_rect = bullet.get_rectangle()
-            # Use a copy to avoid modifying list during iteration
-            for shield in self.shields.copy():
-                if check_rect_collision(bullet_rect, shield.get_rectangle()):
-                    # Collision detected
-                    bullet.deactivate()
-                    shield.take_damage()
+        Returns:
+            True while the window is hidden, which pauses the game, or while
+            an up-to-date game over or paused screen is shown
+        """
+        if not self.window_shown:
+            return True
+        return self.screen_current and (
+            self.game_lost or self.player_won or self.is_paused()
+        )
 
-                    # Remove shield if destroyed
-                    if shield.is_destroyed():
-                        self.shields.remove(shield)
+    def is_paused(self) -> bool:
+        """Check if the game is paused because its window lost focus.
 
-                    break  # Bullet can only hit one shield
+        Returns:
+            True while the window is unfocused and pause_on_blur is set
+        """
+        return self.config.pause_on_blur and not self.window_focused
 
-    def run(self) -> None:
-        """Start the game loop."""
-        self.running = True
-        while self.running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.fire_bullet()
-                    elif event.key == pygame.K_r:
-                        # Restart the game if in game over or win state
-                        if self.game_lost or self.player_won:
-                            self.reset_game()
+    def wait_for_events(self) -> None:
+        """Sleep until an event arrives, then handle every pending event.
 
+        The wait lasts at most idle_wait_ms, so the loop still notices when
+        running is cleared from elsewhere.
+        """
+        event = pygame.event.wait(self.config.idle_wait_ms)
+        if event.type != pygame.NOEVENT:
+            self.handle_event(event)
+        self.process_events()
+
+    def update_frame(self, fire: bool) -> None:
+        """Simulate and draw one frame, then present it.
+
+        At reduced quality only some frames are drawn and presented, but
+        every frame is simulated. The static game over screen is only drawn
+        and presented again when the window needs it.
+
+        Args:
+            fire: Whether the player pressed fire since the last frame
+        """
+        if self.screen_current and (
+            self.game_lost or self.player_won or self.is_paused()
+        ):
+            return
+
+        start = time.perf_counter()
+        self.phase_ms["step"] = 0.0
+        if self.game_lost:
             # If game is lost, just draw game over screen and skip updates
-            if self.game_lost:
-                self.draw_game_over("Game over")
-                pygame.display.flip()
-                self.clock.tick(FPS)
+            self.draw_game_over("Game over")
+        elif self.player_won:
+            # If player won, draw win screen and skip updates
+            self.draw_game_over("You won!")
+        elif self.is_paused():
+            # Redraw the paused scene, e.g. when exposed, without advancing it
+            self.draw_game()
+        else:
+            keys = pygame.key.get_pressed()
+            self.step(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], fire)
+            stepped = time.perf_counter()
+            self.phase_ms["step"] = (stepped - start) * 1000
+            start = stepped
+
+            if self.frame % self.quality.render_interval != 0:
+                self._end_frame(0.0)
+                return
+
+            # Draw game scene
+            self.draw_game()
+
+        drawn = time.perf_counter()
+        self.phase_ms["draw"] = (drawn - start) * 1000
+        self.present()
+        self.phase_ms["present"] = (time.perf_counter() - drawn) * 1000
+        self.screen_current = True
+        self._end_frame(self.phase_ms["draw"] + self.phase_ms["present"])
+
+    def _end_frame(self, render_ms: float) -> None:
+        """Count the frame and let the governor adjust the quality.
+
+        Args:
+            render_ms: Time spent drawing and presenting the frame
+        """
+        self.frame += 1
+        if self.metrics is not None:
+            self.metrics.record_frame(self, self.phase_ms["step"] + render_ms)
+        if self.governor is not None:
+            self.governor.record(self.phase_ms["step"] + render_ms)
+            self.quality = self.governor.quality
+
+    def present(self) -> None:
+        """Show the drawn frame and hand it to the recorder, if there is one."""
+        self.backend.present()
+        if self.recorder is not None:
+            self.recorder.capture(self.screen)
+
+    def run(self, pipelined: bool = False, low_latency: bool = False) -> None:
+        """Start the game loop.
+
+        While the game over screen is shown, the window is hidden, or the game
+        is paused without focus, the loop sleeps until an event arrives
+        instead of drawing.
+
+        Args:
+            pipelined: Draw and present each frame on a render thread while
+                the next tick is simulated
+            low_latency: Pace frames precisely and sample input just before
+                each step (ignored if pipelined)
+        """
+        if pipelined:
+            self._run_pipelined()
+            return
+        if low_latency:
+            self._run_low_latency()
+            return
+
+        self.running = True
+        while self.running:
+            if self.is_idle():
+                # Nothing changes on screen until an event arrives
+                self.wait_for_events()
                 continue
 
-            # If player won, draw win screen and skip updates
-            if self.player_won:
-                self.draw_game_over("You won!")
-                pygame.display.flip()
-                self.clock.tick(FPS)
+            fire = self.process_events()
+            self.update_frame(fire)
+
+            # Cap at the configured frame rate
+            self.clock.tick(self.config.fps)
+
+        # Clean up
+        pygame.quit()
+
+    def _run_low_latency(self) -> None:
+        """Run the game loop with as little input lag as possible.
+
+        Only the event types the game handles are queued. Each frame first
+        waits for its start time with a busy loop, which does not oversleep,
+        then samples input and immediately steps, draws and presents. The time
+        from sampling input to presenting is recorded in input_latency_ms.
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_INPUT_EVENT_TYPES)
+
+        self.running = True
+        while self.running:
+            if self.is_idle():
+                self.wait_for_events()
                 continue
 
-            # Handle continuous key presses
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                self.player.move_left()
-            if keys[pygame.K_RIGHT]:
-                self.player.move_right()
+            # Wait precisely for the frame, then sample input as late as possible
+            self.clock.tick_busy_loop(self.config.fps)
+            sampled = time.perf_counter()
+            fire = self.process_events()
+            self.update_frame(fire)
+            self.input_latency_ms.append((time.perf_counter() - sampled) * 1000)
 
-            # Keep player within bounds
-            self.player.clamp_to_bounds()
+        # Clean up
+        pygame.event.set_allowed(None)
+        pygame.quit()
 
-            # Update bullets
-            for bullet in self.player_bullets:
-                bullet.update()
+    def latency_report(self) -> tuple[float, float, float] | None:
+        """Summarize the recent input-to-present latencies.
 
-            # Update invader bullets
-            for bullet in self.invader_bullets:
-                bullet.update()
+        Returns:
+            Mean, 95th percentile and maximum latency in milliseconds, or
+            None if fewer than two frames were measured
+        """
+        samples = list(self.input_latency_ms)
+        if len(samples) < 2:
+            return None
+        p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+        return statistics.fmean(samples), p95, max(samples)
+
+    def _run_pipelined(self) -> None:
+        """Run the game loop with drawing handed off to a render thread.
+
+        Events and simulation stay on this thread. After each tick a copy of
+        the render state is submitted, and the render thread draws and flips
+        it while this thread simulates the next tick. While idle, nothing is
+        simulated or submitted until an event arrives. Each submitted frame
+        is recorded like one from update_frame, with the draw and present
+        times the render thread measured last.
+
+        Raises:
+            ValueError: If the render backend must draw on this thread
+        """
+        if not self.backend.thread_safe:
+            raise ValueError(
+                f"The {self.config.render_backend} render backend cannot draw "
+                "on a render thread"
+            )
+        renderer = RenderThread(self._render_and_present, present=False)
+        renderer.start()
 
-            # Check for collisions
-            self.check_invader_bullet_shield_collisions()
-            self.check_player_bullet_collisions()
+        self.running = True
+        try:
+            while self.running:
+                if self.is_idle():
+                    # Nothing changes on screen until an event arrives
+                    self.wait_for_events()
+                    continue
+
+                fire = self.process_events()
+                self.phase_ms["step"] = 0.0
+                if not (self.game_lost or self.player_won or self.is_paused()):
+                    start = time.perf_counter()
+                    keys = pygame.key.get_pressed()
+                    self.step(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], fire)
+                    self.phase_ms["step"] = (time.perf_counter() - start) * 1000
+                renderer.submit(self.capture_render_state(copy=True))
+                self.screen_current = True
+                # Drawing overlaps the next tick, so the latest render times
+                # measured on the render thread stand in for this frame's
+                self._end_frame(self.phase_ms["draw"] + self.phase_ms["present"])
+
+                # Cap at the configured frame rate
+                self.clock.tick(self.config.fps)
+        finally:
+            renderer.stop()
 
-            if self.check_invader_bullet_collisions():
-                self.game_lost = True
-                continue  # Skip to next frame to show game over screen
-
-            # Update invaders
-            self.invader_move_counter += 1
-            if self.invader_move_counter >= INVADER_MOVE_DELAY:
-                self.invader_move_counter = 0
-                for invader in self.invaders:
-                    invader.update(self.invader_direction, INVADER_SPEED_X)
-
-                # Check if any invader reached the edge
-                hit_edge = False
-                for invader in self.invaders:
-                    if invader.x <= 0 or invader.x + INVADER_WIDTH >= SCREEN_WIDTH:
-                        hit_edge = True
-                        break
-
-                # If edge was hit, undo horizontal move, drop, and reverse direction
-                if hit_edge:
-                    for invader in self.invaders:
-                        invader.x -= self.invader_direction * INVADER_SPEED_X
-                        invader.y += INVADER_DROP_DISTANCE
-                    self.invader_direction *= -1
-
-            # Invader shooting logic
-            self.invader_shoot_counter += 1
-            if self.invader_shoot_counter >= INVADER_SHOOT_DELAY:
-                self.invader_shoot_counter = 0
-                for invader in self.invaders:
-                    # Each invader has INVADER_SHOOT_CHANCE% chance to shoot
-                    if random.randint(0, 99) < INVADER_SHOOT_CHANCE:
-                        # Calculate bullet position at bottom center of invader
-                        bullet_x = (
-                            invader.x + INVADER_WIDTH // 2 - INVADER_BULLET_WIDTH // 2
-                        )
-                        bullet_y = invader.y + INVADER_HEIGHT
-                        self.fire_invader_bullet(bullet_x, bullet_y)
+        # Clean up
+        pygame.quit()
 
-            # Draw game scene
-            self.draw_game()
+    def _render_and_present(self, state: RenderState) -> None:
+        """Draw a state and present it, on the render thread."""
+        start = time.perf_counter()
+        self.draw_render_state(state)
+        drawn = time.perf_counter()
+        self.present()
+        self.phase_ms["draw"] = (drawn - start) * 1000
+        self.phase_ms["present"] = (time.perf_counter() - drawn) * 1000
 
-            # Update display
-            pygame.display.flip()
+    async def run_async(self, on_frame: Callable[["Game"], None] | None = None) -> None:
+        """Start the game loop as a coroutine.
+
+        Frames are scheduled against absolute deadlines on the event loop's
+        clock, and the loop yields to other tasks while waiting for the next
+        frame, so the game can share a thread with asyncio servers and I/O.
+        If a frame runs late, the schedule restarts from now rather than
+        rushing to catch up.
+
+        Args:
+            on_frame: Called with the game after every frame; it must not block
+        """
+        loop = asyncio.get_running_loop()
+        frame_seconds = 1 / self.config.fps
+        next_frame = loop.time()
+
+        self.running = True
+        while self.running:
+            if self.is_idle():
+                # Poll rather than block, so other tasks keep running
+                self.process_events()
+                await asyncio.sleep(_ASYNC_IDLE_SECONDS)
+                next_frame = loop.time()
+                continue
 
-            # Cap at 60 FPS
-            self.clock.tick(FPS)
+            fire = self.process_events()
+            self.update_frame(fire)
+            if on_frame is not None:
+                on_frame(self)
+
+            # Track frame timing without blocking the event loop
+            self.clock.tick()
+
+            next_frame += frame_seconds
+            now = loop.time()
+            if next_frame < now:
+                next_frame = now
+
+            # Sleep through most of the wait, then yield until the deadline
+            if next_frame - now > _ASYNC_SPIN_SECONDS:
+                await asyncio.sleep(next_frame - now - _ASYNC_SPIN_SECONDS)
+            while loop.time() < next_frame:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)  # Always give other tasks a turn
 
         # Clean up
         pygame.quit()
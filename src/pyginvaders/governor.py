@@ -0,0 +1,106 @@
+"""Frame-budget governor that trades visual quality for a steady frame rate.
+
+The governor watches how long each frame's work takes. When frames keep
+running over budget it steps down one optional cost at a time, in this
+order, and steps them back up once frames have had headroom for a while:
+
+1. Shield transparency: shields are drawn opaque
+2. HUD updates: the score text is only redrawn every few frames
+3. Effects: optional visual effects are skipped
+4. Render rate: only every other frame is drawn and presented
+
+The simulation itself is never degraded, so the game keeps its speed.
+"""
+
+from dataclasses import dataclass
+
+# How often the score text is redrawn once HUD updates are reduced
+REDUCED_HUD_INTERVAL = 15  # frames
+# How often a frame is drawn once the render rate is reduced
+REDUCED_RENDER_INTERVAL = 2  # frames
+
+
+@dataclass(frozen=True, slots=True)
+class Quality:
+    """Optional visual costs a game should pay."""
+
+    shield_transparency: bool = True
+    hud_interval: int = 1  # frames between score text updates
+    effects: bool = True
+    render_interval: int = 1  # frames between drawn frames
+
+
+FULL_QUALITY = Quality()
+
+# Quality at each level of degradation, from full to lowest
+QUALITY_LEVELS: tuple[Quality, ...] = (
+    FULL_QUALITY,
+    Quality(shield_transparency=False),
+    Quality(shield_transparency=False, hud_interval=REDUCED_HUD_INTERVAL),
+    Quality(
+        shield_transparency=False, hud_interval=REDUCED_HUD_INTERVAL, effects=False
+    ),
+    Quality(
+        shield_transparency=False,
+        hud_interval=REDUCED_HUD_INTERVAL,
+        effects=False,
+        render_interval=REDUCED_RENDER_INTERVAL,
+    ),
+)
+
+
+class FrameGovernor:
+    """Steps quality down when frames overrun their budget, and back up."""
+
+    def __init__(
+        self,
+        budget_ms: float,
+        degrade_after: int = 10,
+        restore_after: int = 120,
+        headroom: float = 0.75,
+    ) -> None:
+        """Initialize the governor at full quality.
+
+        Args:
+            budget_ms: Time available for one frame's work
+            degrade_after: Frames over budget, without a frame within the
+                headroom in between, before quality steps down
+            restore_after: Consecutive frames within the headroom before
+                quality steps up
+            headroom: Fraction of the budget a frame must stay under to
+                count towards restoring quality
+        """
+        self.budget_ms = budget_ms
+        self.degrade_after = degrade_after
+        self.restore_after = restore_after
+        self.headroom = headroom
+        self.level = 0
+        self.over_budget = 0  # recent frames over budget
+        self.under_budget = 0  # consecutive frames within the headroom
+
+    @property
+    def quality(self) -> Quality:
+        """Quality for the current level."""
+        return QUALITY_LEVELS[self.level]
+
+    def record(self, frame_ms: float) -> None:
+        """Record the work time of a frame and adjust the quality level.
+
+        Args:
+            frame_ms: Time the frame's work took, excluding any wait for the
+                next frame
+        """
+        if frame_ms > self.budget_ms:
+            self.under_budget = 0
+            self.over_budget += 1
+            if self.over_budget >= self.degrade_after:
+                self.over_budget = 0
+                self.level = min(self.level + 1, len(QUALITY_LEVELS) - 1)
+        elif frame_ms < self.budget_ms * self.headroom:
+            self.over_budget = 0
+            self.under_budget += 1
+            if self.under_budget >= self.restore_after:
+                self.under_budget = 0
+                self.level = max(self.level - 1, 0)
+        else:
+            self.under_budget = 0
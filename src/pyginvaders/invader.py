@@ -2,16 +2,35 @@
 
 import pygame
 
-from pyginvaders.config import INVADER_COLOR, INVADER_HEIGHT, INVADER_WIDTH
+from pyginvaders.config import DEFAULT_CONFIG, Config
 from pyginvaders.game_object import GameObject
+from pyginvaders.sprites import SpriteAtlas
 
 
 class Invader(GameObject):
     """Represents an alien invader."""
 
-    def __init__(self, x: int, y: int) -> None:
-        """Initialize the invader at the given position."""
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        row: int = 0,
+        col: int = 0,
+        config: Config = DEFAULT_CONFIG,
+    ) -> None:
+        """Initialize the invader at the given position.
+
+        Args:
+            x: X coordinate of the invader
+            y: Y coordinate of the invader
+            row: Row of the invader within the formation
+            col: Column of the invader within the formation
+            config: Game settings
+        """
         super().__init__(x, y)
+        self.row = row
+        self.col = col
+        self.config = config
 
     def get_rectangle(self) -> tuple[int, int, int, int]:
         """Get the invader's bounding rectangle.
@@ -19,7 +38,7 @@ class Invader(GameObject):
         Returns:
             A tuple of (x, y, width, height)
         """
-        return (self.x, self.y, INVADER_WIDTH, INVADER_HEIGHT)
+        return (self.x, self.y, self.config.invader_width, self.config.invader_height)
 
     def update(self, direction: int, speed: int) -> None:
         """Update the invader's position.
@@ -30,8 +49,29 @@ class Invader(GameObject):
         """
         self.x += direction * speed
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the invader on the screen."""
-        pygame.draw.rect(
-            screen, INVADER_COLOR, (self.x, self.y, INVADER_WIDTH, INVADER_HEIGHT)
+    def animation_step(self) -> int:
+        """Get the step of the invader's animation, which advances every march.
+
+        Returns:
+            The number of marches since the formation started, give or take
+        """
+        config = self.config
+        return self.x // max(config.invader_speed_x, 1) + self.y // max(
+            config.invader_drop_distance, 1
         )
+
+    def draw(self, screen: pygame.Surface, sprites: SpriteAtlas | None = None) -> None:
+        """Draw the invader on the screen.
+
+        Args:
+            screen: The pygame surface to draw on
+            sprites: Atlas with the invader's artwork; without one the invader
+                is drawn as a rectangle
+        """
+        sprite = None
+        if sprites is not None:
+            sprite = sprites.frame("invaders", self.animation_step())
+        if sprite is None:
+            pygame.draw.rect(screen, self.config.invader_color, self.get_rectangle())
+        else:
+            screen.blit(sprite, (self.x, self.y))
@@ -1,40 +1,33 @@
 """InvaderBullet module for managing invader projectiles."""
 
-import pygame
-
-from pyginvaders.bullet import Bullet
-from pyginvaders.config import (
-    INVADER_BULLET_COLOR,
-    INVADER_BULLET_HEIGHT,
-    INVADER_BULLET_SPEED,
-    INVADER_BULLET_WIDTH,
-    SCREEN_HEIGHT,
-)
+from pyginvaders.bullet import Bullet, BulletSettings
+from pyginvaders.config import Config
+from pyginvaders.ecs import TEAM_INVADERS
 
 
 class InvaderBullet(Bullet):
     """Represents a bullet fired by an invader."""
 
-    def get_rectangle(self) -> tuple[int, int, int, int]:
-        """Get the bullet's bounding rectangle.
+    TEAM = TEAM_INVADERS
+
+    @classmethod
+    def get_settings(cls, config: Config) -> BulletSettings:
+        """Get the size, speed and color of invader bullets.
+
+        Returns:
+            A tuple of (width, height, speed, color)
+        """
+        return (
+            config.invader_bullet_width,
+            config.invader_bullet_height,
+            config.invader_bullet_speed,
+            config.invader_bullet_color,
+        )
+
+    def is_off_screen(self) -> bool:
+        """Check if the bullet has left the bottom of the screen.
 
         Returns:
-            A tuple of (x, y, width, height)
+            True if the bullet is below the screen, False otherwise
         """
-        return (self.x, self.y, INVADER_BULLET_WIDTH, INVADER_BULLET_HEIGHT)
-
-    def update(self) -> None:
-        """Update bullet position and deactivate if off screen."""
-        if self.active:
-            self.y += INVADER_BULLET_SPEED
-            if self.y > SCREEN_HEIGHT:
-                self.deactivate()
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the bullet on the screen if active."""
-        if self.active:
-            pygame.draw.rect(
-                screen,
-                INVADER_BULLET_COLOR,
-                (self.x, self.y, INVADER_BULLET_WIDTH, INVADER_BULLET_HEIGHT),
-            )
+        return self.y > self.config.screen_height
@@ -0,0 +1,137 @@
+"""Load generator that ramps entity counts until the frame budget is exceeded.
+
+Run it against a scenario file to find the largest scaled-up game that still
+fits in a frame:
+
+    uv run python -m pyginvaders.loadgen scenarios/stress.toml
+
+The game runs offscreen, under SDL's dummy video driver unless another driver
+is configured.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from dataclasses import dataclass
+
+import pygame
+
+from pyginvaders.game import Game
+from pyginvaders.scenario import Scenario, load_scenario
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    """Frame timings measured for one load level."""
+
+    factor: int
+    entity_count: int
+    mean_ms: float
+    p95_ms: float
+
+
+def measure_scenario(scenario: Scenario, ticks: int) -> list[float]:
+    """Run a scenario with its scripted input and time every frame.
+
+    A frame is one simulation step, drawing the scene and presenting it through
+    the game's render backend.
+    The game restarts whenever it is lost or won so the load stays constant.
+
+    Args:
+        scenario: Scenario to run
+        ticks: Number of frames to time
+
+    Returns:
+        Frame times in milliseconds
+    """
+    game = Game(scenario.config, seed=scenario.seed)
+    script = scenario.input_script()
+    frame_times = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        game.step(*next(script))
+        game.draw_game()
+        game.present()
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+        if game.game_lost or game.player_won:
+            game.reset_game()
+    return frame_times
+
+
+def find_breaking_point(
+    scenario: Scenario, budget_ms: float, ticks: int, max_factor: int
+) -> tuple[list[LoadResult], LoadResult | None]:
+    """Scale a scenario up until its 95th percentile frame time exceeds a budget.
+
+    Args:
+        scenario: Scenario to scale up
+        budget_ms: Frame budget in milliseconds
+        ticks: Number of frames to time at each level
+        max_factor: Largest scale factor to try
+
+    Returns:
+        The results for every level tried, and the first level over budget
+        (None if every level fit)
+    """
+    results = []
+    for factor in range(1, max_factor + 1):
+        scaled = scenario.scaled(factor)
+        frame_times = measure_scenario(scaled, ticks)
+        result = LoadResult(
+            factor=factor,
+            entity_count=scaled.entity_count(),
+            mean_ms=statistics.fmean(frame_times),
+            p95_ms=statistics.quantiles(frame_times, n=20)[-1],
+        )
+        results.append(result)
+        if result.p95_ms > budget_ms:
+            return results, result
+    return results, None
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenario", nargs="?", help="scenario TOML file")
+    parser.add_argument(
+        "--budget-ms", type=float, default=None, help="frame budget (default: 1/fps)"
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=None, help="frames per level (default: scenario)"
+    )
+    parser.add_argument("--max-factor", type=int, default=64, help="largest level")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    scenario = load_scenario(args.scenario) if args.scenario else Scenario()
+    ticks = args.ticks if args.ticks is not None else scenario.ticks
+    budget_ms = args.budget_ms
+    if budget_ms is None:
+        budget_ms = 1000 / scenario.config.fps
+
+    print(f"Scenario {scenario.name!r}, budget {budget_ms:.2f} ms/frame")
+    print(f"{'factor':>6} {'entities':>9} {'mean ms':>8} {'p95 ms':>8}")
+    results, breaking_point = find_breaking_point(
+        scenario, budget_ms, ticks, args.max_factor
+    )
+    for result in results:
+        print(
+            f"{result.factor:>6} {result.entity_count:>9} "
+            f"{result.mean_ms:>8.3f} {result.p95_ms:>8.3f}"
+        )
+
+    if breaking_point is None:
+        print(f"No breaking point up to factor {args.max_factor}")
+    else:
+        print(
+            f"Breaking point: factor {breaking_point.factor} "
+            f"({breaking_point.entity_count} entities)"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
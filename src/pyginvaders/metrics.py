@@ -0,0 +1,410 @@
+"""Frame and gameplay telemetry exported in the Prometheus text format.
+
+Every metric is created up front with fixed buckets, so recording a frame
+only adds to existing numbers. Exporting happens on its own thread, either
+by rewriting a file at an interval (for example for node_exporter's textfile
+collector) or by serving http://127.0.0.1:<port>/metrics. The exporter reads
+the numbers while the game updates them, so a scrape may be a frame behind
+on some metrics, but never holds up the game loop.
+
+    game.metrics = GameMetrics()
+    exporter = MetricsServer(game.metrics, port=9464)
+    exporter.start()
+"""
+
+import gc
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyginvaders.game import Game
+
+# Bucket upper bounds in seconds, from well inside a 60 FPS frame to a stall
+FRAME_BUCKETS = (
+    0.0005,
+    0.001,
+    0.002,
+    0.004,
+    0.008,
+    0.0167,
+    0.025,
+    0.033,
+    0.05,
+    0.1,
+    0.25,
+)
+GC_BUCKETS = (0.0001, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.05, 0.1)
+
+PHASES = ("step", "draw", "present")
+ENTITY_KINDS = (
+    "invaders",
+    "shields",
+    "player_bullets",
+    "invader_bullets",
+    "particles",
+)
+POOLS = ("player_bullets", "invader_bullets")
+
+Labels = dict[str, str]
+
+
+def _format_labels(labels: Labels) -> str:
+    """Format labels as {name="value",...}, or nothing if there are none."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, without a fraction for whole numbers."""
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Metric(ABC):
+    """A named number or set of numbers with fixed labels."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Labels | None = None):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name, shared by every label combination
+            help_text: Description for the HELP line
+            labels: Label values that tell this metric apart from others
+                with the same name
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels or {}
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        """Get the metric's samples as (name suffix, extra labels, value)."""
+
+
+class Counter(Metric):
+    """A count that only goes up."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Labels | None = None):
+        """Initialize the counter at zero."""
+        super().__init__(name, help_text, labels)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        """Add to the count."""
+        self.value += amount
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        """Get the count."""
+        yield "", {}, self.value
+
+
+class Gauge(Metric):
+    """A number that goes up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Labels | None = None):
+        """Initialize the gauge at zero."""
+        super().__init__(name, help_text, labels)
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the current value."""
+        self.value = value
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        """Get the current value."""
+        yield "", {}, self.value
+
+
+class Histogram(Metric):
+    """Counts of observations in fixed buckets, with their sum."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float],
+        labels: Labels | None = None,
+    ):
+        """Initialize an empty histogram.
+
+        Args:
+            name: Metric name
+            help_text: Description for the HELP line
+            buckets: Increasing upper bounds of the buckets; one for values
+                above the last bound is added
+            labels: Label values of this histogram
+        """
+        super().__init__(name, help_text, labels)
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count an observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        """Get the cumulative bucket counts, the sum and the count."""
+        counts = list(self.counts)  # One consistent view of the buckets
+        total = 0
+        for bound, count in zip(self.bounds, counts):
+            total += count
+            yield "_bucket", {"le": repr(bound)}, total
+        total += counts[-1]
+        yield "_bucket", {"le": "+Inf"}, total
+        yield "_sum", {}, self.sum
+        yield "_count", {}, total
+
+
+class Registry:
+    """A set of metrics that are exported together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.metrics: list[Metric] = []
+
+    def add[M: Metric](self, metric: M) -> M:
+        """Register a metric.
+
+        Returns:
+            The metric
+        """
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Format every metric in the Prometheus text format.
+
+        Returns:
+            The metrics, with HELP and TYPE lines once per name
+        """
+        lines = []
+        described = set()
+        for metric in self.metrics:
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                label_text = _format_labels(metric.labels | labels)
+                value_text = _format_value(value)
+                lines.append(f"{metric.name}{suffix}{label_text} {value_text}")
+        return "\n".join(lines) + "\n"
+
+
+class GameMetrics(Registry):
+    """The metrics a game records, created up front."""
+
+    def __init__(self) -> None:
+        """Create every metric and start timing garbage collections."""
+        super().__init__()
+        self.frames = self.add(
+            Counter("pyginvaders_frames_total", "Frames simulated by the game loop.")
+        )
+        self.frame_seconds = self.add(
+            Histogram(
+                "pyginvaders_frame_seconds",
+                "Time spent simulating, drawing and presenting a frame.",
+                FRAME_BUCKETS,
+            )
+        )
+        self.frame_interval_seconds = self.add(
+            Histogram(
+                "pyginvaders_frame_interval_seconds",
+                "Time between the ends of consecutive frames.",
+                FRAME_BUCKETS,
+            )
+        )
+        self.phase_seconds = {
+            phase: self.add(
+                Histogram(
+                    "pyginvaders_phase_seconds",
+                    "Time spent in each phase of a frame.",
+                    FRAME_BUCKETS,
+                    {"phase": phase},
+                )
+            )
+            for phase in PHASES
+        }
+        self.entities = {
+            kind: self.add(
+                Gauge("pyginvaders_entities", "Live entities.", {"kind": kind})
+            )
+            for kind in ENTITY_KINDS
+        }
+        self.pool_exhausted = {
+            pool: self.add(
+                Counter(
+                    "pyginvaders_pool_exhausted_total",
+                    "Shots dropped because every bullet in the pool was in flight.",
+                    {"pool": pool},
+                )
+            )
+            for pool in POOLS
+        }
+        self.gc_pause_seconds = self.add(
+            Histogram(
+                "pyginvaders_gc_pause_seconds",
+                "Time the garbage collector paused the process.",
+                GC_BUCKETS,
+            )
+        )
+        self._last_frame_end: float | None = None
+        self._gc_start = 0.0
+        gc.callbacks.append(self._on_gc)
+
+    def close(self) -> None:
+        """Stop timing garbage collections."""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def record_frame(self, game: "Game", frame_ms: float) -> None:
+        """Record the timings and entity counts of a finished frame.
+
+        Args:
+            game: The game, with phase_ms filled in for the frame
+            frame_ms: Time the frame's work took
+        """
+        now = time.perf_counter()
+        if self._last_frame_end is not None:
+            self.frame_interval_seconds.observe(now - self._last_frame_end)
+        self._last_frame_end = now
+
+        self.frames.inc()
+        self.frame_seconds.observe(frame_ms / 1000)
+        for phase, histogram in self.phase_seconds.items():
+            histogram.observe(game.phase_ms[phase] / 1000)
+
+        entities = self.entities
+        entities["invaders"].set(len(game.invaders))
+        entities["shields"].set(len(game.shields))
+        entities["player_bullets"].set(game.world["player_bullets"].count())
+        entities["invader_bullets"].set(game.world["invader_bullets"].count())
+        if game.particles is not None:
+            entities["particles"].set(game.particles.count())
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        """Time a garbage collection from its start to its stop."""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            self.gc_pause_seconds.observe(time.perf_counter() - self._gc_start)
+
+
+class MetricsFileWriter:
+    """Rewrites a file with the current metrics at an interval, on a thread."""
+
+    def __init__(self, registry: Registry, path: str | Path, interval: float = 5.0):
+        """Initialize the writer without starting it.
+
+        Args:
+            registry: Metrics to write
+            path: File to write; it is replaced whole, so readers never see
+                a partial file
+            interval: Seconds between writes
+        """
+        self.registry = registry
+        self.path = Path(path)
+        self.interval = interval
+        self.writes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-writer", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start writing."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write the metrics one last time and stop."""
+        self._stop.set()
+        self._thread.join()
+
+    def write(self) -> None:
+        """Write the current metrics now."""
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(self.registry.render())
+        os.replace(temporary, self.path)
+        self.writes += 1
+
+    def _run(self) -> None:
+        """Write at every interval until stopped, and once more at the end."""
+        while not self._stop.wait(self.interval):
+            self.write()
+        self.write()
+
+
+class MetricsServer:
+    """Serves the current metrics over HTTP on its own thread."""
+
+    def __init__(self, registry: Registry, port: int = 0, host: str = "127.0.0.1"):
+        """Bind the server without serving yet.
+
+        Args:
+            registry: Metrics to serve
+            port: Port to listen on; 0 picks a free port
+            host: Interface to listen on; localhost keeps the metrics private
+        """
+        self.registry = registry
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="metrics-server", daemon=True
+        )
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port the server listens on."""
+        host, port = self.httpd.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Start serving."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        """Create a request handler class that serves this registry."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                """Serve the metrics."""
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                """Skip logging, as scrapes are too frequent to log."""
+
+        return Handler
@@ -0,0 +1,466 @@
+"""Two-player versus mode over UDP with rollback netcode.
+
+One player moves and fires the cannon; the other picks which column of the
+formation fires. Each side simulates every tick straight away with a
+predicted input for the remote player (their last confirmed input). When the
+real input arrives and differs from the prediction, the session restores the
+snapshot taken before that tick and resimulates up to the present within the
+same frame, so neither player waits for the round trip.
+
+Run a relay that adds artificial latency and jitter, then one game per side:
+
+    uv run python -m pyginvaders.netplay relay 7000 7001 --latency-ms 80
+    uv run python -m pyginvaders.netplay play player 127.0.0.1:7000
+    uv run python -m pyginvaders.netplay play invaders 127.0.0.1:7001
+"""
+
+import argparse
+import heapq
+import random
+import select
+import socket
+import struct
+import threading
+import time
+from typing import Literal
+
+import pygame
+
+from pyginvaders.game import Game
+
+Side = Literal["player", "invaders"]
+SIDES: tuple[Side, ...] = ("player", "invaders")
+
+# Player input bits
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_FIRE = 4
+
+# Packet header: last remote tick received, first tick sent, number of inputs
+_HEADER = struct.Struct("!iiH")
+_INPUT = struct.Struct("!H")
+# Most inputs resent in one packet
+MAX_INPUTS_PER_PACKET = 64
+# Seed of both sides' games, so their whole simulation state matches
+VERSUS_SEED = 0
+
+Address = tuple[str, int]
+
+
+def encode_player_input(left: bool, right: bool, fire: bool) -> int:
+    """Pack the player's input for one tick.
+
+    Returns:
+        The INPUT_* bits that are set
+    """
+    return (
+        (INPUT_LEFT if left else 0)
+        | (INPUT_RIGHT if right else 0)
+        | (INPUT_FIRE if fire else 0)
+    )
+
+
+def encode_invader_input(column: int | None) -> int:
+    """Pack the invader player's input for one tick.
+
+    Args:
+        column: Column to fire from, or None to hold fire
+
+    Returns:
+        0 to hold fire, otherwise the column plus one
+    """
+    return 0 if column is None else column + 1
+
+
+def step_versus(game: Game, player_input: int, invader_input: int) -> None:
+    """Advance a versus game by one tick with both players' inputs."""
+    game.step(
+        bool(player_input & INPUT_LEFT),
+        bool(player_input & INPUT_RIGHT),
+        bool(player_input & INPUT_FIRE),
+        invader_input - 1,
+    )
+
+
+class UdpPeer:
+    """Non-blocking UDP socket that exchanges packets with one remote address."""
+
+    def __init__(self, local: Address, remote: Address) -> None:
+        """Bind the socket.
+
+        Args:
+            local: Address to receive on; port 0 picks a free port
+            remote: Address to send to
+        """
+        self.remote = remote
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(local)
+        self.socket.setblocking(False)
+
+    @property
+    def address(self) -> Address:
+        """Address the socket is bound to."""
+        return self.socket.getsockname()
+
+    def send(self, packet: bytes) -> None:
+        """Send a packet to the remote address, dropping it if the OS refuses."""
+        try:
+            self.socket.sendto(packet, self.remote)
+        except OSError:
+            pass  # Lost like any other datagram; the inputs are resent
+
+    def receive(self) -> list[bytes]:
+        """Get every packet that has arrived.
+
+        Returns:
+            The packets in arrival order
+        """
+        packets = []
+        while True:
+            try:
+                packet, _ = self.socket.recvfrom(65536)
+            except OSError:
+                return packets  # Nothing left to read
+            packets.append(packet)
+
+    def close(self) -> None:
+        """Close the socket."""
+        self.socket.close()
+
+
+class RollbackSession:
+    """Keeps a local game in step with a remote one by predicting and rolling back.
+
+    Every packet carries the local inputs the remote side has not acknowledged,
+    so lost or reordered packets only delay inputs. The session runs at most
+    max_rollback ticks ahead of the last confirmed remote input and stalls
+    beyond that.
+    """
+
+    def __init__(
+        self, game: Game, side: Side, peer: UdpPeer, max_rollback: int = 8
+    ) -> None:
+        """Initialize a session at the game's current state.
+
+        Args:
+            game: The game to simulate
+            side: Which side the local player controls
+            peer: Connection to the remote player
+            max_rollback: Most ticks to simulate on predicted input
+        """
+        if side not in SIDES:
+            raise ValueError(f"Unknown side {side!r}; choose from {SIDES}")
+        self.game = game
+        self.side = side
+        self.peer = peer
+        self.max_rollback = max_rollback
+
+        self.tick = 0  # next tick to simulate
+        self.local_inputs: dict[int, int] = {}
+        self.remote_inputs: dict[int, int] = {}  # confirmed by the remote side
+        self.predicted: dict[int, int] = {}  # remote inputs the ticks were run with
+        self.snapshots: dict[int, bytes] = {}  # state before each unverified tick
+        self.confirmed_tick = -1  # every remote input up to here has arrived
+        self.verified_tick = -1  # every tick up to here ran on confirmed input
+        self.peer_ack = -1  # every local input up to here has arrived remotely
+
+        self.rollbacks = 0
+        self.resimulated_ticks = 0
+        self.stalls = 0
+
+    def advance(self, local_input: int) -> bool:
+        """Simulate the next tick with the local player's input.
+
+        Any remote inputs that arrived since the last call are applied first,
+        rolling back and resimulating if they differ from the predictions.
+
+        Args:
+            local_input: Encoded input of the local player for the tick
+
+        Returns:
+            True if the tick was simulated, False if the session is stalled
+            waiting for remote input
+        """
+        self.poll()
+        if self.tick - self.confirmed_tick > self.max_rollback:
+            self.stalls += 1
+            self.send_inputs()
+            return False
+
+        self.local_inputs[self.tick] = local_input
+        self.send_inputs()
+        self._simulate(self.tick)
+        self.tick += 1
+        return True
+
+    def poll(self) -> None:
+        """Receive remote inputs and correct any mispredicted ticks."""
+        for packet in self.peer.receive():
+            self._read_packet(packet)
+
+        # Find the first tick that ran on a wrong prediction
+        last = min(self.confirmed_tick, self.tick - 1)
+        for tick in range(self.verified_tick + 1, last + 1):
+            if self.predicted[tick] != self.remote_inputs[tick]:
+                self._rollback(tick)
+                break
+        self.verified_tick = max(self.verified_tick, last)
+
+        # Older states can no longer be rolled back to
+        for tick in [tick for tick in self.snapshots if tick <= self.verified_tick]:
+            del self.snapshots[tick], self.predicted[tick]
+
+    def send_inputs(self) -> None:
+        """Send the local inputs the remote side has not acknowledged."""
+        last = self.tick if self.tick in self.local_inputs else self.tick - 1
+        first = max(self.peer_ack + 1, last + 1 - MAX_INPUTS_PER_PACKET)
+        inputs = [self.local_inputs[tick] for tick in range(first, last + 1)]
+        packet = _HEADER.pack(self.confirmed_tick, first, len(inputs))
+        packet += b"".join(_INPUT.pack(value) for value in inputs)
+        self.peer.send(packet)
+
+    def _read_packet(self, packet: bytes) -> None:
+        """Record the inputs and acknowledgement in a packet."""
+        if len(packet) < _HEADER.size:
+            return
+        ack, first, count = _HEADER.unpack_from(packet)
+        if len(packet) != _HEADER.size + count * _INPUT.size:
+            return
+        self.peer_ack = max(self.peer_ack, ack)
+        for i in range(max(0, self.verified_tick - first), count):
+            # Older ticks are verified and pruned; a late packet must not re-add them
+            (value,) = _INPUT.unpack_from(packet, _HEADER.size + i * _INPUT.size)
+            self.remote_inputs.setdefault(first + i, value)
+        while self.confirmed_tick + 1 in self.remote_inputs:
+            self.confirmed_tick += 1
+
+        # Inputs that are acknowledged and verified are no longer needed
+        oldest = min(self.peer_ack, self.verified_tick)
+        for tick in [tick for tick in self.local_inputs if tick < oldest]:
+            del self.local_inputs[tick]
+        for tick in [tick for tick in self.remote_inputs if tick < self.verified_tick]:
+            del self.remote_inputs[tick]
+
+    def _rollback(self, tick: int) -> None:
+        """Restore the state before a tick and resimulate up to the present."""
+        self.rollbacks += 1
+        self.game.restore(self.snapshots[tick])
+        # These ticks were already shown, with their effects
+        self.game.resimulating = True
+        try:
+            for resimulated in range(tick, self.tick):
+                self._simulate(resimulated)
+                self.resimulated_ticks += 1
+        finally:
+            self.game.resimulating = False
+
+    def _simulate(self, tick: int) -> None:
+        """Run one tick with the local input and the best known remote input."""
+        remote_input = self._remote_input(tick)
+        self.predicted[tick] = remote_input
+        self.snapshots[tick] = self.game.snapshot()
+
+        local_input = self.local_inputs[tick]
+        if self.side == "player":
+            step_versus(self.game, local_input, remote_input)
+        else:
+            step_versus(self.game, remote_input, local_input)
+
+    def _remote_input(self, tick: int) -> int:
+        """Get the remote input for a tick, predicting it if it has not arrived.
+
+        The prediction is the last confirmed input, since inputs tend to be
+        held for several ticks.
+        """
+        if tick in self.remote_inputs:
+            return self.remote_inputs[tick]
+        return self.remote_inputs.get(self.confirmed_tick, 0)
+
+
+class LoopbackRelay:
+    """UDP relay that forwards packets between two endpoints after a delay.
+
+    Each player sends to their own relay port; the relay learns their address
+    from the first packet and forwards everything to the other player after
+    latency_ms plus up to jitter_ms either way, so packets can arrive out of
+    order. Packets for a player who has not been heard from yet are dropped.
+    """
+
+    def __init__(
+        self,
+        ports: tuple[int, int] = (0, 0),
+        latency_ms: float = 50.0,
+        jitter_ms: float = 0.0,
+        host: str = "127.0.0.1",
+        seed: int | None = None,
+    ) -> None:
+        """Bind the relay's sockets without starting it.
+
+        Args:
+            ports: Port for each player; 0 picks a free port
+            latency_ms: Mean one-way delay added to every packet
+            jitter_ms: Largest random change to the delay
+            host: Interface to listen on
+            seed: Seed for the jitter
+        """
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.random = random.Random(seed)
+        self.sockets = []
+        for port in ports:
+            relay_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            relay_socket.bind((host, port))
+            self.sockets.append(relay_socket)
+        self.endpoints: list[Address | None] = [None, None]
+        self.forwarded = 0
+        self._queue: list[tuple[float, int, int, bytes]] = []
+        self._sequence = 0
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="relay", daemon=True)
+
+    @property
+    def addresses(self) -> tuple[Address, Address]:
+        """Addresses the two players should send to."""
+        first, second = (relay_socket.getsockname() for relay_socket in self.sockets)
+        return first, second
+
+    def start(self) -> None:
+        """Start relaying on a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop relaying and close the sockets."""
+        self._stopping.set()
+        self._thread.join()
+        for relay_socket in self.sockets:
+            relay_socket.close()
+
+    def _run(self) -> None:
+        """Receive, delay and forward packets until stopped."""
+        while not self._stopping.is_set():
+            timeout = 0.05
+            if self._queue:
+                timeout = min(timeout, max(0.0, self._queue[0][0] - time.monotonic()))
+            readable, _, _ = select.select(self.sockets, [], [], timeout)
+            for relay_socket in readable:
+                self._receive(self.sockets.index(relay_socket))
+            self._forward_due()
+
+    def _receive(self, side: int) -> None:
+        """Queue a packet from one player for the other."""
+        try:
+            packet, address = self.sockets[side].recvfrom(65536)
+        except ConnectionResetError:
+            return
+        self.endpoints[side] = address
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        due = time.monotonic() + max(0.0, delay)
+        heapq.heappush(self._queue, (due, self._sequence, 1 - side, packet))
+        self._sequence += 1
+
+    def _forward_due(self) -> None:
+        """Forward every queued packet whose delay has passed."""
+        now = time.monotonic()
+        while self._queue and self._queue[0][0] <= now:
+            _, _, side, packet = heapq.heappop(self._queue)
+            endpoint = self.endpoints[side]
+            if endpoint is None:
+                continue
+            try:
+                self.sockets[side].sendto(packet, endpoint)
+            except OSError:
+                continue  # Lost like any other datagram; keep relaying the rest
+            self.forwarded += 1
+
+
+def play(side: Side, remote: Address, port: int = 0) -> None:
+    """Play one side of a versus game.
+
+    The player side moves with the arrow keys and fires with space. The
+    invader side picks a column with the arrow keys and fires from it with
+    space.
+
+    Args:
+        side: Which side the local player controls
+        remote: Address of the relay or the other player
+        port: Local port to receive on
+    """
+    game = Game(seed=VERSUS_SEED)
+    pygame.display.set_caption(f"PygInvaders versus ({side})")
+    peer = UdpPeer(("0.0.0.0", port), remote)
+    session = RollbackSession(game, side, peer)
+    config = game.config
+    column = config.invader_cols // 2
+
+    game.running = True
+    while game.running:
+        fire = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                game.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    fire = True
+                elif side == "invaders" and event.key == pygame.K_LEFT:
+                    column = max(0, column - 1)
+                elif side == "invaders" and event.key == pygame.K_RIGHT:
+                    column = min(config.invader_cols - 1, column + 1)
+
+        if side == "player":
+            keys = pygame.key.get_pressed()
+            local_input = encode_player_input(
+                keys[pygame.K_LEFT], keys[pygame.K_RIGHT], fire
+            )
+        else:
+            local_input = encode_invader_input(column if fire else None)
+        session.advance(local_input)
+
+        game.draw_render_state(game.capture_render_state())
+        if side == "invaders":
+            # Mark the column the invader player fires from
+            x = (
+                config.invader_start_x
+                + column * config.invader_spacing_x
+                + game.formation.offset_x
+            )
+            marker = (x, config.screen_height - 10, config.invader_width, 4)
+            game.backend.draw_rect(config.invader_color, marker)
+        game.present()
+        game.clock.tick(config.fps)
+
+    peer.close()
+    pygame.quit()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a relay or one side of a versus game from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    relay_parser = commands.add_parser("relay", help="run a loopback relay")
+    relay_parser.add_argument("ports", type=int, nargs=2, help="port per player")
+    relay_parser.add_argument("--latency-ms", type=float, default=50.0)
+    relay_parser.add_argument("--jitter-ms", type=float, default=0.0)
+
+    play_parser = commands.add_parser("play", help="play one side")
+    play_parser.add_argument("side", choices=SIDES)
+    play_parser.add_argument("remote", help="host:port of the relay or other player")
+    play_parser.add_argument("--port", type=int, default=0, help="local port")
+    args = parser.parse_args(argv)
+
+    if args.command == "relay":
+        relay = LoopbackRelay(tuple(args.ports), args.latency_ms, args.jitter_ms)
+        relay.start()
+        print(f"Relaying {relay.addresses[0]} <-> {relay.addresses[1]}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            relay.stop()
+    else:
+        host, port = args.remote.rsplit(":", 1)
+        play(args.side, (host, int(port)), args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Particle effects for explosions and hits.
+
+Particles live in one fixed-capacity ECS archetype with float columns, so a
+burst, a tick of movement and culling are each a handful of whole-array
+operations however many particles are alive. Drawing writes every particle's
+pixels into the frame in one pass through the surface's pixel array, instead
+of one draw call per particle.
+
+Particles are purely visual: they are not part of the game's world, so they
+are left out of snapshots and collision checks, and they draw from their own
+random generator so the game's random stream is unchanged.
+"""
+
+import numpy as np
+import pygame
+
+from pyginvaders.ecs import Archetype
+
+# Pixels along each side of a particle
+PARTICLE_SIZE = 2
+# Downward speed added per tick, in pixels per tick
+GRAVITY = 0.08
+# Factor each particle's color is multiplied by per tick, fading it out
+FADE = 0.94
+# Range of lifetimes of new particles, in ticks
+LIFETIME = (20, 40)
+
+_COMPONENTS = ("position", "velocity", "lifetime", "color")
+
+
+class ParticleSystem:
+    """Fixed-capacity particle storage with vectorized update and drawing."""
+
+    def __init__(
+        self, capacity: int, width: int, height: int, seed: int | None = None
+    ) -> None:
+        """Initialize the storage with every slot free.
+
+        Args:
+            capacity: Most particles alive at once; bursts beyond it are cut
+                short
+            width: Screen width in pixels
+            height: Screen height in pixels
+            seed: Seed for the particles' random generator
+        """
+        self.capacity = capacity
+        self.width = width
+        self.height = height
+        self.storage = Archetype(_COMPONENTS, capacity, dtype=np.float32)
+        self.rng = np.random.default_rng(seed)
+        self.dropped = 0  # particles that found no free slot
+
+    def count(self) -> int:
+        """Get the number of live particles."""
+        return self.storage.count()
+
+    def clear(self) -> None:
+        """Remove every particle."""
+        self.storage.active[:] = False
+
+    def copy(self) -> "ParticleSystem":
+        """Get a copy that later updates cannot change, e.g. for drawing."""
+        clone = ParticleSystem.__new__(ParticleSystem)
+        clone.__dict__.update(self.__dict__)
+        clone.storage = self.storage.copy()
+        return clone
+
+    def burst(
+        self,
+        x: float,
+        y: float,
+        count: int,
+        color: tuple[int, int, int],
+        speed: float = 3.0,
+    ) -> int:
+        """Spawn particles flying out from a point in every direction.
+
+        Args:
+            x: X coordinate of the point
+            y: Y coordinate of the point
+            count: Particles to spawn
+            color: Starting color; each particle's brightness varies a little
+            speed: Fastest speed of a particle, in pixels per tick
+
+        Returns:
+            The number of particles spawned
+        """
+        storage = self.storage
+        slots = np.flatnonzero(~storage.active)[:count]
+        spawned = len(slots)
+        self.dropped += count - spawned
+        if spawned == 0:
+            return 0
+
+        rng = self.rng
+        angle = rng.uniform(0, 2 * np.pi, spawned)
+        velocity = rng.uniform(0.2, 1.0, spawned) * speed
+        brightness = rng.uniform(0.7, 1.0, spawned)
+        storage["x"][slots] = x
+        storage["y"][slots] = y
+        storage["vx"][slots] = np.cos(angle) * velocity
+        storage["vy"][slots] = np.sin(angle) * velocity
+        storage["ttl"][slots] = rng.integers(*LIFETIME, spawned, endpoint=True)
+        for column, value in zip(("r", "g", "b"), color):
+            storage[column][slots] = value * brightness
+        storage.active[slots] = True
+        storage.generation[slots] += 1
+        storage.spawns += spawned
+        return spawned
+
+    def update(self) -> None:
+        """Move, fade and age every particle, and cull the expired ones.
+
+        Inactive slots are updated along with the live ones, since whole-array
+        operations are faster than selecting the live slots first.
+        """
+        storage = self.storage
+        active = storage.active
+        if not active.any():
+            return
+
+        x, y = storage["x"], storage["y"]
+        vy, ttl = storage["vy"], storage["ttl"]
+        x += storage["vx"]
+        y += vy
+        vy += GRAVITY
+        ttl -= 1
+        for column in ("r", "g", "b"):
+            channel = storage[column]
+            channel *= FADE
+
+        active &= ttl > 0
+        active &= (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw every live particle in one pass over the surface's pixels.
+
+        Particles touching the right or bottom edge are drawn just inside it.
+
+        Args:
+            surface: A 32-bit surface, such as the display surface
+
+        Raises:
+            ValueError: If the surface does not have 32-bit pixels
+        """
+        if surface.get_bytesize() != 4:
+            raise ValueError("Particles can only be drawn on 32-bit surfaces")
+        storage = self.storage
+        live = np.flatnonzero(storage.active)
+        if len(live) == 0:
+            return
+
+        # Pixel values in the surface's format, for every live particle
+        r_shift, g_shift, b_shift, _ = surface.get_shifts()
+        alpha_mask = surface.get_masks()[3]
+        colors = (
+            (storage["r"][live].astype(np.uint32) << r_shift)
+            | (storage["g"][live].astype(np.uint32) << g_shift)
+            | (storage["b"][live].astype(np.uint32) << b_shift)
+            | np.uint32(alpha_mask)
+        )
+
+        # Index of each particle's top left pixel in the flat pixel buffer,
+        # which is much faster to scatter into than a 2D pixel array
+        width, height = surface.get_size()
+        pitch = surface.get_pitch() // 4
+        left = np.clip(storage["x"][live], 0, width - PARTICLE_SIZE).astype(np.intp)
+        top = np.clip(storage["y"][live], 0, height - PARTICLE_SIZE).astype(np.intp)
+        corners = left + top * pitch
+
+        buffer = surface.get_buffer()  # Locks the surface until released
+        pixels = np.frombuffer(buffer, dtype=np.uint32)
+        for dy in range(PARTICLE_SIZE):
+            for dx in range(PARTICLE_SIZE):
+                pixels[corners + (dx + dy * pitch)] = colors
+        del pixels, buffer
@@ -0,0 +1,307 @@
+"""Lookahead planning bot that drives games deep for testing and profiling.
+
+The bot plans with a beam search over player actions. Every node of the
+search is a snapshot of a headless game that has been simulated a few ticks
+further with one action held. Each level of the search keeps the most
+promising nodes by score and survival, and the bot takes the first action of
+the best plan it finds within its time budget. Simulating nodes dominates the
+cost, so nodes expanded per second is a direct measure of simulation
+throughput.
+
+Snapshots carry the game's random stream, so search nodes draw invader fire
+from a copy of it and the bot foresees exactly which invaders will shoot. That
+makes it stronger than a human, which suits its job of reaching late-game
+states.
+
+    uv run python -m pyginvaders.planner --ticks 3600 --budget-ms 8
+"""
+
+import argparse
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pygame
+
+from pyginvaders.config import DEFAULT_CONFIG, Config, get_profile
+from pyginvaders.game import Game
+from pyginvaders.scenario import TickInput
+
+# Actions searched at every node, as (left, right, fire)
+ACTIONS: tuple[TickInput, ...] = (
+    (False, False, False),
+    (True, False, False),
+    (False, True, False),
+    (False, False, True),
+    (True, False, True),
+    (False, True, True),
+)
+
+# Node values for the end of a game, beyond any score reachable in a plan
+LOSS_VALUE = -1_000_000.0
+WIN_BONUS = 100_000.0
+# Kill scores credited for each player bullet lined up with an invader, and
+# debited for each invader bullet falling onto the player
+LINED_UP_WEIGHT = 0.5
+DANGER_WEIGHT = 4.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Node:
+    """A search node: a simulated state and the action that started its plan."""
+
+    snapshot: bytes
+    first_action: TickInput
+    value: float
+    finished: bool
+
+
+class Planner:
+    """Chooses player actions by beam search on a private headless game."""
+
+    def __init__(
+        self,
+        config: Config = DEFAULT_CONFIG,
+        budget_ms: float = 10.0,
+        depth: int = 4,
+        beam_width: int = 6,
+        action_ticks: int = 4,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            config: Settings of the games it will plan for
+            budget_ms: Time allowed for one decision; the first level of the
+                search is always completed
+            depth: Most actions in a plan
+            beam_width: Nodes kept at each level of the search
+            action_ticks: Ticks each action of a plan is held for
+        """
+        self.budget_ms = budget_ms
+        self.depth = depth
+        self.beam_width = beam_width
+        self.action_ticks = action_ticks
+        self.sim = Game(config, headless=True)
+
+        self.decisions = 0
+        self.nodes_expanded = 0
+        self.search_seconds = 0.0
+        self.depth_reached = 0  # summed over decisions
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Nodes expanded per second of searching."""
+        if self.search_seconds == 0:
+            return 0.0
+        return self.nodes_expanded / self.search_seconds
+
+    @property
+    def mean_depth(self) -> float:
+        """Mean number of search levels completed per decision."""
+        if self.decisions == 0:
+            return 0.0
+        return self.depth_reached / self.decisions
+
+    def decide(self, game: Game) -> TickInput:
+        """Plan ahead from a game's state and choose the next action.
+
+        The game itself is left untouched, including its random stream.
+
+        Args:
+            game: The game to act in
+
+        Returns:
+            The action to hold for the next action_ticks ticks
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000
+        root = game.snapshot()
+
+        beam = [_Node(root, ACTIONS[0], 0.0, False)]
+        best = beam[0]
+        for level in range(self.depth):
+            children = []
+            for node in beam:
+                for action in ACTIONS:
+                    first = action if level == 0 else node.first_action
+                    children.append(self._expand(node.snapshot, action, first))
+                if level > 0 and time.perf_counter() > deadline:
+                    break
+
+            children.sort(key=lambda child: child.value, reverse=True)
+            best = children[0]
+            self.depth_reached += 1
+            beam = [
+                child for child in children[: self.beam_width] if not child.finished
+            ]
+            if not beam or time.perf_counter() > deadline:
+                break
+
+        self.decisions += 1
+        self.search_seconds += time.perf_counter() - start
+        return best.first_action
+
+    def _expand(self, snapshot: bytes, action: TickInput, first: TickInput) -> _Node:
+        """Simulate an action held from a state and evaluate the result."""
+        sim = self.sim
+        sim.restore(snapshot)
+        left, right, fire = action
+        for _ in range(self.action_ticks):
+            sim.step(left, right, fire)
+        self.nodes_expanded += 1
+        finished = sim.game_lost or sim.player_won
+        return _Node(sim.snapshot(), first, self._evaluate(sim), finished)
+
+    def _evaluate(self, sim: Game) -> float:
+        """Value a state by score and survival.
+
+        Beyond the score, a state gains for player bullets on their way to an
+        invader and loses for invader bullets falling towards the player, so
+        plans are judged by what will happen shortly after they end.
+        """
+        if sim.game_lost:
+            return LOSS_VALUE
+        value = float(sim.score)
+        if sim.player_won:
+            return value + WIN_BONUS
+
+        config = sim.config
+        kill_score = config.kill_score
+
+        # Player bullets lined up with an invader with a clear line of fire
+        bullets = sim.world["player_bullets"]
+        centers = bullets["x"][bullets.active] + config.player_bullet_width // 2
+        for invader in sim.formation.shooters():
+            lined_up = (centers >= invader.x) & (
+                centers < invader.x + config.invader_width
+            )
+            value += LINED_UP_WEIGHT * kill_score * int(np.count_nonzero(lined_up))
+
+        # Invader bullets falling onto the player, weighted by how long the
+        # player needs to get out of the way compared to how long it has
+        player = sim.player
+        bullets = sim.world["invader_bullets"]
+        active = bullets.active
+        x, y = bullets["x"][active], bullets["y"][active]
+        width, height = bullets["width"][active], bullets["height"][active]
+        incoming = (
+            (x < player.x + config.player_width)
+            & (x + width > player.x)
+            & (y < player.y + config.player_height)
+        )
+        if incoming.any():
+            x, y = x[incoming], y[incoming]
+            width, height = width[incoming], height[incoming]
+            escape = (
+                np.minimum(player.x + config.player_width - x, x + width - player.x)
+                / config.player_speed
+            )
+            impact = np.maximum(
+                (player.y - y - height) / config.invader_bullet_speed, 1
+            )
+            value -= DANGER_WEIGHT * kill_score * float((escape / impact).sum())
+
+        # Prefer standing under the nearest invader, to break ties between
+        # plans that are otherwise equal
+        player_center = player.x + config.player_width / 2
+        nearest = min(
+            abs(invader.x + config.invader_width / 2 - player_center)
+            for invader in sim.invaders
+        )
+        return value - nearest / config.screen_width
+
+
+@dataclass(frozen=True)
+class BotRun:
+    """Outcome of a game driven by the planner."""
+
+    ticks: int
+    score: int
+    waves_cleared: int
+    lost: bool
+    nodes_per_second: float
+    mean_depth: float
+
+
+def play(planner: Planner, game: Game, ticks: int) -> BotRun:
+    """Drive a game with the planner, starting a new wave after every win.
+
+    Args:
+        planner: Planner for the game's settings
+        game: The game to play, usually headless
+        ticks: Most ticks to play
+
+    Returns:
+        How far the bot got
+    """
+    waves_cleared = 0
+    tick = 0
+    while tick < ticks and not game.game_lost:
+        left, right, fire = planner.decide(game)
+        for _ in range(min(planner.action_ticks, ticks - tick)):
+            game.step(left, right, fire)
+            tick += 1
+        if game.player_won:
+            waves_cleared += 1
+            score = game.score
+            game.reset_game()
+            game.score = score
+
+    return BotRun(
+        ticks=tick,
+        score=game.score,
+        waves_cleared=waves_cleared,
+        lost=game.game_lost,
+        nodes_per_second=planner.nodes_per_second,
+        mean_depth=planner.mean_depth,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the planning bot from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", default="default", help="config profile")
+    parser.add_argument("--ticks", type=int, default=3600, help="most ticks to play")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument(
+        "--budget-ms", type=float, default=10.0, help="time per decision"
+    )
+    parser.add_argument("--depth", type=int, default=4, help="most actions per plan")
+    parser.add_argument("--beam-width", type=int, default=6, help="nodes per level")
+    parser.add_argument(
+        "--action-ticks", type=int, default=4, help="ticks each action is held"
+    )
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    config = get_profile(args.profile)
+    game = Game(config, headless=True, seed=args.seed)
+    planner = Planner(
+        config,
+        budget_ms=args.budget_ms,
+        depth=args.depth,
+        beam_width=args.beam_width,
+        action_ticks=args.action_ticks,
+    )
+
+    start = time.perf_counter()
+    run = play(planner, game, args.ticks)
+    elapsed = time.perf_counter() - start
+    outcome = "lost" if run.lost else "alive"
+    print(
+        f"{run.ticks} ticks, score {run.score}, "
+        f"{run.waves_cleared} waves cleared, {outcome}"
+    )
+    print(
+        f"{planner.nodes_expanded} nodes in {planner.decisions} decisions: "
+        f"{run.nodes_per_second:.0f} nodes/s, mean depth {run.mean_depth:.1f}, "
+        f"{planner.nodes_expanded * planner.action_ticks / elapsed:.0f} "
+        "simulated ticks/s"
+    )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
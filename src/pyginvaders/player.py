@@ -2,22 +2,24 @@
 
 import pygame
 
-from pyginvaders.config import (
-    PLAYER_COLOR,
-    PLAYER_HEIGHT,
-    PLAYER_SPEED,
-    PLAYER_WIDTH,
-    SCREEN_WIDTH,
-)
+from pyginvaders.config import DEFAULT_CONFIG, Config
 from pyginvaders.game_object import GameObject
+from pyginvaders.sprites import SpriteAtlas
 
 
 class Player(GameObject):
     """Represents the player's ship."""
 
-    def __init__(self, x: int, y: int) -> None:
-        """Initialize the player at the given position."""
+    def __init__(self, x: int, y: int, config: Config = DEFAULT_CONFIG) -> None:
+        """Initialize the player at the given position.
+
+        Args:
+            x: X coordinate of the player
+            y: Y coordinate of the player
+            config: Game settings
+        """
         super().__init__(x, y)
+        self.config = config
 
     def get_rectangle(self) -> tuple[int, int, int, int]:
         """Get the player's bounding rectangle.
@@ -25,25 +27,34 @@ class Player(GameObject):
         Returns:
             A tuple of (x, y, width, height)
         """
-        return (self.x, self.y, PLAYER_WIDTH, PLAYER_HEIGHT)
+        return (self.x, self.y, self.config.player_width, self.config.player_height)
 
     def move_left(self) -> None:
         """Move the player left."""
-        self.x -= PLAYER_SPEED
+        self.x -= self.config.player_speed
 
     def move_right(self) -> None:
         """Move the player right."""
-        self.x += PLAYER_SPEED
+        self.x += self.config.player_speed
 
     def clamp_to_bounds(self) -> None:
         """Keep player within screen bounds."""
+        max_x = self.config.screen_width - self.config.player_width
         if self.x < 0:
             self.x = 0
-        elif self.x + PLAYER_WIDTH > SCREEN_WIDTH:
-            self.x = SCREEN_WIDTH - PLAYER_WIDTH
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the player on the screen."""
-        pygame.draw.rect(
-            screen, PLAYER_COLOR, (self.x, self.y, PLAYER_WIDTH, PLAYER_HEIGHT)
-        )
+        elif self.x > max_x:
+            self.x = max_x
+
+    def draw(self, screen: pygame.Surface, sprites: SpriteAtlas | None = None) -> None:
+        """Draw the player on the screen.
+
+        Args:
+            screen: The pygame surface to draw on
+            sprites: Atlas with the player's artwork; without one the player
+                is drawn as a rectangle
+        """
+        sprite = sprites.frame("player") if sprites is not None else None
+        if sprite is None:
+            pygame.draw.rect(screen, self.config.player_color, self.get_rectangle())
+        else:
+            screen.blit(sprite, (self.x, self.y))
@@ -1,39 +1,33 @@
 """PlayerBullet module for managing player projectiles."""
 
-import pygame
-
-from pyginvaders.bullet import Bullet
-from pyginvaders.config import (
-    PLAYER_BULLET_COLOR,
-    PLAYER_BULLET_HEIGHT,
-    PLAYER_BULLET_SPEED,
-    PLAYER_BULLET_WIDTH,
-)
+from pyginvaders.bullet import Bullet, BulletSettings
+from pyginvaders.config import Config
+from pyginvaders.ecs import TEAM_PLAYER
 
 
 class PlayerBullet(Bullet):
     """Represents a bullet fired by the player."""
 
-    def get_rectangle(self) -> tuple[int, int, int, int]:
-        """Get the bullet's bounding rectangle.
+    TEAM = TEAM_PLAYER
+
+    @classmethod
+    def get_settings(cls, config: Config) -> BulletSettings:
+        """Get the size, speed and color of player bullets.
+
+        Returns:
+            A tuple of (width, height, speed, color)
+        """
+        return (
+            config.player_bullet_width,
+            config.player_bullet_height,
+            config.player_bullet_speed,
+            config.player_bullet_color,
+        )
+
+    def is_off_screen(self) -> bool:
+        """Check if the bullet has left the top of the screen.
 
         Returns:
-            A tuple of (x, y, width, height)
+            True if the bullet is above the screen, False otherwise
         """
-        return (self.x, self.y, PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT)
-
-    def update(self) -> None:
-        """Update bullet position and deactivate if off screen."""
-        if self.active:
-            self.y += PLAYER_BULLET_SPEED
-            if self.y < 0:
-                self.deactivate()
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the bullet on the screen if active."""
-        if self.active:
-            pygame.draw.rect(
-                screen,
-                PLAYER_BULLET_COLOR,
-                (self.x, self.y, PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT),
-            )
+        return self.y < 0
@@ -0,0 +1,343 @@
+"""Render backends that turn the game's scenes into pixels.
+
+The game draws through a small set of operations on a backend. The surface
+backend draws with software surface operations onto the display surface, as
+the game always has. The texture backend uploads each sprite once as a
+Texture and draws it with Renderer copies, which scales better at high
+resolutions. It uses a GPU renderer where there is one and falls back to
+SDL's software renderer where there is not.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Literal
+
+import pygame
+from pygame._sdl2.video import Renderer, Texture
+
+from pyginvaders.config import Config
+from pyginvaders.ecs import World, render_system, visible_entities
+from pyginvaders.invader import Invader
+from pyginvaders.particles import ParticleSystem
+from pyginvaders.player import Player
+from pyginvaders.shield import Shield
+from pyginvaders.sprites import BULLET_ANIMATION_PIXELS, SpriteAtlas
+
+RenderBackendName = Literal["surface", "texture"]
+RENDER_BACKENDS: tuple[RenderBackendName, ...] = ("surface", "texture")
+
+Color = Sequence[int]
+RectLike = pygame.Rect | Sequence[int]
+
+# Text textures kept before the cache is emptied; the score text changes rarely
+_MAX_TEXT_TEXTURES = 16
+
+
+class RenderBackend(ABC):
+    """Draws scenes and presents them."""
+
+    # Whether the backend may draw on a thread other than the one it was
+    # created on
+    thread_safe = True
+    # Artwork for the entities; without it they are drawn as rectangles
+    sprites: SpriteAtlas | None = None
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Fill the frame with black."""
+
+    @abstractmethod
+    def draw_rect(self, color: Color, rect: RectLike) -> None:
+        """Draw a filled rectangle.
+
+        Args:
+            color: Color as (r, g, b)
+            rect: Rectangle as (x, y, width, height)
+        """
+
+    @abstractmethod
+    def draw_text(self, text: pygame.Surface, rect: RectLike) -> None:
+        """Draw rendered text.
+
+        Args:
+            text: The text, as rendered by a font
+            rect: Where to draw it; only the top left is used
+        """
+
+    @abstractmethod
+    def draw_sprite(self, sprite: pygame.Surface, position: Sequence[int]) -> None:
+        """Draw a sprite from the atlas.
+
+        Args:
+            sprite: A frame of the sprite atlas
+            position: Where to draw its top left
+        """
+
+    @abstractmethod
+    def draw_shields(self, shields: Sequence[Shield], translucent: bool) -> None:
+        """Draw shields with their eroded pixels left out.
+
+        Args:
+            shields: The shields
+            translucent: Whether damage makes shields more transparent
+        """
+
+    def draw_invaders(self, invaders: Sequence[Invader]) -> None:
+        """Draw invaders."""
+        for invader in invaders:
+            sprite = None
+            if self.sprites is not None:
+                sprite = self.sprites.frame("invaders", invader.animation_step())
+            if sprite is None:
+                self.draw_rect(invader.config.invader_color, invader.get_rectangle())
+            else:
+                self.draw_sprite(sprite, (invader.x, invader.y))
+
+    def draw_player(self, player: Player) -> None:
+        """Draw the player's ship."""
+        sprite = self.sprites.frame("player") if self.sprites is not None else None
+        if sprite is None:
+            self.draw_rect(player.config.player_color, player.get_rectangle())
+        else:
+            self.draw_sprite(sprite, (player.x, player.y))
+
+    def sprite_for(self, name: str, rect: Sequence[int]) -> pygame.Surface | None:
+        """Get the sprite frame of an ECS entity, if the atlas has one.
+
+        Args:
+            name: Name of the entity's archetype
+            rect: The entity's rectangle; its y coordinate picks the animation frame
+
+        Returns:
+            The frame, or None to draw the entity as a rectangle
+        """
+        if self.sprites is None:
+            return None
+        return self.sprites.frame(name, rect[1] // BULLET_ANIMATION_PIXELS)
+
+    def draw_world(self, world: World) -> None:
+        """Draw bullets and any other ECS entities."""
+        for name, color, rect in visible_entities(world):
+            sprite = self.sprite_for(name, rect)
+            if sprite is None:
+                self.draw_rect(color, rect)
+            else:
+                self.draw_sprite(sprite, rect)
+
+    @abstractmethod
+    def draw_particles(self, particles: ParticleSystem) -> None:
+        """Draw every live particle in one batch.
+
+        Args:
+            particles: The particles
+        """
+
+    @abstractmethod
+    def present(self) -> None:
+        """Show the drawn frame."""
+
+    @abstractmethod
+    def read_frame(self) -> pygame.Surface:
+        """Get the drawn frame as a surface.
+
+        Returns:
+            The frame; callers must not draw on it
+        """
+
+
+class SurfaceBackend(RenderBackend):
+    """Draws with software surface operations onto one surface."""
+
+    def __init__(self, screen: pygame.Surface, flip: bool = True) -> None:
+        """Initialize the backend.
+
+        Args:
+            screen: Surface to draw on, usually the display surface
+            flip: Flip the display when presenting; off for offscreen surfaces
+        """
+        self.screen = screen
+        self.flip = flip
+
+    def clear(self) -> None:
+        """Fill the frame with black."""
+        self.screen.fill((0, 0, 0))
+
+    def draw_rect(self, color: Color, rect: RectLike) -> None:
+        """Draw a filled rectangle."""
+        pygame.draw.rect(self.screen, color, rect)
+
+    def draw_text(self, text: pygame.Surface, rect: RectLike) -> None:
+        """Draw rendered text."""
+        self.screen.blit(text, rect)
+
+    def draw_sprite(self, sprite: pygame.Surface, position: Sequence[int]) -> None:
+        """Draw a sprite from the atlas."""
+        self.screen.blit(sprite, (position[0], position[1]))
+
+    def draw_invaders(self, invaders: Sequence[Invader]) -> None:
+        """Draw invaders."""
+        for invader in invaders:
+            invader.draw(self.screen, self.sprites)
+
+    def draw_shields(self, shields: Sequence[Shield], translucent: bool) -> None:
+        """Draw shields with their eroded pixels left out."""
+        for shield in shields:
+            shield.draw(self.screen, translucent)
+
+    def draw_player(self, player: Player) -> None:
+        """Draw the player's ship."""
+        player.draw(self.screen, self.sprites)
+
+    def draw_world(self, world: World) -> None:
+        """Draw bullets and any other ECS entities."""
+        render_system(world, self.screen, self.sprite_for)
+
+    def draw_particles(self, particles: ParticleSystem) -> None:
+        """Draw every live particle straight into the surface's pixels."""
+        particles.draw(self.screen)
+
+    def present(self) -> None:
+        """Show the drawn frame."""
+        if self.flip:
+            pygame.display.flip()
+
+    def read_frame(self) -> pygame.Surface:
+        """Get the drawn frame, which is the surface drawn on."""
+        return self.screen
+
+
+class TextureBackend(RenderBackend):
+    """Draws sprites uploaded once as textures through an SDL renderer."""
+
+    # SDL renderers must be used from the thread that created them
+    thread_safe = False
+
+    def __init__(self, config: Config, title: str = "PygInvaders") -> None:
+        """Open a window with a renderer.
+
+        Args:
+            config: Game settings
+            title: Window title
+        """
+        size = (config.screen_width, config.screen_height)
+        self.window = pygame.Window(title, size)
+        try:
+            self.renderer = Renderer(self.window, accelerated=1)
+            self.accelerated = True
+        except RuntimeError:
+            # No GPU renderer, e.g. on a headless server
+            self.renderer = Renderer(self.window, accelerated=0)
+            self.accelerated = False
+
+        # Solid sprites keyed by (width, height, color)
+        self._sprites: dict[tuple[int, int, tuple[int, ...]], Texture] = {}
+        # Shield textures keyed by position, with the shield revision they show
+        self._shields: dict[tuple[int, int], tuple[int, Texture]] = {}
+        # Text textures keyed by the id of their surface, which is kept alive
+        self._texts: dict[int, tuple[pygame.Surface, Texture]] = {}
+        # Atlas frame textures keyed the same way; an atlas has few frames
+        self._sprite_textures: dict[int, tuple[pygame.Surface, Texture]] = {}
+        # Transparent layer the particles are drawn on, uploaded once a frame
+        self._particle_layer: tuple[pygame.Surface, Texture] | None = None
+
+    def clear(self) -> None:
+        """Fill the frame with black."""
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+    def draw_rect(self, color: Color, rect: RectLike) -> None:
+        """Draw a filled rectangle as a copy of a solid sprite."""
+        x, y, width, height = rect
+        key = (width, height, tuple(color))
+        texture = self._sprites.get(key)
+        if texture is None:
+            sprite = pygame.Surface((width, height))
+            sprite.fill(color)
+            texture = Texture.from_surface(self.renderer, sprite)
+            self._sprites[key] = texture
+        texture.draw(dstrect=(x, y, width, height))
+
+    def draw_text(self, text: pygame.Surface, rect: RectLike) -> None:
+        """Draw rendered text, uploading it the first time it is drawn."""
+        cached = self._texts.get(id(text))
+        if cached is None or cached[0] is not text:
+            if len(self._texts) >= _MAX_TEXT_TEXTURES:
+                self._texts.clear()
+            cached = (text, Texture.from_surface(self.renderer, text))
+            self._texts[id(text)] = cached
+        x, y = rect[0], rect[1]
+        cached[1].draw(dstrect=(x, y, text.get_width(), text.get_height()))
+
+    def draw_sprite(self, sprite: pygame.Surface, position: Sequence[int]) -> None:
+        """Draw a sprite from the atlas, uploading it the first time it is drawn."""
+        cached = self._sprite_textures.get(id(sprite))
+        if cached is None or cached[0] is not sprite:
+            cached = (sprite, Texture.from_surface(self.renderer, sprite))
+            self._sprite_textures[id(sprite)] = cached
+        x, y = position[0], position[1]
+        cached[1].draw(dstrect=(x, y, sprite.get_width(), sprite.get_height()))
+
+    def draw_shields(self, shields: Sequence[Shield], translucent: bool) -> None:
+        """Draw shields, uploading their pixels again only after erosion."""
+        for shield in shields:
+            cached = self._shields.get((shield.x, shield.y))
+            if cached is None or cached[0] != shield.revision:
+                cached = (shield.revision, self._upload_shield(shield))
+                self._shields[(shield.x, shield.y)] = cached
+            texture = cached[1]
+            texture.alpha = shield.alpha(translucent)
+            texture.draw(dstrect=shield.get_rectangle())
+
+    def _upload_shield(self, shield: Shield) -> Texture:
+        """Upload a shield's intact pixels as an opaque texture."""
+        surface = pygame.Surface(shield.intact.shape[::-1], pygame.SRCALPHA)
+        surface.fill(shield.config.shield_color)
+        pygame.surfarray.pixels_alpha(surface)[:] = shield.intact.T * 255
+        return Texture.from_surface(self.renderer, surface)
+
+    def draw_particles(self, particles: ParticleSystem) -> None:
+        """Draw the particles on a layer and upload it as one texture."""
+        if particles.count() == 0:
+            return
+        if self._particle_layer is None:
+            size = self.window.size
+            layer = pygame.Surface(size, pygame.SRCALPHA)
+            texture = Texture(self.renderer, size, streaming=True)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            self._particle_layer = (layer, texture)
+        layer, texture = self._particle_layer
+        layer.fill((0, 0, 0, 0))
+        particles.draw(layer)
+        texture.update(layer)
+        texture.draw()
+
+    def present(self) -> None:
+        """Show the drawn frame."""
+        self.renderer.present()
+
+    def read_frame(self) -> pygame.Surface:
+        """Read the drawn frame back from the renderer, which is slow."""
+        return self.renderer.to_surface()
+
+
+def create_backend(name: str, config: Config) -> RenderBackend:
+    """Open the display with a render backend chosen by name.
+
+    Args:
+        name: One of RENDER_BACKENDS
+        config: Game settings
+
+    Returns:
+        The backend
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name == "surface":
+        size = (config.screen_width, config.screen_height)
+        screen = pygame.display.set_mode(size)
+        pygame.display.set_caption("PygInvaders")
+        return SurfaceBackend(screen)
+    if name == "texture":
+        return TextureBackend(config)
+    raise ValueError(f"Unknown render backend {name!r}; choose from {RENDER_BACKENDS}")
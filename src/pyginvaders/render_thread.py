@@ -0,0 +1,125 @@
+"""Render thread for drawing frames concurrently with the simulation.
+
+The simulation captures an immutable RenderState after each tick and submits
+it; the render thread draws and presents the previous state meanwhile. At most
+one state waits while another is being drawn, so the two threads work on
+separate buffers and the simulation never runs more than a frame ahead.
+"""
+
+import copy
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import pygame
+
+from pyginvaders.ecs import World
+from pyginvaders.invader import Invader
+from pyginvaders.particles import ParticleSystem
+from pyginvaders.player import Player
+from pyginvaders.shield import Shield
+
+
+@dataclass(frozen=True, slots=True)
+class RenderState:
+    """Everything needed to draw one frame."""
+
+    score: int
+    player: Player
+    invaders: Sequence[Invader]
+    shields: Sequence[Shield]
+    world: World  # bullets and other ECS entities
+    message: str | None = None  # game over or win message, if the game ended
+    particles: ParticleSystem | None = None  # effects, if the game has them
+
+    def copy(self) -> "RenderState":
+        """Get a copy that later simulation steps cannot change.
+
+        Returns:
+            A state with copies of every entity; shields that have not changed
+            since the last copy share it
+        """
+        return RenderState(
+            score=self.score,
+            player=copy.copy(self.player),
+            invaders=tuple(copy.copy(invader) for invader in self.invaders),
+            shields=tuple(copy.copy(shield) for shield in self.shields),
+            world=self.world.copy(),
+            message=self.message,
+            particles=self.particles.copy() if self.particles is not None else None,
+        )
+
+
+class RenderThread:
+    """Background thread that draws and presents submitted render states."""
+
+    def __init__(
+        self, draw: Callable[[RenderState], None], present: bool = True
+    ) -> None:
+        """Initialize the render thread without starting it.
+
+        Args:
+            draw: Function that draws a state onto the screen
+            present: Whether to flip the display after drawing
+        """
+        self.draw = draw
+        self.present = present
+        self.frames_drawn = 0
+        self.error: BaseException | None = None
+        self._pending: queue.Queue[RenderState | None] = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+
+    def start(self) -> None:
+        """Start drawing submitted states."""
+        self._thread.start()
+
+    def submit(self, state: RenderState) -> None:
+        """Hand a state to the render thread.
+
+        Blocks while a previous state is still waiting to be drawn.
+
+        Args:
+            state: A state the simulation will not change any more
+
+        Raises:
+            RuntimeError: If the render thread failed
+        """
+        while True:
+            self._check_error()
+            try:
+                self._pending.put(state, timeout=0.1)
+                return
+            except queue.Full:
+                continue  # Still drawing; check the thread is alive and wait again
+
+    def stop(self) -> None:
+        """Draw any pending state, then stop the thread.
+
+        Raises:
+            RuntimeError: If the render thread failed
+        """
+        if self._thread.is_alive():
+            self._pending.put(None)
+            self._thread.join()
+        self._check_error()
+
+    def _check_error(self) -> None:
+        """Re-raise a failure from the render thread on the caller's thread."""
+        if self.error is not None:
+            raise RuntimeError("Render thread failed") from self.error
+
+    def _run(self) -> None:
+        """Draw states until stopped."""
+        while True:
+            state = self._pending.get()
+            if state is None:
+                return
+            try:
+                self.draw(state)
+                if self.present:
+                    pygame.display.flip()
+            except BaseException as error:
+                self.error = error
+                return
+            self.frames_drawn += 1
@@ -0,0 +1,242 @@
+"""Scenario module for describing repeatable game setups.
+
+A scenario fixes the settings (entity counts, fire rates, ...) and a scripted
+input pattern of a game, so simulations and capacity tests can be rerun without editing
+config.py. Scenarios are stored as TOML files:
+
+    name = "default"
+    ticks = 3600
+    seed = 1
+    profile = "default"
+
+    [formation]
+    rows = 5
+    cols = 11
+
+    [pools]
+    player_bullets = 20
+    invader_bullets = 20
+
+    [shields]
+    count = 4
+    start_x = 150
+    spacing_x = 150
+    y = 450
+
+    [fire]
+    invader_shoot_delay = 60
+    invader_shoot_chance = 5
+
+    [input]
+    pattern = ["left 30", "left+fire", "right 60", "idle 10"]
+
+    [config]
+    invader_speed_x = 10
+
+The settings start from the named profile in config.PROFILES; the [config]
+table can override any other Config setting by name. Each input step is one or
+more actions (left, right, fire, idle) joined by "+", optionally followed by
+the number of ticks to hold them. The pattern repeats.
+"""
+
+import tomllib
+from collections.abc import Iterator
+from dataclasses import dataclass, fields, replace
+from itertools import cycle
+from pathlib import Path
+from typing import Any
+
+from pyginvaders.config import DEFAULT_CONFIG, Config, get_profile
+
+# Player input for one tick as (left, right, fire)
+TickInput = tuple[bool, bool, bool]
+
+INPUT_ACTIONS = ("left", "right", "fire", "idle")
+
+# Every setting a [config] table may override
+_CONFIG_FIELDS = frozenset(field.name for field in fields(Config))
+
+# TOML table -> {key in table: Config setting}
+_SECTIONS: dict[str, dict[str, str]] = {
+    "formation": {"rows": "invader_rows", "cols": "invader_cols"},
+    "pools": {
+        "player_bullets": "player_bullet_pool_size",
+        "invader_bullets": "invader_bullet_pool_size",
+    },
+    "shields": {
+        "count": "shield_start_count",
+        "start_x": "shield_start_x",
+        "spacing_x": "shield_spacing_x",
+        "y": "shield_start_y",
+    },
+    "fire": {
+        "invader_shoot_delay": "invader_shoot_delay",
+        "invader_shoot_chance": "invader_shoot_chance",
+    },
+    "config": {name: name for name in _CONFIG_FIELDS},
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Game settings and scripted input for a repeatable run."""
+
+    name: str = "default"
+    ticks: int = 3600  # length of a scripted run
+    seed: int = 1  # random seed for a scripted run
+    config: Config = DEFAULT_CONFIG
+    input_pattern: tuple[str, ...] = ("idle",)
+
+    def __post_init__(self) -> None:
+        """Validate the input pattern."""
+        parse_input_pattern(self.input_pattern)
+
+    def entity_count(self) -> int:
+        """Get the number of entities the scenario allocates.
+
+        Returns:
+            Invaders, bullet pool slots, shields and the player
+        """
+        config = self.config
+        return (
+            config.invader_rows * config.invader_cols
+            + config.player_bullet_pool_size
+            + config.invader_bullet_pool_size
+            + config.shield_start_count
+            + 1
+        )
+
+    def scaled(self, factor: int) -> "Scenario":
+        """Get a copy with the invaders and bullet pools multiplied.
+
+        The extra invaders are packed into the formation's original width and
+        height, so it stays on screen and its bottom row keeps shooting. They
+        go into more columns first, which multiplies the shooters along with
+        the bullet pools, and into more rows once the columns are 1 pixel
+        apart.
+
+        Args:
+            factor: Multiplier for the entity counts
+
+        Returns:
+            The scaled scenario
+        """
+        config = self.config
+        width = (config.invader_cols - 1) * config.invader_spacing_x
+        cols = min(config.invader_cols * factor, width + 1)
+        invaders = config.invader_rows * config.invader_cols * factor
+        rows = -(-invaders // cols)
+        height = (config.invader_rows - 1) * config.invader_spacing_y
+        return replace(
+            self,
+            name=f"{self.name} x{factor}",
+            config=config.with_overrides(
+                invader_rows=rows,
+                invader_cols=cols,
+                invader_spacing_x=_packed_spacing(
+                    width, cols, config.invader_spacing_x
+                ),
+                invader_spacing_y=_packed_spacing(
+                    height, rows, config.invader_spacing_y
+                ),
+                player_bullet_pool_size=config.player_bullet_pool_size * factor,
+                invader_bullet_pool_size=config.invader_bullet_pool_size * factor,
+            ),
+        )
+
+    def input_script(self) -> Iterator[TickInput]:
+        """Get the scripted input, repeating the pattern forever.
+
+        Returns:
+            An iterator of (left, right, fire) per tick
+        """
+        return cycle(parse_input_pattern(self.input_pattern))
+
+
+def _packed_spacing(span: int, count: int, spacing: int) -> int:
+    """Get the spacing that fits `count` rows or columns into `span` pixels.
+
+    A single row or column keeps its `spacing`, which then has no effect.
+    """
+    if count == 1:
+        return spacing
+    return max(1, span // (count - 1))
+
+
+def parse_input_pattern(pattern: tuple[str, ...]) -> list[TickInput]:
+    """Expand an input pattern into one input per tick.
+
+    Args:
+        pattern: Steps such as "left 30" or "right+fire"
+
+    Returns:
+        A list of (left, right, fire) per tick for one pass of the pattern
+
+    Raises:
+        ValueError: If a step is malformed or names an unknown action
+    """
+    inputs: list[TickInput] = []
+    for step in pattern:
+        parts = step.split()
+        if len(parts) not in (1, 2) or (len(parts) == 2 and not parts[1].isdigit()):
+            raise ValueError(f"Malformed input step: {step!r}")
+
+        actions = parts[0].split("+")
+        unknown = set(actions) - set(INPUT_ACTIONS)
+        if unknown:
+            raise ValueError(f"Unknown input action(s) in {step!r}: {sorted(unknown)}")
+
+        ticks = int(parts[1]) if len(parts) == 2 else 1
+        tick_input = ("left" in actions, "right" in actions, "fire" in actions)
+        inputs.extend([tick_input] * ticks)
+
+    if not inputs:
+        raise ValueError("Input pattern must cover at least one tick")
+    return inputs
+
+
+def load_scenario(path: str | Path) -> Scenario:
+    """Load a scenario from a TOML file.
+
+    Settings missing from the file keep their values from the scenario's
+    profile, which defaults to the settings in config.py.
+
+    Args:
+        path: Path to the TOML file
+
+    Returns:
+        The loaded scenario
+
+    Raises:
+        ValueError: If the file names an unknown profile, table or key
+    """
+    with open(path, "rb") as file:
+        data = tomllib.load(file)
+
+    scenario_fields: dict[str, Any] = {}
+    overrides: dict[str, Any] = {}
+    profile = "default"
+    for key, value in data.items():
+        if key in ("name", "ticks", "seed"):
+            scenario_fields[key] = value
+        elif key == "profile":
+            profile = value
+        elif key == "input" and isinstance(value, dict):
+            if set(value) - {"pattern"}:
+                raise ValueError(f"Unknown keys in input table of {path}")
+            scenario_fields["input_pattern"] = tuple(value.get("pattern", ("idle",)))
+        elif key in _SECTIONS and isinstance(value, dict):
+            for table_key, table_value in value.items():
+                if table_key not in _SECTIONS[key]:
+                    raise ValueError(f"Unknown key {key}.{table_key} in {path}")
+                overrides[_SECTIONS[key][table_key]] = _from_toml(table_value)
+        else:
+            raise ValueError(f"Unknown key {key} in {path}")
+
+    config = get_profile(profile, **overrides)
+    return Scenario(config=config, **scenario_fields)
+
+
+def _from_toml(value: Any) -> Any:
+    """Convert TOML arrays to tuples to match Config's colors and positions."""
+    return tuple(value) if isinstance(value, list) else value
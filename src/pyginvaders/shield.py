@@ -1,29 +1,69 @@
 """Shield module for managing defensive shields."""
 
+from functools import cache
+from itertools import count
+
+import numpy as np
 import pygame
 
-from pyginvaders.config import (
-    SHIELD_ALPHA_REDUCTION,
-    SHIELD_COLOR,
-    SHIELD_HEIGHT,
-    SHIELD_INITIAL_HEALTH,
-    SHIELD_WIDTH,
-)
+from pyginvaders.config import DEFAULT_CONFIG, Config
 from pyginvaders.game_object import GameObject
 
+# Source of revision numbers, unique across every shield
+_revisions = count()
+
 
 class Shield(GameObject):
-    """Represents a defensive shield that protects the player."""
+    """Represents a defensive shield that protects the player.
+
+    Each pixel of the shield is intact or eroded. Hits carve a crater out of
+    the shield and bullets pass through eroded pixels. The shield's surface is
+    kept up to date crater by crater, so drawing is a single blit.
+    """
 
-    def __init__(self, x: int, y: int) -> None:
+    def __init__(self, x: int, y: int, config: Config = DEFAULT_CONFIG) -> None:
         """Initialize the shield at the given position.
 
         Args:
             x: X coordinate of the shield
             y: Y coordinate of the shield
+            config: Game settings
         """
         super().__init__(x, y)
-        self.health = SHIELD_INITIAL_HEALTH
+        self.config = config
+        self.health = config.shield_initial_health
+        # Intact pixels, indexed by (row, column) from the top left
+        self.intact = np.ones((config.shield_height, config.shield_width), dtype=bool)
+        self.surface: pygame.Surface | None = None  # built on first draw
+        self.surface_alpha = 255  # alpha of the intact pixels of the surface
+        # Changes whenever the pixels do, so copies of the pixels can be reused
+        self.revision = next(_revisions)
+        # Last copy made, handed out again until the shield changes
+        self._copy: Shield | None = None
+
+    def __copy__(self) -> "Shield":
+        """Get a copy with its own pixels, so later erosion does not change it.
+
+        The same copy is returned again until the shield erodes or its health
+        changes, so copying a shield for every frame only copies its pixels
+        after hits. Copies are only meant to be drawn.
+        """
+        cached = self._copy
+        if (
+            cached is not None
+            and cached.revision == self.revision
+            and cached.health == self.health
+        ):
+            return cached
+
+        clone = Shield.__new__(Shield)
+        clone.__dict__.update(self.__dict__)
+        clone._copy = None
+        clone.intact = self.intact.copy()
+        if self.surface is not None:
+            clone.surface = self.surface.copy()
+        self._copy = clone
+        return clone
 
     def get_rectangle(self) -> tuple[int, int, int, int]:
         """Get the shield's bounding rectangle.
@@ -31,7 +71,7 @@ class Shield(GameObject):
         Returns:
             A tuple of (x, y, width, height)
         """
-        return (self.x, self.y, SHIELD_WIDTH, SHIELD_HEIGHT)
+        return (self.x, self.y, self.config.shield_width, self.config.shield_height)
 
     def take_damage(self) -> None:
         """Reduce shield health by 1 when hit by a bullet."""
@@ -45,25 +85,133 @@ class Shield(GameObject):
         """
         return self.health == 0
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def find_impact(
+        self, rect: tuple[int, int, int, int], dy: int
+    ) -> tuple[int, int] | None:
+        """Find where a moving rectangle first touches an intact pixel.
+
+        Args:
+            rect: The rectangle at the start of its move as (x, y, width, height)
+            dy: Vertical distance moved during the tick
+
+        Returns:
+            The screen position of the first intact pixel on the rectangle's
+            path, or None if it only passes through eroded pixels
+        """
+        x, y, width, height = rect
+        height_px, width_px = self.intact.shape
+        left = max(0, x - self.x)
+        right = min(width_px, x + width - self.x)
+        top = max(0, y + min(dy, 0) - self.y)
+        bottom = min(height_px, y + height + max(dy, 0) - self.y)
+        if left >= right or top >= bottom:
+            return None
+
+        rows = np.flatnonzero(self.intact[top:bottom, left:right].any(axis=1))
+        if len(rows) == 0:
+            return None
+
+        # The leading edge meets the nearest intact row first
+        row = top + int(rows[0] if dy >= 0 else rows[-1])
+        cols = np.flatnonzero(self.intact[row, left:right])
+        col = left + int(cols[len(cols) // 2])
+        return self.x + col, self.y + row
+
+    def erode(self, x: int, y: int) -> None:
+        """Carve a crater out of the shield.
+
+        Args:
+            x: Screen X coordinate of the crater's center
+            y: Screen Y coordinate of the crater's center
+        """
+        radius = self.config.shield_crater_radius
+        crater = _crater(radius)
+        height, width = self.intact.shape
+        top, left = y - self.y - radius, x - self.x - radius
+
+        # Clip the crater to the shield
+        rows = slice(max(0, top), min(height, top + crater.shape[0]))
+        cols = slice(max(0, left), min(width, left + crater.shape[1]))
+        if rows.start >= rows.stop or cols.start >= cols.stop:
+            return
+        self.intact[rows, cols] &= ~crater[
+            rows.start - top : rows.stop - top, cols.start - left : cols.stop - left
+        ]
+        self.revision = next(_revisions)
+
+        # Clear only the cratered part of the surface
+        if self.surface is not None:
+            self.surface.blit(
+                _crater_surface(radius),
+                (left, top),
+                special_flags=pygame.BLEND_RGBA_MULT,
+            )
+
+    def set_intact(self, intact: np.ndarray) -> None:
+        """Replace the shield's pixels, e.g. when restoring a saved state.
+
+        Args:
+            intact: Intact pixels with the shape of the shield
+        """
+        self.intact[:] = intact
+        self.revision = next(_revisions)
+        self.surface = None  # Rebuilt from the pixels on the next draw
+
+    def alpha(self, translucent: bool = True) -> int:
+        """Get the alpha of the intact pixels, which fades with damage.
+
+        Args:
+            translucent: Whether damage makes the shield more transparent
+
+        Returns:
+            The alpha, from 0 to 255
+        """
+        if not translucent:
+            return 255
+        config = self.config
+        damage_taken = config.shield_initial_health - self.health
+        alpha = 255 - (damage_taken * config.shield_alpha_reduction)
+        return max(0, min(255, alpha))  # Clamp to valid range
+
+    def draw(self, screen: pygame.Surface, translucent: bool = True) -> None:
         """Draw the shield on the screen with transparency based on health.
 
         Args:
             screen: The pygame surface to draw on
+            translucent: Whether damage makes the shield more transparent
         """
-        # Calculate alpha based on damage taken
-        damage_taken = SHIELD_INITIAL_HEALTH - self.health
-        alpha = 255 - (damage_taken * SHIELD_ALPHA_REDUCTION)
-        alpha = max(0, min(255, alpha))  # Clamp to valid range
-
-        # Create a surface with per-pixel alpha
-        shield_surface = pygame.Surface((SHIELD_WIDTH, SHIELD_HEIGHT), pygame.SRCALPHA)
-
-        # Draw rectangle on the surface with alpha
-        color_with_alpha = (*SHIELD_COLOR, alpha)
-        pygame.draw.rect(
-            shield_surface, color_with_alpha, (0, 0, SHIELD_WIDTH, SHIELD_HEIGHT)
-        )
-
-        # Blit the transparent surface to the screen
-        screen.blit(shield_surface, (self.x, self.y))
+        config = self.config
+        alpha = self.alpha(translucent)
+
+        if self.surface is None:
+            size = (config.shield_width, config.shield_height)
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+            self.surface.fill(config.shield_color)
+            self.surface_alpha = -1
+        if self.surface_alpha != alpha:
+            # Only hits change the alpha, so the surface is rarely redrawn
+            pygame.surfarray.pixels_alpha(self.surface)[:] = self.intact.T * alpha
+            self.surface_alpha = alpha
+
+        screen.blit(self.surface, (self.x, self.y))
+
+
+@cache
+def _crater(radius: int) -> np.ndarray:
+    """Get the pixels a hit erodes, centered in a square of side 2 * radius + 1."""
+    offsets = np.arange(-radius, radius + 1)
+    return offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius * radius
+
+
+@cache
+def _crater_surface(radius: int) -> pygame.Surface:
+    """Get a surface that clears a crater's pixels when multiplied in.
+
+    Pixels inside the crater have zero alpha and the rest are opaque white,
+    so a BLEND_RGBA_MULT blit leaves the rest of the shield alone.
+    """
+    crater = _crater(radius)
+    surface = pygame.Surface(crater.shape[::-1], pygame.SRCALPHA)
+    surface.fill((255, 255, 255, 255))
+    pygame.surfarray.pixels_alpha(surface)[crater.T] = 0
+    return surface
@@ -0,0 +1,476 @@
+"""Spectator streaming of a live game over asyncio TCP connections.
+
+The server captures the drawn state of the game once per frame - score, the
+player, the formation's alive mask and offset, the shields and every bullet
+slot - as a fixed-layout array of integers. Every keyframe_interval frames it
+sends the whole array as a keyframe, which spectators acknowledge; spectators
+joining in between are sent the newest keyframe rather than a new one. Other
+frames are sent as deltas: the indices and values that differ from the last
+keyframe the spectator acknowledged. Since a delta never depends on the frame
+before it, frames for a slow spectator can simply be dropped.
+
+Each spectator has a bounded queue of encoded frames; when it is full the
+oldest frame is dropped, so slow connections cannot stall the game loop.
+
+Serve a game, then watch it from other processes:
+
+    uv run python -m pyginvaders.spectate serve --port 7100
+    uv run python -m pyginvaders.spectate watch 127.0.0.1:7100
+
+Spectators must use the same settings as the game they watch.
+"""
+
+import argparse
+import asyncio
+import struct
+from dataclasses import dataclass, field
+
+import numpy as np
+import pygame
+
+from pyginvaders.game import Game
+
+KEYFRAME = 0
+DELTA = 1
+
+# Every message is prefixed by its length
+_LENGTH = struct.Struct("!I")
+# Frame header: kind, tick, tick of the keyframe a delta is based on, count
+_FRAME_HEADER = struct.Struct("!Biii")
+# Spectator acknowledgement of a keyframe tick
+_ACK = struct.Struct("!i")
+# Header fields: score, game over flags, player x, formation offset x and y
+_HEADER_FIELDS = 5
+_GAME_LOST = 1
+_PLAYER_WON = 2
+
+Address = tuple[str, int]
+
+
+def capture_frame(game: Game) -> np.ndarray:
+    """Capture what spectators need to draw a game.
+
+    Args:
+        game: The game to capture
+
+    Returns:
+        The header, then the alive flag of every invader of the starting
+        grid, the health of every shield of the starting row, the intact
+        pixels of each of those shields packed into words, and the active
+        flag, x and y of every slot of every ECS archetype
+    """
+    formation = game.formation
+    flags = (_GAME_LOST if game.game_lost else 0) | (
+        _PLAYER_WON if game.player_won else 0
+    )
+    alive = {id(invader) for invader in game.invaders}
+    values = [game.score, flags, game.player.x, formation.offset_x, formation.offset_y]
+    values.extend(id(invader) in alive for invader in game.all_invaders)
+    values.extend(shield.health for shield in game.all_shields)
+
+    parts = [np.array(values, dtype=np.int32)]
+    parts.extend(_pack_pixels(shield.intact) for shield in game.all_shields)
+    for archetype in game.world.archetypes.values():
+        parts.append(archetype.active.astype(np.int32))
+        parts.append(archetype["x"].astype(np.int32))
+        parts.append(archetype["y"].astype(np.int32))
+    return np.concatenate(parts)
+
+
+def apply_frame(game: Game, frame: np.ndarray) -> None:
+    """Make a game draw a captured frame.
+
+    Only the drawn state is updated; the game should not be stepped.
+
+    Args:
+        game: A game with the settings of the captured one
+        frame: An array from capture_frame
+    """
+    config = game.config
+    score, flags, player_x, offset_x, offset_y = frame[:_HEADER_FIELDS].tolist()
+    game.score = score
+    game.game_lost = bool(flags & _GAME_LOST)
+    game.player_won = bool(flags & _PLAYER_WON)
+    game.player.x = player_x
+    game.formation.offset_x, game.formation.offset_y = offset_x, offset_y
+
+    start = _HEADER_FIELDS
+    alive = frame[start : start + len(game.all_invaders)].tolist()
+    game.invaders = []
+    for invader, is_alive in zip(game.all_invaders, alive):
+        if is_alive:
+            invader.x = (
+                config.invader_start_x + invader.col * config.invader_spacing_x
+            ) + offset_x
+            invader.y = (
+                config.invader_start_y + invader.row * config.invader_spacing_y
+            ) + offset_y
+            game.invaders.append(invader)
+
+    start += len(game.all_invaders)
+    healths = frame[start : start + len(game.all_shields)].tolist()
+    game.shields = []
+    for shield, health in zip(game.all_shields, healths):
+        shield.health = health
+        if health > 0:
+            game.shields.append(shield)
+
+    start += len(game.all_shields)
+    for shield in game.all_shields:
+        words = (shield.intact.size + 31) // 32
+        intact = _unpack_pixels(frame[start : start + words], shield.intact.shape)
+        if not np.array_equal(shield.intact, intact):
+            shield.set_intact(intact)
+        start += words
+
+    for archetype in game.world.archetypes.values():
+        capacity = archetype.capacity
+        archetype.active[:] = frame[start : start + capacity] != 0
+        archetype["x"][:] = frame[start + capacity : start + 2 * capacity]
+        archetype["y"][:] = frame[start + 2 * capacity : start + 3 * capacity]
+        start += 3 * capacity
+
+
+def _pack_pixels(pixels: np.ndarray) -> np.ndarray:
+    """Pack a boolean array into int32 words, 32 pixels per word."""
+    packed = np.packbits(pixels)
+    padded = np.zeros(-(-len(packed) // 4) * 4, dtype=np.uint8)
+    padded[: len(packed)] = packed
+    return padded.view(np.int32)
+
+
+def _unpack_pixels(words: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    """Unpack a boolean array packed by _pack_pixels."""
+    packed = np.ascontiguousarray(words, dtype=np.int32).view(np.uint8)
+    size = int(np.prod(shape))
+    return np.unpackbits(packed, count=size).view(bool).reshape(shape)
+
+
+def encode_keyframe(tick: int, frame: np.ndarray) -> bytes:
+    """Encode a whole frame.
+
+    Returns:
+        The length-prefixed message
+    """
+    body = _FRAME_HEADER.pack(KEYFRAME, tick, tick, len(frame))
+    body += frame.astype(">i4").tobytes()
+    return _LENGTH.pack(len(body)) + body
+
+
+def encode_delta(
+    tick: int, base_tick: int, base: np.ndarray, frame: np.ndarray
+) -> bytes:
+    """Encode the values of a frame that differ from a keyframe.
+
+    Returns:
+        The length-prefixed message
+    """
+    changed = np.flatnonzero(frame != base)
+    body = _FRAME_HEADER.pack(DELTA, tick, base_tick, len(changed))
+    body += changed.astype(">u4").tobytes() + frame[changed].astype(">i4").tobytes()
+    return _LENGTH.pack(len(body)) + body
+
+
+@dataclass(eq=False)
+class _Spectator:
+    """Connection state of one spectator."""
+
+    writer: asyncio.StreamWriter
+    queue: asyncio.Queue[bytes]
+    acked_tick: int | None = None  # newest keyframe the spectator has
+    awaiting_tick: int | None = None  # newest keyframe sent to the spectator
+    tasks: list[asyncio.Task[None]] = field(default_factory=list)
+
+
+class SpectatorServer:
+    """Broadcasts the frames of a game to every connected spectator."""
+
+    def __init__(
+        self,
+        keyframe_interval: int = 60,
+        buffer_frames: int = 8,
+        keyframes_kept: int = 4,
+    ) -> None:
+        """Initialize the server without listening.
+
+        Args:
+            keyframe_interval: Frames between scheduled keyframes
+            buffer_frames: Most frames queued for one spectator
+            keyframes_kept: Keyframes kept for spectators to catch up to
+        """
+        self.keyframe_interval = keyframe_interval
+        self.buffer_frames = buffer_frames
+        self.keyframes_kept = keyframes_kept
+        self.spectators: set[_Spectator] = set()
+        self.keyframes: dict[int, np.ndarray] = {}
+        self.tick = 0
+        self.frames_dropped = 0
+        self.server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Address:
+        """Start accepting spectators.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free port
+
+        Returns:
+            The address the server listens on
+        """
+        self.server = await asyncio.start_server(self._serve, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self) -> None:
+        """Disconnect every spectator and stop listening."""
+        if self.server is not None:
+            self.server.close()
+        for spectator in list(self.spectators):
+            for task in spectator.tasks:
+                task.cancel()
+            spectator.writer.close()
+        self.spectators.clear()
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    def publish(self, game: Game) -> None:
+        """Queue the game's current frame for every spectator.
+
+        Never blocks: a spectator whose queue is full loses its oldest frame.
+
+        Args:
+            game: The game being watched
+        """
+        tick = self.tick
+        self.tick += 1
+        frame = capture_frame(game)
+        if tick % self.keyframe_interval == 0:
+            self._add_keyframe(tick, frame)
+
+        # Spectators sharing a base keyframe share one encoded message
+        messages: dict[int | None, bytes] = {}
+        for spectator in self.spectators:
+            base = spectator.acked_tick
+            if tick in self.keyframes or base not in self.keyframes:
+                awaiting = spectator.awaiting_tick
+                if (
+                    tick not in self.keyframes
+                    and awaiting in self.keyframes
+                    and tick - awaiting < self.keyframe_interval
+                ):
+                    continue  # Deltas are useless until a keyframe is acked
+                base = None
+                spectator.awaiting_tick = self._shared_keyframe(tick, frame)
+            if base not in messages:
+                if base is None:
+                    keyframe_tick = spectator.awaiting_tick
+                    messages[base] = encode_keyframe(
+                        keyframe_tick, self.keyframes[keyframe_tick]
+                    )
+                else:
+                    messages[base] = encode_delta(
+                        tick, base, self.keyframes[base], frame
+                    )
+            self._enqueue(spectator, messages[base])
+
+    def _shared_keyframe(self, tick: int, frame: np.ndarray) -> int:
+        """Pick the keyframe to send, adding one only if none is recent.
+
+        Spectators that join within one keyframe interval share a keyframe,
+        so a burst of joins cannot evict the keyframes that the deltas of
+        other spectators are based on.
+
+        Returns:
+            Tick of the keyframe
+        """
+        if self.keyframes:
+            latest = max(self.keyframes)
+            if tick - latest < self.keyframe_interval:
+                return latest
+        self._add_keyframe(tick, frame)
+        return tick
+
+    def _add_keyframe(self, tick: int, frame: np.ndarray) -> None:
+        """Keep a keyframe, forgetting the oldest beyond keyframes_kept."""
+        self.keyframes[tick] = frame
+        while len(self.keyframes) > self.keyframes_kept:
+            del self.keyframes[min(self.keyframes)]
+
+    def _enqueue(self, spectator: _Spectator, message: bytes) -> None:
+        """Queue a message, dropping the oldest one if the queue is full."""
+        if spectator.queue.full():
+            spectator.queue.get_nowait()
+            self.frames_dropped += 1
+        spectator.queue.put_nowait(message)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Stream frames to a spectator until it disconnects."""
+        spectator = _Spectator(writer, asyncio.Queue(self.buffer_frames))
+        spectator.tasks = [
+            asyncio.create_task(self._send(spectator)),
+            asyncio.create_task(self._receive_acks(spectator, reader)),
+        ]
+        self.spectators.add(spectator)
+        try:
+            await asyncio.wait(spectator.tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.spectators.discard(spectator)
+            for task in spectator.tasks:
+                task.cancel()
+            writer.close()
+
+    async def _send(self, spectator: _Spectator) -> None:
+        """Write queued frames to a spectator."""
+        try:
+            while True:
+                message = await spectator.queue.get()
+                spectator.writer.write(message)
+                await spectator.writer.drain()
+        except ConnectionError:
+            return
+
+    async def _receive_acks(
+        self, spectator: _Spectator, reader: asyncio.StreamReader
+    ) -> None:
+        """Record the keyframes a spectator acknowledges."""
+        try:
+            while True:
+                (tick,) = _ACK.unpack(await reader.readexactly(_ACK.size))
+                spectator.acked_tick = tick
+        except asyncio.IncompleteReadError:
+            return  # Spectator disconnected
+        except ConnectionError:
+            return
+
+
+class SpectatorClient:
+    """Receives frames from a SpectatorServer and applies them to a game."""
+
+    def __init__(self, game: Game, keyframes_kept: int = 8) -> None:
+        """Initialize a disconnected client.
+
+        Args:
+            game: Game with the server's settings to draw the frames with
+            keyframes_kept: Keyframes kept to decode deltas against
+        """
+        self.game = game
+        self.keyframes_kept = keyframes_kept
+        self.keyframes: dict[int, np.ndarray] = {}
+        self.tick = -1  # tick of the latest frame applied
+        self.frames_received = 0
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def connect(self, host: str, port: int) -> None:
+        """Connect to a server."""
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def receive(self) -> None:
+        """Receive one frame, apply it to the game and acknowledge keyframes.
+
+        Raises:
+            asyncio.IncompleteReadError: If the server disconnected
+            ValueError: If the frame does not match the game's settings
+        """
+        assert self.reader is not None and self.writer is not None
+        (length,) = _LENGTH.unpack(await self.reader.readexactly(_LENGTH.size))
+        tick, frame, keyframe = self.decode(await self.reader.readexactly(length))
+        if keyframe:
+            self.writer.write(_ACK.pack(tick))
+        apply_frame(self.game, frame)
+        self.tick = tick
+        self.frames_received += 1
+
+    def decode(self, body: bytes) -> tuple[int, np.ndarray, bool]:
+        """Decode a message without its length prefix.
+
+        Returns:
+            The frame's tick, its values, and whether it is a keyframe
+
+        Raises:
+            ValueError: If the frame does not match the game's settings or
+                its keyframe is unknown
+        """
+        kind, tick, base_tick, count = _FRAME_HEADER.unpack_from(body)
+        payload = body[_FRAME_HEADER.size :]
+        if kind == KEYFRAME:
+            frame = np.frombuffer(payload, ">i4", count).astype(np.int32)
+            if len(frame) != len(capture_frame(self.game)):
+                raise ValueError("Frame does not match the game's settings")
+            self.keyframes[tick] = frame
+            while len(self.keyframes) > self.keyframes_kept:
+                del self.keyframes[min(self.keyframes)]
+            return tick, frame, True
+
+        if base_tick not in self.keyframes:
+            raise ValueError(f"Delta against unknown keyframe {base_tick}")
+        indices = np.frombuffer(payload, ">u4", count)
+        values = np.frombuffer(payload, ">i4", count, 4 * count)
+        frame = self.keyframes[base_tick].copy()
+        frame[indices] = values
+        return tick, frame, False
+
+    async def close(self) -> None:
+        """Disconnect from the server."""
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+async def serve(host: str, port: int) -> None:
+    """Play a game locally while streaming it to spectators."""
+    game = Game()
+    server = SpectatorServer()
+    address = await server.start(host, port)
+    print(f"Serving spectators on {address[0]}:{address[1]}")
+    await game.run_async(on_frame=server.publish)
+    await server.close()
+
+
+async def watch(host: str, port: int) -> None:
+    """Watch a game streamed by a server until the window is closed."""
+    game = Game()
+    pygame.display.set_caption("PygInvaders spectator")
+    client = SpectatorClient(game)
+    await client.connect(host, port)
+
+    async def receive_frames() -> None:
+        while True:
+            await client.receive()
+
+    receiver = asyncio.create_task(receive_frames())
+    running = True
+    while running and not receiver.done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        game.draw_render_state(game.capture_render_state())
+        game.present()
+        await asyncio.sleep(1 / game.config.fps)
+
+    receiver.cancel()
+    await client.close()
+    pygame.quit()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve or watch a game from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="play and stream a game")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=7100)
+    watch_parser = commands.add_parser("watch", help="watch a streamed game")
+    watch_parser.add_argument("server", help="host:port of the server")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        asyncio.run(serve(args.host, args.port))
+    else:
+        host, port = args.server.rsplit(":", 1)
+        asyncio.run(watch(host, int(port)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Sprite atlas that holds the artwork of every entity in one image.
+
+The atlas image is loaded once and converted to the display's pixel format,
+since blitting a surface in another format converts every pixel on every
+blit. It is then sliced into one subsurface per animation frame of each
+sprite, so drawing an entity is a single blit of a surface that already
+exists. Frames whose size differs from the entity's are scaled once, at load.
+
+The layout file next to the image names the frames of each sprite:
+
+    invaders = [[0, 0, 40, 30], [40, 0, 40, 30]]
+
+Conversion needs an open display, so load the atlas after
+pygame.display.set_mode. Without one (e.g. in a headless game) the image is
+used as loaded, which draws the same but blits more slowly.
+"""
+
+import tomllib
+from collections.abc import Sequence
+from importlib.resources import files
+from pathlib import Path
+
+import pygame
+
+from pyginvaders.config import DEFAULT_CONFIG, Config
+
+# The atlas shipped with the game
+DEFAULT_ATLAS = Path(str(files("pyginvaders") / "assets" / "atlas.png"))
+
+# Pixels a bullet travels per frame of its animation
+BULLET_ANIMATION_PIXELS = 10
+
+
+class SpriteAtlas:
+    """Animation frames of every sprite, sliced from one converted image."""
+
+    def __init__(
+        self, path: str | Path = DEFAULT_ATLAS, config: Config = DEFAULT_CONFIG
+    ) -> None:
+        """Load, convert and slice an atlas.
+
+        Args:
+            path: Atlas image; its layout is the .toml file with the same name
+            config: Game settings, for the size each sprite is drawn at
+
+        Raises:
+            ValueError: If a frame lies outside the image
+        """
+        path = Path(path)
+        with open(path.with_suffix(".toml"), "rb") as file:
+            layout: dict[str, list[list[int]]] = tomllib.load(file)
+
+        image = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel format, so blits copy without converting
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        self.image = image
+
+        sizes = {
+            "invaders": (config.invader_width, config.invader_height),
+            "player": (config.player_width, config.player_height),
+            "player_bullets": (
+                config.player_bullet_width,
+                config.player_bullet_height,
+            ),
+            "invader_bullets": (
+                config.invader_bullet_width,
+                config.invader_bullet_height,
+            ),
+        }
+        self.frames: dict[str, tuple[pygame.Surface, ...]] = {}
+        for name, rects in layout.items():
+            frames = [self._slice(rect) for rect in rects]
+            size = sizes.get(name)
+            if size is not None:
+                frames = [
+                    (
+                        pygame.transform.scale(frame, size)
+                        if frame.get_size() != size
+                        else frame
+                    )
+                    for frame in frames
+                ]
+            self.frames[name] = tuple(frames)
+
+    def _slice(self, rect: Sequence[int]) -> pygame.Surface:
+        """Get a frame as a subsurface sharing the atlas's pixels."""
+        if not self.image.get_rect().contains(rect):
+            raise ValueError(f"Atlas frame {list(rect)} lies outside the image")
+        return self.image.subsurface(rect)
+
+    def frame(self, name: str, step: int = 0) -> pygame.Surface | None:
+        """Get the frame of a sprite for a step of its animation.
+
+        Args:
+            name: Sprite name, as in the layout file
+            step: Animation step; the frames repeat in a loop
+
+        Returns:
+            The frame, or None if the atlas has no such sprite
+        """
+        frames = self.frames.get(name)
+        if not frames:
+            return None
+        return frames[step % len(frames)]
@@ -1,5 +1,12 @@
 """Test configuration and shared fixtures."""
 
+import os
+
+# Open every window on SDL's dummy drivers, so tests behave the same on any
+# machine and never show real windows or play sound
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
 
 def test_placeholder():
     """A placeholder test to ensure conftest.py is recognized."""
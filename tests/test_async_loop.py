@@ -0,0 +1,62 @@
+"""Tests for the asyncio-driven game loop."""
+
+import asyncio
+from unittest.mock import patch
+
+import pygame
+
+from pyginvaders.config import Config
+from pyginvaders.game import Game
+
+
+async def quit_after(seconds: float) -> None:
+    """Post a quit event after a delay."""
+    await asyncio.sleep(seconds)
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+
+def test_run_async_stops_on_quit():
+    """Test that the async loop ends when the window is closed."""
+    game = Game(headless=True)
+
+    async def main() -> None:
+        await asyncio.gather(game.run_async(), quit_after(0.05))
+
+    asyncio.run(main())
+
+    assert game.running is False
+
+
+def test_run_async_shares_the_event_loop():
+    """Test that other tasks keep running while the game loop runs."""
+    game = Game(headless=True)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    async def main() -> None:
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(game.run_async(), quit_after(0.1))
+        task.cancel()
+
+    asyncio.run(main())
+
+    assert ticks >= 5
+
+
+def test_run_async_paces_frames():
+    """Test that the async loop runs close to the configured frame rate."""
+    game = Game(Config(fps=100), headless=True)
+
+    async def main() -> None:
+        await asyncio.gather(game.run_async(), quit_after(0.2))
+
+    with patch.object(game, "update_frame", wraps=game.update_frame) as update:
+        asyncio.run(main())
+
+    # About one frame per 10 ms over the 200 ms run
+    assert 15 <= update.call_count <= 23
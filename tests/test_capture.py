@@ -0,0 +1,83 @@
+"""Tests for the capture module."""
+
+import threading
+
+import numpy as np
+import pygame
+import pytest
+
+from pyginvaders.capture import FrameRecorder
+from pyginvaders.game import Game
+
+
+def make_frame(color: tuple[int, int, int]) -> pygame.Surface:
+    """Create a small frame with a marked top left pixel."""
+    surface = pygame.Surface((4, 3))
+    surface.fill(color)
+    surface.set_at((0, 0), (1, 2, 3))
+    return surface
+
+
+def test_raw_capture_writes_rows_of_rgb(tmp_path):
+    """Test that a raw stream holds every frame in row order."""
+    path = tmp_path / "capture.rgb"
+    recorder = FrameRecorder((4, 3), path)
+    recorder.capture(make_frame((10, 20, 30)))
+    recorder.capture(make_frame((40, 50, 60)))
+    recorder.close()
+
+    frames = np.frombuffer(path.read_bytes(), dtype=np.uint8).reshape(2, 3, 4, 3)
+    assert recorder.frames_written == 2
+    assert frames[0, 0, 0].tolist() == [1, 2, 3]
+    assert frames[0, 2, 3].tolist() == [10, 20, 30]
+    assert frames[1, 1, 1].tolist() == [40, 50, 60]
+
+
+def test_png_capture_writes_a_sequence(tmp_path):
+    """Test that a PNG sequence holds one image per frame."""
+    recorder = FrameRecorder((4, 3), tmp_path / "frames", "png")
+    for _ in range(3):
+        recorder.capture(make_frame((10, 20, 30)))
+    recorder.close()
+
+    paths = sorted((tmp_path / "frames").iterdir())
+    assert [path.name for path in paths] == [
+        "frame_000000.png",
+        "frame_000001.png",
+        "frame_000002.png",
+    ]
+    image = pygame.image.load(str(paths[0]))
+    assert image.get_at((0, 0))[:3] == (1, 2, 3)
+
+
+def test_capture_drops_frames_when_the_writer_falls_behind(tmp_path):
+    """Test that frames are dropped and counted instead of waiting."""
+    recorder = FrameRecorder((4, 3), tmp_path / "capture.rgb", buffers=2)
+    release = threading.Event()
+    write = recorder._write
+    recorder._write = lambda *args: (release.wait(), write(*args))
+
+    queued = [recorder.capture(make_frame((10, 20, 30))) for _ in range(5)]
+    release.set()
+    recorder.close()
+
+    assert queued == [True, True, False, False, False]
+    assert recorder.frames_dropped == 3
+    assert recorder.frames_written == 2
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    """Test that only the supported formats are accepted."""
+    with pytest.raises(ValueError):
+        FrameRecorder((4, 3), tmp_path / "capture", "gif")
+
+
+def test_game_records_presented_frames(tmp_path):
+    """Test that a game hands each presented frame to its recorder."""
+    game = Game(headless=True)
+    game.recorder = FrameRecorder(game.screen.get_size(), tmp_path / "capture.rgb")
+    for _ in range(3):
+        game.update_frame(False)
+    game.recorder.close()
+
+    assert game.recorder.frames_written == 3
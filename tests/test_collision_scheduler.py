@@ -0,0 +1,107 @@
+"""Tests for the collision scheduler."""
+
+import random
+
+from pyginvaders.config import DEFAULT_CONFIG, PLAYER_BULLET_SPEED, get_profile
+from pyginvaders.game import Game
+
+UNSCHEDULED = DEFAULT_CONFIG.with_overrides(scheduled_collisions=False)
+
+
+def play(game: Game, seed: int, ticks: int) -> list[bytes]:
+    """Play random input, restarting finished games, and snapshot every tick."""
+    game.random.seed(seed)
+    inputs = random.Random(seed)
+    snapshots = []
+    for _ in range(ticks):
+        roll = inputs.random()
+        game.step(roll < 0.3, 0.3 <= roll < 0.6, inputs.random() < 0.3)
+        snapshots.append(game.snapshot())
+        if game.game_lost or game.player_won:
+            game.reset_game()
+    return snapshots
+
+
+def test_scheduled_collisions_match_checking_every_tick():
+    """Test that scheduling never changes the outcome of a game."""
+    for name in ("default", "large"):
+        config = get_profile(name, invader_shoot_chance=30)
+        scheduled = Game(config, headless=True)
+        unscheduled = Game(
+            config.with_overrides(scheduled_collisions=False), headless=True
+        )
+
+        assert play(scheduled, 5, 1500) == play(unscheduled, 5, 1500)
+        assert scheduled.score > 0
+
+
+def test_bullet_is_not_checked_until_it_can_hit():
+    """Test that a bullet is only handed out once it reaches a target."""
+    game = Game(headless=True)
+    scheduler = game.scheduler
+    assert scheduler is not None
+    shield = game.shields[0]
+    bullet = game.invader_bullets[0]
+    speed = game.config.invader_bullet_speed
+    height = game.config.invader_bullet_height
+    # Reaches the top edge of the shield on its eleventh move
+    bullet.activate(shield.x + 10, shield.y - height - 11 * speed)
+
+    due_ticks = []
+    for tick in range(12):
+        game.step()
+        if bullet.index in scheduler._recheck[1]:
+            due_ticks.append(tick)
+
+    assert due_ticks[0] == 10
+    assert not bullet.active
+    assert shield.health < game.config.shield_initial_health
+
+
+def test_bullet_in_a_reused_slot_is_predicted_again():
+    """Test that a bullet fired from a just-freed slot is still checked."""
+    game = Game(headless=True)
+    bullet = game.player_bullets[0]
+    bullet.activate(10, 300)  # Harmless, left of the formation
+    game.step()
+
+    invader = game.invaders[-1]
+    bullet.deactivate()
+    bullet.activate(invader.x, invader.y + game.config.invader_height)
+    game.step()
+
+    assert invader not in game.invaders
+    assert game.score == game.config.kill_score
+
+
+def test_restore_predicts_every_bullet_again():
+    """Test that restoring a snapshot gives the same game as checking every tick."""
+    scheduled = Game(headless=True)
+    unscheduled = Game(UNSCHEDULED, headless=True)
+    play(scheduled, 2, 100)
+    snapshot = scheduled.snapshot()
+    play(scheduled, 3, 50)
+
+    scheduled.restore(snapshot)
+    unscheduled.restore(snapshot)
+    assert play(scheduled, 4, 300) == play(unscheduled, 4, 300)
+
+
+def test_march_predicts_player_bullets_again():
+    """Test that a bullet aimed between columns hits once the formation moves."""
+    config = DEFAULT_CONFIG.with_overrides(invader_move_delay=1)
+    game = Game(config, headless=True, seed=1)
+    invader = game.invaders[-1]
+    # In the gap to the right of the last column
+    x = invader.x + config.invader_width + 2
+    bullet = game.player_bullets[0]
+    bullet.activate(x, invader.y + 60 - PLAYER_BULLET_SPEED)
+
+    unscheduled = Game(
+        config.with_overrides(scheduled_collisions=False), headless=True, seed=1
+    )
+    unscheduled.player_bullets[0].activate(x, invader.y + 60 - PLAYER_BULLET_SPEED)
+    for _ in range(20):
+        game.step()
+        unscheduled.step()
+        assert game.snapshot() == unscheduled.snapshot()
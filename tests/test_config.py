@@ -0,0 +1,70 @@
+"""Tests for the config module."""
+
+import dataclasses
+
+import pytest
+
+from pyginvaders.config import (
+    DEFAULT_CONFIG,
+    FPS,
+    INVADER_ROWS,
+    PLAYER_SPEED,
+    SCREEN_WIDTH,
+    Config,
+    get_profile,
+)
+from pyginvaders.game import Game
+
+
+def test_default_config_matches_constants():
+    """Test that the default config uses the module constants."""
+    assert DEFAULT_CONFIG.screen_width == SCREEN_WIDTH
+    assert DEFAULT_CONFIG.invader_rows == INVADER_ROWS
+
+
+def test_config_is_frozen_and_slotted():
+    """Test that a config cannot be changed or given new attributes."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        DEFAULT_CONFIG.screen_width = 100  # type: ignore[misc]
+    assert not hasattr(DEFAULT_CONFIG, "__dict__")
+
+
+def test_with_overrides_returns_changed_copy():
+    """Test that overrides produce a new config and leave the original alone."""
+    config = DEFAULT_CONFIG.with_overrides(invader_rows=2)
+    assert config.invader_rows == 2
+    assert DEFAULT_CONFIG.invader_rows == INVADER_ROWS
+
+
+def test_with_overrides_rejects_unknown_setting():
+    """Test that misspelt settings are reported."""
+    with pytest.raises(TypeError):
+        DEFAULT_CONFIG.with_overrides(invader_row=2)
+
+
+def test_coarse_profile_rescales_per_tick_values():
+    """Test that the coarse profile halves the tick rate and doubles speeds."""
+    config = get_profile("coarse")
+    assert config.fps == FPS // 2
+    assert config.player_speed == PLAYER_SPEED * 2
+
+
+def test_get_profile_rejects_unknown_name():
+    """Test that unknown profile names are reported."""
+    with pytest.raises(ValueError):
+        get_profile("huge")
+
+
+def test_games_with_different_configs_side_by_side():
+    """Test that two headless games keep their own settings."""
+    small = Game(Config(invader_rows=1, invader_cols=2, player_speed=1), headless=True)
+    large = Game(get_profile("large"), headless=True)
+
+    small.step(left=True)
+    large.step(left=True)
+
+    assert len(small.invaders) == 2
+    assert len(large.invaders) == 6 * 16
+    assert small.screen.get_width() == SCREEN_WIDTH
+    assert large.screen.get_width() == 1280
+    assert small.player.x == SCREEN_WIDTH // 2 - 25 - 1
@@ -0,0 +1,188 @@
+"""Tests for the ecs module."""
+
+import numpy as np
+import pygame
+
+from pyginvaders.ecs import (
+    Archetype,
+    World,
+    collision_system,
+    lifetime_system,
+    movement_system,
+    render_system,
+    sweep_rect_collision,
+)
+from pyginvaders.game import check_rect_collision
+
+
+def make_movers(capacity: int = 4) -> Archetype:
+    """Create an archetype of moving 4x20 entities."""
+    archetype = Archetype(("position", "size", "velocity", "color"), capacity)
+    archetype["width"][:] = 4
+    archetype["height"][:] = 20
+    return archetype
+
+
+def test_spawn_uses_first_free_slot():
+    """Test that spawning fills free slots in order and reports a full pool."""
+    archetype = make_movers(capacity=2)
+    assert archetype.spawn(x=1) == 0
+    assert archetype.spawn(x=2) == 1
+    assert archetype.spawn(x=3) == -1
+    assert archetype.count() == 2
+
+    archetype.despawn(0)
+    assert archetype.spawn(x=4) == 0
+    assert archetype["x"][0] == 4
+
+
+def test_spawn_counts_generations():
+    """Test that every spawn into a slot is counted."""
+    archetype = make_movers(capacity=2)
+    archetype.spawn()
+    archetype.despawn(0)
+    archetype.spawn()
+    archetype.note_spawn(1)
+
+    assert archetype.generation.tolist() == [2, 1]
+    assert archetype.spawns == 3
+    assert archetype.copy().generation.tolist() == [2, 1]
+
+
+def test_world_copy_is_independent():
+    """Test that a copied world does not share columns with the original."""
+    world = World()
+    movers = world.add_archetype("movers", make_movers())
+    movers.spawn(x=1, y=2)
+
+    clone = world.copy()
+    movers["x"][0] = 10
+    movers.despawn(0)
+
+    assert clone["movers"]["x"][0] == 1
+    assert clone["movers"].active[0]
+    assert clone["movers"].has("position", "size")
+
+
+def test_query_matches_component_sets():
+    """Test that queries return archetypes with every requested component."""
+    world = World()
+    movers = world.add_archetype("movers", make_movers())
+    timed = world.add_archetype("timed", Archetype(("position", "lifetime"), 1))
+    assert world.query("position") == [movers, timed]
+    assert world.query("velocity") == [movers]
+    assert world.query("velocity", "lifetime") == []
+
+
+def test_movement_moves_only_live_entities():
+    """Test that movement applies velocity to active slots only."""
+    world = World()
+    movers = world.add_archetype("movers", make_movers(capacity=2))
+    movers.spawn(x=10, y=100, vx=1, vy=-5)
+    movers["y"][1] = 100
+    movers["vy"][1] = -5
+
+    movement_system(world)
+
+    assert movers["x"][0] == 11
+    assert movers["y"][0] == 95
+    assert movers["prev_y"][0] == 100
+    assert movers["y"][1] == 100
+
+
+def test_lifetime_despawns_off_screen_and_expired():
+    """Test that entities leaving the screen or running out of time despawn."""
+    world = World()
+    movers = world.add_archetype("movers", make_movers())
+    leaving = movers.spawn(y=-1, vy=-5)
+    arriving = movers.spawn(y=-1, vy=5)
+    timed = world.add_archetype("timed", Archetype(("lifetime",), 2))
+    timed.spawn(ttl=1)
+    timed.spawn(ttl=2)
+
+    lifetime_system(world, 800, 600)
+
+    assert not movers.active[leaving]
+    assert movers.active[arriving]
+    assert timed.active.tolist() == [False, True]
+
+
+def test_sweep_collision_detects_tunneling():
+    """Test that a fast rectangle passing through a thin one is detected."""
+    # Moves from above the target to below it in a single tick
+    toi = sweep_rect_collision((0, 0, 4, 20), 100, (0, 50, 40, 10))
+    assert toi is not None
+    assert 0 < toi < 1
+    # A discrete check at the end position misses it
+    assert check_rect_collision((0, 100, 4, 20), (0, 50, 40, 10)) is False
+
+
+def test_sweep_collision_misses():
+    """Test that swept collision ignores targets off the path."""
+    # Target is in a different column
+    assert sweep_rect_collision((0, 0, 4, 20), 100, (50, 50, 40, 10)) is None
+    # Target is beyond the end of the move
+    assert sweep_rect_collision((0, 0, 4, 20), 10, (0, 50, 40, 10)) is None
+    # Target is behind the start of the move
+    assert sweep_rect_collision((0, 100, 4, 20), 10, (0, 50, 40, 10)) is None
+
+
+def test_sweep_collision_without_movement():
+    """Test that a zero move behaves like a discrete collision check."""
+    assert sweep_rect_collision((0, 0, 10, 10), 0, (5, 5, 10, 10)) == 0.0
+    assert sweep_rect_collision((0, 0, 10, 10), 0, (10, 0, 10, 10)) is None
+
+
+def test_collision_matches_sweep_rect_collision():
+    """Test that collisions agree with the scalar swept collision check."""
+    movers = make_movers()
+    movers.spawn(x=10, y=0, prev_y=100)  # fast, moving up through targets
+    movers.spawn(x=10, y=50, prev_y=50)  # stationary
+    movers.spawn(x=500, y=0, prev_y=100)  # off to the side
+    targets = [(0, 60, 40, 10), (0, 20, 40, 10), (0, 45, 40, 10)]
+
+    hits = collision_system(movers, targets)
+
+    expected = []
+    for index in range(3):
+        start = (int(movers["x"][index]), int(movers["prev_y"][index]), 4, 20)
+        dy = int(movers["y"][index] - movers["prev_y"][index])
+        for target_index, target in enumerate(targets):
+            toi = sweep_rect_collision(start, dy, target)
+            if toi is not None:
+                expected.append((toi, index, target_index))
+    assert sorted(hits) == sorted(expected)
+    # Ordered by time of impact
+    assert [hit[0] for hit in hits] == sorted(hit[0] for hit in hits)
+
+
+def test_collision_checks_only_given_slots():
+    """Test that a slot list restricts the entities checked."""
+    movers = make_movers()
+    for x in (10, 500, 10):
+        movers.spawn(x=x, y=0, prev_y=100)
+    targets = [(0, 20, 40, 10)]
+
+    assert [hit[1] for hit in collision_system(movers, targets)] == [0, 2]
+    hits = collision_system(movers, targets, slots=np.array([1, 2]))
+    assert [hit[1] for hit in hits] == [2]
+
+
+def test_collision_ignores_inactive_entities():
+    """Test that inactive slots never collide."""
+    movers = make_movers()
+    movers["x"][0] = 10
+    assert collision_system(movers, [(0, 0, 40, 40)]) == []
+
+
+def test_render_draws_live_entities():
+    """Test that live entities are drawn in their color."""
+    world = World()
+    movers = world.add_archetype("movers", make_movers())
+    movers.spawn(x=10, y=10, r=255, g=0, b=0)
+    screen = pygame.Surface((50, 50))
+
+    render_system(world, screen)
+
+    assert screen.get_at((11, 11))[:3] == (255, 0, 0)
+    assert screen.get_at((30, 30))[:3] == (0, 0, 0)
@@ -0,0 +1,132 @@
+"""Tests for the structured game event log."""
+
+import pytest
+
+from pyginvaders.event_log import EventLog, read_events
+from pyginvaders.game import Game
+
+
+@pytest.fixture
+def game_with_log(tmp_path):
+    """Create a headless game that logs events to a temporary file."""
+    game = Game(headless=True)
+    game.event_log = EventLog(tmp_path / "events.jsonl")
+    return game
+
+
+def place_bullet(bullets, x: int, y: int) -> None:
+    """Activate the first bullet of a pool at a position."""
+    bullets[0].activate(x, y)
+    bullets[0].prev_y = y
+
+
+def test_events_written_in_order(tmp_path):
+    """Test that queued events are written in order when the log closes."""
+    path = tmp_path / "events.jsonl"
+    log = EventLog(path, batch_size=3)
+    for tick in range(10):
+        log.log(tick, "kill", row=0, col=tick)
+    log.close()
+
+    events = read_events(path)
+    assert [event["tick"] for event in events] == list(range(10))
+    assert events[0] == {"tick": 0, "type": "kill", "row": 0, "col": 0}
+    assert log.events_written == log.events_logged == 10
+    assert log.batches_written >= 4  # At most 3 events per batch
+
+
+def test_log_appends(tmp_path):
+    """Test that a new log adds to an existing file."""
+    path = tmp_path / "events.jsonl"
+    for score in (10, 20):
+        log = EventLog(path)
+        log.log(0, "restart", score=score)
+        log.close()
+
+    assert [event["score"] for event in read_events(path)] == [10, 20]
+
+
+def test_write_error_reported_on_close(tmp_path):
+    """Test that a failed write is raised when the log closes."""
+    log = EventLog(tmp_path / "events.jsonl")
+    log.log(0, "kill", invader=object())  # Not JSON-serializable
+    with pytest.raises(RuntimeError):
+        log.close()
+
+
+def test_kill_logged(game_with_log):
+    """Test that killing an invader logs where it was and the new score."""
+    game = game_with_log
+    invader = game.invaders[-1]
+    x, y, width, height = invader.get_rectangle()
+    place_bullet(game.player_bullets, x + width // 2, y + height - 1)
+    game.step()
+    game.event_log.close()
+
+    events = read_events(game.event_log.path)
+    assert events == [
+        {
+            "tick": 1,
+            "type": "kill",
+            "row": invader.row,
+            "col": invader.col,
+            "x": invader.x,
+            "y": invader.y,
+            "score": game.config.kill_score,
+        }
+    ]
+
+
+def test_shield_hits_and_destruction_logged(game_with_log):
+    """Test that shield hits log the remaining health until destruction."""
+    game = game_with_log
+    shield = game.shields[1]
+    shield.health = 2
+    for _ in range(2):
+        x, y, width, _ = shield.get_rectangle()
+        place_bullet(game.invader_bullets, x + width // 2, y - 5)
+        game.check_invader_bullet_shield_collisions()
+    game.event_log.close()
+
+    events = read_events(game.event_log.path)
+    assert [event["type"] for event in events] == [
+        "shield_hit",
+        "shield_hit",
+        "shield_destroyed",
+    ]
+    assert [event["health"] for event in events[:2]] == [1, 0]
+    assert all(event["shield"] == 1 for event in events)
+
+
+def test_death_and_restart_logged(game_with_log):
+    """Test that being shot and restarting are logged with the score."""
+    game = game_with_log
+    game.score = 30
+    x, y, width, _ = game.player.get_rectangle()
+    place_bullet(game.invader_bullets, x + width // 2, y - 2)
+    game.step()
+    assert game.game_lost
+    game.reset_game()
+    game.event_log.close()
+
+    events = read_events(game.event_log.path)
+    assert events == [
+        {"tick": 1, "type": "player_death", "cause": "shot", "score": 30},
+        {"tick": 1, "type": "restart", "score": 30},
+    ]
+
+
+def test_win_logged(game_with_log):
+    """Test that killing the last invader logs a win."""
+    game = game_with_log
+    for invader in game.invaders[:-1]:
+        game.formation.remove(invader)
+    game.invaders = game.invaders[-1:]
+    x, y, width, height = game.invaders[0].get_rectangle()
+    place_bullet(game.player_bullets, x + width // 2, y + height - 1)
+    game.step()
+    game.event_log.close()
+
+    events = read_events(game.event_log.path)
+    assert [event["type"] for event in events] == ["kill", "win"]
+    assert game.player_won
@@ -0,0 +1,94 @@
+"""Tests for the formation module."""
+
+from pyginvaders.config import (
+    INVADER_HEIGHT,
+    INVADER_SPACING_X,
+    INVADER_SPACING_Y,
+    INVADER_START_X,
+    INVADER_START_Y,
+    INVADER_WIDTH,
+)
+from pyginvaders.formation import Formation
+from pyginvaders.invader import Invader
+
+
+def make_formation(rows: int, cols: int) -> tuple[Formation, list[list[Invader]]]:
+    """Create a full formation and return it with its invaders by row."""
+    formation = Formation(rows, cols)
+    grid = [[Invader(0, 0, row, col) for col in range(cols)] for row in range(rows)]
+    for row in grid:
+        for invader in row:
+            formation.add(invader)
+    return formation, grid
+
+
+def test_full_formation_bounds():
+    """Test that a full formation spans the whole starting grid."""
+    formation, _ = make_formation(3, 4)
+    assert formation.left == INVADER_START_X
+    assert formation.right == INVADER_START_X + 3 * INVADER_SPACING_X + INVADER_WIDTH
+    assert formation.bottom == INVADER_START_Y + 2 * INVADER_SPACING_Y + INVADER_HEIGHT
+
+
+def test_bounds_shrink_when_edge_column_emptied():
+    """Test that killing a whole edge column moves the edge inward."""
+    formation, grid = make_formation(2, 3)
+    formation.remove(grid[0][0])
+    assert formation.left == INVADER_START_X  # column still has one invader
+
+    formation.remove(grid[1][0])
+    assert formation.left == INVADER_START_X + INVADER_SPACING_X
+
+
+def test_bottom_rises_when_bottom_row_emptied():
+    """Test that killing the whole bottom row raises the bottom edge."""
+    formation, grid = make_formation(2, 2)
+    formation.remove(grid[1][0])
+    formation.remove(grid[1][1])
+    assert formation.bottom == INVADER_START_Y + INVADER_HEIGHT
+
+
+def test_bounds_follow_movement():
+    """Test that bounds include the formation's displacement."""
+    formation, _ = make_formation(1, 1)
+    formation.move(-15, 20)
+    assert formation.left == INVADER_START_X - 15
+    assert formation.bottom == INVADER_START_Y + INVADER_HEIGHT + 20
+
+
+def test_formation_empty_after_all_removed():
+    """Test that the formation reports empty once every invader is removed."""
+    formation, grid = make_formation(1, 2)
+    formation.remove(grid[0][0])
+    assert formation.is_empty() is False
+    formation.remove(grid[0][1])
+    assert formation.is_empty() is True
+
+
+def test_remove_ignores_invaders_outside_formation():
+    """Test that removing an unknown invader leaves the formation unchanged."""
+    formation, _ = make_formation(1, 1)
+    formation.remove(Invader(0, 0))
+    assert formation.is_empty() is False
+
+
+def test_shooters_are_lowest_invader_per_column():
+    """Test that each column shoots from its lowest alive invader."""
+    formation, grid = make_formation(3, 2)
+    assert formation.shooters() == [grid[2][0], grid[2][1]]
+
+    # Killing a shooter hands the role to the next invader up
+    formation.remove(grid[2][0])
+    assert formation.shooters() == [grid[1][0], grid[2][1]]
+
+    # Killing an invader higher up the column changes nothing
+    formation.remove(grid[0][1])
+    assert formation.shooters() == [grid[1][0], grid[2][1]]
+
+
+def test_emptied_column_has_no_shooter():
+    """Test that a column with no invaders left has no shooter."""
+    formation, grid = make_formation(2, 2)
+    formation.remove(grid[1][1])
+    formation.remove(grid[0][1])
+    assert formation.shooters() == [grid[1][0]]
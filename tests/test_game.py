@@ -5,11 +5,15 @@ from unittest.mock import patch
 from pyginvaders.config import (
     INVADER_BULLET_POOL_SIZE,
     INVADER_BULLET_WIDTH,
+    INVADER_DROP_DISTANCE,
     INVADER_HEIGHT,
     INVADER_SHOOT_CHANCE,
     INVADER_SHOOT_DELAY,
+    INVADER_SPEED_X,
     INVADER_WIDTH,
     KILL_SCORE,
+    PLAYER_BULLET_SPEED,
+    SCREEN_WIDTH,
     SHIELD_SPACING_X,
     SHIELD_START_COUNT,
     SHIELD_START_X,
@@ -488,3 +492,131 @@ def test_reset_game_recreates_shields():
 
     # Should have full set of shields again
     assert len(game.shields) == SHIELD_START_COUNT
+
+
+def test_fast_bullet_hits_nearest_invader():
+    """Test that a bullet crossing two invaders in one tick kills the nearer one."""
+    game = Game()
+    far_invader = Invader(100, 100)
+    near_invader = Invader(100, 200)
+    game.invaders = [far_invader, near_invader]
+
+    # Bullet jumps from below both invaders to above both in one tick
+    bullet = game.player_bullets[0]
+    bullet.activate(110, 300)
+    bullet.prev_y = 300
+    bullet.y = 50
+
+    game.check_player_bullet_collisions()
+
+    assert game.invaders == [far_invader]
+    assert bullet.active is False
+    assert game.score == KILL_SCORE
+
+
+def test_move_invaders_steps_sideways():
+    """Test that the formation moves sideways away from the edges."""
+    game = Game()
+    start_x = [invader.x for invader in game.invaders]
+
+    game.move_invaders()
+
+    assert [invader.x for invader in game.invaders] == [
+        x + INVADER_SPEED_X for x in start_x
+    ]
+    assert game.formation.left == min(invader.x for invader in game.invaders)
+
+
+def test_move_invaders_drops_at_edge():
+    """Test that the formation drops and reverses instead of crossing an edge."""
+    game = Game()
+    # Move the formation right up against the right edge
+    while game.formation.right + INVADER_SPEED_X < SCREEN_WIDTH:
+        game.move_invaders()
+    start_y = [invader.y for invader in game.invaders]
+
+    game.move_invaders()
+
+    assert game.invader_direction == -1
+    assert [invader.y for invader in game.invaders] == [
+        y + INVADER_DROP_DISTANCE for y in start_y
+    ]
+
+
+def test_invaders_reaching_player_line_loses_game():
+    """Test that the game is lost when the formation drops onto the player."""
+    game = Game()
+    # Place the formation one drop above the player's line
+    drop = game.player.y - game.formation.bottom - INVADER_DROP_DISTANCE + 1
+    for invader in game.invaders:
+        invader.y += drop
+    game.formation.move(0, drop)
+    while game.formation.right + INVADER_SPEED_X < SCREEN_WIDTH:
+        game.move_invaders()
+    assert game.game_lost is False
+
+    game.move_invaders()
+
+    assert game.game_lost is True
+
+
+def test_invaders_shoot_from_bottom_of_each_column():
+    """Test that a volley fires one bullet from the bottom of each column."""
+    game = Game()
+    # All-zero rolls make every shooter fire
+    with patch.object(game.random, "getrandbits", return_value=0) as mock_getrandbits:
+        game.invaders_shoot()
+
+    shooters = game.formation.shooters()
+    active_bullets = [b for b in game.invader_bullets if b.active]
+    assert len(active_bullets) == len(shooters)
+    for bullet, invader in zip(active_bullets, shooters):
+        assert bullet.x == invader.x + INVADER_WIDTH // 2 - INVADER_BULLET_WIDTH // 2
+        assert bullet.y == invader.y + INVADER_HEIGHT
+    # The rolls for the whole volley come from a single call
+    mock_getrandbits.assert_called_once()
+
+
+def test_invaders_shoot_respects_probability():
+    """Test that no invader shoots when every roll fails."""
+    game = Game()
+    # All-one rolls are above the shooting threshold
+    with patch.object(
+        game.random, "getrandbits", side_effect=lambda bits: (1 << bits) - 1
+    ):
+        game.invaders_shoot()
+
+    assert all(not bullet.active for bullet in game.invader_bullets)
+
+
+def test_step_moves_player_and_fires():
+    """Test that a step applies the player's input."""
+    game = Game()
+    start_x = game.player.x
+
+    game.step(left=True, fire=True)
+
+    assert game.player.x < start_x
+    assert sum(1 for b in game.player_bullets if b.active) == 1
+
+
+def test_step_moves_bullets():
+    """Test that a step moves bullets in flight."""
+    game = Game()
+    bullet = game.player_bullets[0]
+    bullet.activate(10, 300)
+
+    game.step()
+
+    assert bullet.y == 300 + PLAYER_BULLET_SPEED
+
+
+def test_step_does_nothing_after_game_over():
+    """Test that the simulation stops once the game is lost."""
+    game = Game()
+    game.game_lost = True
+    start_x = game.player.x
+
+    game.step(left=True)
+
+    assert game.player.x == start_x
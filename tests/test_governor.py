@@ -0,0 +1,71 @@
+"""Tests for the governor module."""
+
+from unittest.mock import patch
+
+from pyginvaders.config import Config
+from pyginvaders.game import Game
+from pyginvaders.governor import FULL_QUALITY, QUALITY_LEVELS, FrameGovernor
+
+
+def test_governor_steps_quality_down_and_back_up():
+    """Test that overruns lower the quality one level at a time."""
+    governor = FrameGovernor(16.0, degrade_after=3, restore_after=5)
+    for _ in range(3):
+        governor.record(20.0)
+    assert governor.level == 1
+    assert governor.quality.shield_transparency is False
+
+    for _ in range(100):
+        governor.record(20.0)
+    assert governor.quality == QUALITY_LEVELS[-1]
+
+    for _ in range(5):
+        governor.record(5.0)
+    assert governor.level == len(QUALITY_LEVELS) - 2
+
+
+def test_governor_ignores_isolated_spikes():
+    """Test that occasional slow frames do not lower the quality."""
+    governor = FrameGovernor(16.0, degrade_after=3)
+    for _ in range(10):
+        governor.record(30.0)
+        governor.record(30.0)
+        governor.record(4.0)
+    assert governor.quality == FULL_QUALITY
+
+
+def test_game_without_adaptive_quality_has_no_governor():
+    """Test that the governor is only created when enabled in the config."""
+    assert Game(headless=True).governor is None
+    assert Game(Config(adaptive_quality=True), headless=True).governor is not None
+
+
+def test_reduced_render_rate_still_simulates_every_frame():
+    """Test that only every other frame is drawn at the lowest quality."""
+    game = Game(headless=True)
+    game.quality = QUALITY_LEVELS[-1]
+    with patch.object(game, "draw_game", wraps=game.draw_game) as draw_game:
+        for _ in range(6):
+            game.update_frame(False)
+    assert draw_game.call_count == 3
+    assert game.frame == 6
+
+
+def test_opaque_shields_and_stale_hud():
+    """Test that reduced quality draws opaque shields and skips text updates."""
+    game = Game(headless=True)
+    shield = game.shields[0]
+    shield.take_damage()
+    game.quality = QUALITY_LEVELS[2]
+    game.draw_game()
+    assert shield.surface_alpha == 255
+
+    text = game._score_text
+    game.score = 10
+    game.frame = 1
+    game.draw_game()
+    assert game._score_text is text
+
+    game.frame = 15
+    game.draw_game()
+    assert game._score_text is not None and game._score_text[0] == 10
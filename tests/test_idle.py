@@ -0,0 +1,137 @@
+"""Tests for idling on static screens and hidden windows."""
+
+from unittest.mock import patch
+
+import pygame
+
+from pyginvaders.config import Config
+from pyginvaders.game import Game
+
+
+def window_event(event_type: int) -> pygame.event.Event:
+    """Create a window event."""
+    return pygame.event.Event(event_type)
+
+
+def test_game_over_screen_is_drawn_once():
+    """Test that a static game over screen is not redrawn every frame."""
+    game = Game(headless=True)
+    game.game_lost = True
+
+    with patch.object(game, "draw_game_over", wraps=game.draw_game_over) as draw:
+        for _ in range(5):
+            game.update_frame(False)
+        assert draw.call_count == 1
+        assert game.is_idle()
+
+        # Drawn again when the window shows it again
+        game.handle_event(window_event(pygame.WINDOWEXPOSED))
+        assert not game.is_idle()
+        game.update_frame(False)
+        assert draw.call_count == 2
+
+
+def test_restart_leaves_idle():
+    """Test that restarting from the game over screen resumes frames."""
+    game = Game(headless=True)
+    game.player_won = True
+    game.update_frame(False)
+    assert game.is_idle()
+
+    game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+
+    assert not game.is_idle()
+
+
+def test_hidden_window_pauses_the_game():
+    """Test that the game idles while its window cannot be seen."""
+    game = Game(headless=True)
+    game.update_frame(False)
+    assert not game.is_idle()
+
+    game.handle_event(window_event(pygame.WINDOWMINIMIZED))
+    assert game.is_idle()
+    game.handle_event(window_event(pygame.WINDOWRESTORED))
+    assert not game.is_idle()
+
+
+def test_unfocused_window_keeps_playing():
+    """Test that losing focus alone neither pauses nor stops redraws."""
+    game = Game(headless=True)
+    game.handle_event(window_event(pygame.WINDOWFOCUSLOST))
+    tick = game.tick
+    game.update_frame(False)
+
+    assert not game.is_idle()
+    assert game.tick == tick + 1
+
+
+def test_pause_on_blur_redraws_without_stepping():
+    """Test that an unfocused game pauses but is redrawn when exposed."""
+    game = Game(Config(pause_on_blur=True), headless=True)
+    game.handle_event(window_event(pygame.WINDOWFOCUSLOST))
+    tick = game.tick
+
+    with patch.object(game, "draw_game", wraps=game.draw_game) as draw:
+        game.update_frame(False)
+        assert game.is_idle()
+        game.update_frame(False)
+        assert draw.call_count == 1
+
+        game.handle_event(window_event(pygame.WINDOWEXPOSED))
+        assert not game.is_idle()
+        game.update_frame(False)
+        assert draw.call_count == 2
+    assert game.tick == tick
+
+    game.handle_event(window_event(pygame.WINDOWFOCUSGAINED))
+    assert not game.is_idle()
+
+
+def test_run_blocks_on_events_while_idle():
+    """Test that the loop waits for input instead of drawing frames."""
+    game = Game(headless=True)
+    game.game_lost = True
+    waits = []
+
+    def wait(timeout: int) -> pygame.event.Event:
+        waits.append(timeout)
+        if len(waits) < 3:
+            return pygame.event.Event(pygame.NOEVENT)
+        return pygame.event.Event(pygame.QUIT)
+
+    with (
+        patch.object(pygame.event, "wait", wait),
+        patch.object(game, "draw_game_over", wraps=game.draw_game_over) as draw,
+    ):
+        game.run()
+
+    assert waits == [game.config.idle_wait_ms] * 3
+    assert draw.call_count == 1
+    assert game.running is False
+
+
+def test_pipelined_run_blocks_on_events_while_idle():
+    """Test that the pipelined loop stops submitting frames while idle."""
+    game = Game(headless=True)
+    game.game_lost = True
+    waits = []
+
+    def wait(timeout: int) -> pygame.event.Event:
+        waits.append(timeout)
+        if len(waits) < 3:
+            return pygame.event.Event(pygame.NOEVENT)
+        return pygame.event.Event(pygame.QUIT)
+
+    with (
+        patch.object(pygame.event, "wait", wait),
+        patch.object(
+            game, "capture_render_state", wraps=game.capture_render_state
+        ) as capture,
+    ):
+        game.run(pipelined=True)
+
+    assert waits == [game.config.idle_wait_ms] * 3
+    # Only the game over screen is handed to the render thread
+    assert capture.call_count == 1
+    assert game.running is False
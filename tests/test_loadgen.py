@@ -0,0 +1,44 @@
+"""Tests for the loadgen module."""
+
+from unittest.mock import patch
+
+import pygame
+
+from pyginvaders.config import Config
+from pyginvaders.game import Game
+from pyginvaders.loadgen import find_breaking_point, measure_scenario
+from pyginvaders.scenario import Scenario
+
+
+def test_measure_scenario_times_every_frame():
+    """Test that one frame time is recorded per tick."""
+    frame_times = measure_scenario(Scenario(input_pattern=("left+fire",)), 5)
+    assert len(frame_times) == 5
+    assert all(time >= 0 for time in frame_times)
+
+
+def test_measure_scenario_presents_through_the_backend():
+    """Test that frames are presented by the render backend, not a bare flip."""
+    scenario = Scenario(config=Config(render_backend="texture"))
+    with patch.object(Game, "present", autospec=True) as present:
+        measure_scenario(scenario, 3)
+    assert present.call_count == 3
+    pygame.quit()
+
+
+def test_breaking_point_found_when_over_budget():
+    """Test that the ramp stops at the first level over budget."""
+    results, breaking_point = find_breaking_point(
+        Scenario(), budget_ms=0, ticks=3, max_factor=3
+    )
+    assert len(results) == 1
+    assert breaking_point == results[0]
+
+
+def test_no_breaking_point_within_budget():
+    """Test that every level is tried when all fit in the budget."""
+    results, breaking_point = find_breaking_point(
+        Scenario(), budget_ms=float("inf"), ticks=3, max_factor=2
+    )
+    assert [result.factor for result in results] == [1, 2]
+    assert breaking_point is None
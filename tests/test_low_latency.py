@@ -0,0 +1,41 @@
+"""Tests for the low-latency game loop."""
+
+import pygame
+
+from pyginvaders.game import Game
+
+
+def test_low_latency_loop_filters_events_and_measures_latency():
+    """Test that unused events are blocked and latency is recorded per frame."""
+    game = Game(headless=True)
+    blocked = []
+    update_frame = game.update_frame
+
+    def update_and_quit(fire: bool) -> None:
+        update_frame(fire)
+        blocked.append(pygame.event.get_blocked(pygame.MOUSEMOTION))
+        if len(blocked) == 5:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    game.update_frame = update_and_quit
+    game.run(low_latency=True)
+
+    assert game.running is False
+    assert blocked == [True] * 6
+    assert len(game.input_latency_ms) == 6
+    assert all(latency > 0 for latency in game.input_latency_ms)
+
+    pygame.init()
+    assert not pygame.event.get_blocked(pygame.MOUSEMOTION)
+
+
+def test_latency_report_needs_samples():
+    """Test the latency summary."""
+    game = Game(headless=True)
+    assert game.latency_report() is None
+
+    game.input_latency_ms.extend([1.0, 2.0, 3.0, 10.0])
+    mean, p95, worst = game.latency_report()
+    assert mean == 4.0
+    assert worst == 10.0
+    assert 3.0 < p95 <= 10.0
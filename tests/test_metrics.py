@@ -0,0 +1,151 @@
+"""Tests for the Prometheus metrics exporter."""
+
+import gc
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from pyginvaders.config import DEFAULT_CONFIG
+from pyginvaders.game import Game
+from pyginvaders.metrics import (
+    Counter,
+    GameMetrics,
+    Histogram,
+    MetricsFileWriter,
+    MetricsServer,
+    Registry,
+)
+
+
+@pytest.fixture
+def metrics():
+    """Create game metrics that stop timing garbage collections afterwards."""
+    metrics = GameMetrics()
+    yield metrics
+    metrics.close()
+
+
+def test_render_text_format():
+    """Test that metrics render with HELP and TYPE lines once per name."""
+    registry = Registry()
+    left = registry.add(Counter("shots_total", "Shots.", {"side": "left"}))
+    registry.add(Counter("shots_total", "Shots.", {"side": "right"}))
+    left.inc(3)
+
+    assert registry.render() == (
+        "# HELP shots_total Shots.\n"
+        "# TYPE shots_total counter\n"
+        'shots_total{side="left"} 3\n'
+        'shots_total{side="right"} 0\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that histogram buckets count every observation up to their bound."""
+    histogram = Histogram("wait_seconds", "Waits.", (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    samples = list(histogram.samples())
+    assert samples == [
+        ("_bucket", {"le": "0.1"}, 2),
+        ("_bucket", {"le": "1.0"}, 3),
+        ("_bucket", {"le": "+Inf"}, 4),
+        ("_sum", {}, pytest.approx(2.65)),
+        ("_count", {}, 4),
+    ]
+
+
+def test_record_frame(metrics):
+    """Test that a frame records its timings and entity counts."""
+    game = Game(headless=True)
+    game.metrics = metrics
+    game.fire_bullet()
+    for _ in range(3):
+        game.update_frame(False)
+
+    assert metrics.frames.value == 3
+    assert sum(metrics.frame_seconds.counts) == 3
+    assert sum(metrics.frame_interval_seconds.counts) == 2
+    assert sum(metrics.phase_seconds["draw"].counts) == 3
+    assert metrics.entities["invaders"].value == len(game.invaders)
+    assert metrics.entities["shields"].value == len(game.shields)
+    assert metrics.entities["player_bullets"].value == 1
+
+
+def test_record_pipelined_frames(metrics):
+    """Test that the pipelined loop records a frame for every tick."""
+    game = Game(headless=True)
+    game.metrics = metrics
+    ticks = 0
+
+    def process_events() -> bool:
+        nonlocal ticks
+        ticks += 1
+        game.running = ticks < 3
+        return False
+
+    with patch.object(game, "process_events", process_events):
+        game.run(pipelined=True)
+
+    assert game.frame == 3
+    assert metrics.frames.value == 3
+    assert sum(metrics.frame_seconds.counts) == 3
+    assert sum(metrics.phase_seconds["step"].counts) == 3
+    assert metrics.entities["invaders"].value == len(game.invaders)
+
+
+def test_pool_exhaustion_counted(metrics):
+    """Test that shots dropped for lack of a free bullet are counted."""
+    game = Game(headless=True)
+    game.metrics = metrics
+    for _ in range(DEFAULT_CONFIG.player_bullet_pool_size + 2):
+        game.fire_bullet()
+    for _ in range(DEFAULT_CONFIG.invader_bullet_pool_size + 1):
+        game.fire_invader_bullet(100, 100)
+
+    assert metrics.pool_exhausted["player_bullets"].value == 2
+    assert metrics.pool_exhausted["invader_bullets"].value == 1
+
+
+def test_gc_pauses_timed(metrics):
+    """Test that garbage collections are timed until the metrics close."""
+    gc.collect()
+    assert sum(metrics.gc_pause_seconds.counts) >= 1
+
+    metrics.close()
+    observed = sum(metrics.gc_pause_seconds.counts)
+    gc.collect()
+    assert sum(metrics.gc_pause_seconds.counts) == observed
+
+
+def test_file_writer(metrics, tmp_path):
+    """Test that the file writer writes the metrics again when stopped."""
+    path = tmp_path / "pyginvaders.prom"
+    writer = MetricsFileWriter(metrics, path, interval=60)
+    writer.start()
+    metrics.frames.inc(7)
+    writer.stop()
+
+    assert writer.writes == 1
+    assert "pyginvaders_frames_total 7\n" in path.read_text()
+    assert not path.with_name(path.name + ".tmp").exists()
+
+
+def test_server_scrape(metrics):
+    """Test that the server serves the current metrics."""
+    server = MetricsServer(metrics)
+    server.start()
+    try:
+        host, port = server.address
+        metrics.frames.inc(2)
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.status == 200
+            body = response.read().decode()
+    finally:
+        server.stop()
+
+    assert "# TYPE pyginvaders_frame_seconds histogram" in body
+    assert "pyginvaders_frames_total 2\n" in body
+    assert 'pyginvaders_entities{kind="invaders"} 0\n' in body
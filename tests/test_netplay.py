@@ -0,0 +1,254 @@
+"""Tests for the netplay module."""
+
+import time
+
+import pygame
+import pytest
+
+from pyginvaders.config import Config
+from pyginvaders.game import Game
+from pyginvaders.netplay import (
+    VERSUS_SEED,
+    LoopbackRelay,
+    RollbackSession,
+    UdpPeer,
+    encode_invader_input,
+    encode_player_input,
+    step_versus,
+)
+
+TICKS = 120
+CONFIG = Config(invader_shoot_delay=10)
+
+
+class HeldPeer:
+    """In-memory peer whose packets are only delivered when released."""
+
+    def __init__(self) -> None:
+        self.other: "HeldPeer | None" = None
+        self.in_flight: list[bytes] = []
+        self.inbox: list[bytes] = []
+
+    def send(self, packet: bytes) -> None:
+        self.in_flight.append(packet)
+
+    def release(self) -> None:
+        """Deliver every packet sent so far."""
+        assert self.other is not None
+        self.other.inbox.extend(self.in_flight)
+        self.in_flight.clear()
+
+    def receive(self) -> list[bytes]:
+        packets, self.inbox = self.inbox, []
+        return packets
+
+
+def player_input(tick: int) -> int:
+    """Scripted input of the player side."""
+    return encode_player_input(tick % 60 < 30, tick % 60 >= 30, tick % 9 == 0)
+
+
+def invader_input(tick: int) -> int:
+    """Scripted input of the invader side."""
+    return encode_invader_input((tick // 7) % 11 if tick % 13 == 0 else None)
+
+
+def reference_snapshot(ticks: int) -> bytes:
+    """Play the scripted inputs without any network."""
+    game = Game(CONFIG, headless=True, seed=VERSUS_SEED)
+    for tick in range(ticks):
+        step_versus(game, player_input(tick), invader_input(tick))
+    return game.snapshot()
+
+
+def make_sessions(
+    peers: tuple, max_rollback: int = 8
+) -> tuple[RollbackSession, RollbackSession]:
+    """Create a session for each side, seeded alike as versus games are."""
+    player, invaders = (Game(CONFIG, headless=True, seed=VERSUS_SEED) for _ in range(2))
+    return (
+        RollbackSession(player, "player", peers[0], max_rollback),
+        RollbackSession(invaders, "invaders", peers[1], max_rollback),
+    )
+
+
+def test_late_input_rolls_back_to_the_same_state():
+    """Test that resimulating with late inputs converges on the true state."""
+    peers = HeldPeer(), HeldPeer()
+    peers[0].other, peers[1].other = peers[1], peers[0]
+    player, invaders = make_sessions(peers, max_rollback=TICKS)
+
+    # Deliver packets in bursts, so each side runs ahead on predictions
+    for tick in range(TICKS):
+        player.advance(player_input(tick))
+        invaders.advance(invader_input(tick))
+        if tick % 10 == 9:
+            peers[0].release()
+            peers[1].release()
+    for session, peer in zip((player, invaders), peers):
+        session.send_inputs()
+        peer.release()
+    player.poll()
+    invaders.poll()
+
+    expected = reference_snapshot(TICKS)
+    assert player.rollbacks > 0 and invaders.rollbacks > 0
+    assert player.game.snapshot() == expected
+    assert invaders.game.snapshot() == expected
+
+
+def test_rollback_leaves_particles_alone():
+    """Test that resimulated ticks neither burst nor advance particles again."""
+    game = Game(CONFIG, seed=VERSUS_SEED)
+    session = RollbackSession(game, "player", HeldPeer())
+    invader = game.invaders[-1]
+    x, y, width, height = invader.get_rectangle()
+    game.player_bullets[0].activate(x + width // 2, y + height + 2)
+    for _ in range(3):
+        session.advance(encode_player_input(False, False, False))
+    assert invader not in game.invaders
+    storage = game.particles.storage
+    spawns, particle_y = storage.spawns, storage["y"].copy()
+
+    session._rollback(0)
+
+    assert invader not in game.invaders
+    assert storage.spawns == spawns
+    assert (storage["y"] == particle_y).all()
+    assert not game.resimulating
+    pygame.quit()
+
+
+def test_stale_packet_skips_verified_ticks():
+    """Test that a late packet does not insert inputs older than verified."""
+    peers = HeldPeer(), HeldPeer()
+    peers[0].other, peers[1].other = peers[1], peers[0]
+    player, invaders = make_sessions(peers)
+    invaders.advance(invader_input(0))
+    stale = peers[1].in_flight[0]
+
+    for tick in range(20):
+        player.advance(player_input(tick))
+        if tick > 0:
+            invaders.advance(invader_input(tick))
+        peers[0].release()
+        peers[1].release()
+    assert player.verified_tick > 0
+
+    inserted: list[int] = []
+
+    class RecordingInputs(dict):
+        def setdefault(self, tick: int, value: int) -> int:
+            inserted.append(tick)
+            return super().setdefault(tick, value)
+
+    player.remote_inputs = RecordingInputs(player.remote_inputs)
+    player._read_packet(stale)
+
+    assert inserted == []
+    assert min(player.remote_inputs) >= player.verified_tick
+
+
+def test_session_stalls_without_remote_input():
+    """Test that a session stops simulating too far ahead of the remote side."""
+    peers = HeldPeer(), HeldPeer()
+    peers[0].other, peers[1].other = peers[1], peers[0]
+    player, _ = make_sessions(peers, max_rollback=4)
+
+    simulated = [player.advance(player_input(tick)) for tick in range(8)]
+
+    assert simulated == [True] * 4 + [False] * 4
+    assert player.stalls == 4
+
+
+def test_unknown_side_is_rejected():
+    """Test that a session needs a known side."""
+    with pytest.raises(ValueError):
+        RollbackSession(Game(CONFIG, headless=True), "spectator", HeldPeer())
+
+
+def test_sessions_converge_over_the_loopback_relay():
+    """Test a versus game over UDP with latency and jitter."""
+    relay = LoopbackRelay(latency_ms=10, jitter_ms=5, seed=1)
+    relay.start()
+    peers = (
+        UdpPeer(("127.0.0.1", 0), relay.addresses[0]),
+        UdpPeer(("127.0.0.1", 0), relay.addresses[1]),
+    )
+    player, invaders = make_sessions(peers)
+
+    inputs = (player_input, invader_input)
+    deadline = time.monotonic() + 10
+    while min(player.verified_tick, invaders.verified_tick) < TICKS - 1:
+        assert time.monotonic() < deadline, "sessions did not converge"
+        for session, script in zip((player, invaders), inputs):
+            if session.tick < TICKS:
+                session.advance(script(session.tick))
+            else:
+                session.poll()
+                session.send_inputs()
+        time.sleep(0.002)
+
+    relay.stop()
+    for peer in peers:
+        peer.close()
+
+    expected = reference_snapshot(TICKS)
+    assert player.game.snapshot() == expected
+    assert invaders.game.snapshot() == expected
+    assert relay.forwarded > 0
+
+
+def test_relay_delays_packets():
+    """Test that the relay holds packets for its latency."""
+    relay = LoopbackRelay(latency_ms=30, seed=1)
+    relay.start()
+    first = UdpPeer(("127.0.0.1", 0), relay.addresses[0])
+    second = UdpPeer(("127.0.0.1", 0), relay.addresses[1])
+
+    # The relay learns each endpoint from its first packet
+    second.send(b"hello")
+    time.sleep(0.05)
+    start = time.monotonic()
+    first.send(b"ping")
+    packets: list[bytes] = []
+    while not packets and time.monotonic() - start < 1:
+        packets = second.receive()
+    elapsed = time.monotonic() - start
+
+    relay.stop()
+    first.close()
+    second.close()
+
+    assert packets == [b"ping"]
+    assert elapsed >= 0.025
+
+
+class RefusingSocket:
+    """Socket stand-in whose first send fails."""
+
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    def sendto(self, packet: bytes, address: tuple[str, int]) -> None:
+        if not self.sent and packet == b"refused":
+            self.sent.append(b"")
+            raise OSError("refused")
+        self.sent.append(packet)
+
+
+def test_relay_keeps_forwarding_after_a_send_error():
+    """Test that a failed send drops only that packet."""
+    relay = LoopbackRelay(latency_ms=0, seed=1)
+    sockets = relay.sockets
+    refusing = RefusingSocket()
+    relay.sockets = [refusing, refusing]
+    relay.endpoints = [("127.0.0.1", 1), ("127.0.0.1", 2)]
+    relay._queue = [(0.0, 0, 1, b"refused"), (0.0, 1, 1, b"next")]
+
+    relay._forward_due()
+    for relay_socket in sockets:
+        relay_socket.close()
+
+    assert refusing.sent == [b"", b"next"]
+    assert relay.forwarded == 1
@@ -0,0 +1,120 @@
+"""Tests for the parallel module."""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from pyginvaders.config import Config
+from pyginvaders.ecs import (
+    Archetype,
+    World,
+    collision_system,
+    lifetime_system,
+    movement_system,
+)
+from pyginvaders.game import Game
+from pyginvaders.parallel import SystemPool, split_range
+
+
+def make_world(seed: int = 0, capacity: int = 100) -> World:
+    """Create a world of randomly placed moving entities."""
+    rng = np.random.default_rng(seed)
+    archetype = Archetype(("position", "size", "velocity", "lifetime"), capacity)
+    archetype.active[:] = rng.random(capacity) < 0.7
+    archetype["x"][:] = rng.integers(-10, 200, capacity)
+    archetype["y"][:] = rng.integers(-10, 200, capacity)
+    archetype["prev_y"][:] = archetype["y"]
+    archetype["width"][:] = 4
+    archetype["height"][:] = 20
+    archetype["vy"][:] = rng.choice([-15, 15], capacity)
+    archetype["ttl"][:] = rng.integers(1, 5, capacity)
+    world = World()
+    world.add_archetype("movers", archetype)
+    return world
+
+
+def test_split_range_covers_every_item_in_order():
+    """Test that the ranges are contiguous and respect the minimum size."""
+    assert split_range(10, 3, min_chunk=1) == [(0, 4), (4, 8), (8, 10)]
+    assert split_range(10, 3, min_chunk=8) == [(0, 8), (8, 10)]
+    assert split_range(0, 3) == []
+
+
+def test_pool_systems_match_serial_systems():
+    """Test that movement, lifetime and collisions match the serial systems."""
+    pool = SystemPool(4, min_chunk=8)
+    serial, parallel = make_world(), make_world()
+    targets = [(x, y, 40, 30) for x in range(0, 200, 25) for y in range(0, 200, 40)]
+
+    for _ in range(3):
+        movement_system(serial)
+        pool.movement(parallel)
+        assert pool.collisions(parallel["movers"], targets) == collision_system(
+            serial["movers"], targets
+        )
+        slots = np.arange(3, 90, 2)
+        assert pool.collisions(parallel["movers"], targets, slots) == collision_system(
+            serial["movers"], targets, slots=slots
+        )
+        lifetime_system(serial, 150, 150)
+        pool.lifetime(parallel, 150, 150)
+
+        for name, column in serial["movers"].columns.items():
+            assert (parallel["movers"][name] == column).all(), name
+        assert (parallel["movers"].active == serial["movers"].active).all()
+    pool.shutdown()
+
+
+def test_game_uses_pool_on_free_threaded_builds():
+    """Test that a game only creates a pool when it would use more cores."""
+    config = Config(worker_threads=4)
+    assert Game(config, headless=True).systems is None
+    with patch("pyginvaders.game.is_free_threaded", return_value=True):
+        assert Game(config, headless=True).systems is not None
+        assert Game(headless=True).systems is None
+
+
+def test_scheduled_collisions_run_on_the_pool():
+    """Test that a pooled game checks its scheduled bullets on the pool."""
+    config = Config(scheduled_collisions=True)
+    game = Game(config, headless=True)
+    game.systems = SystemPool(4, min_chunk=1)
+    invader = game.invaders[-1]
+    x, y, width, height = invader.get_rectangle()
+    game.player_bullets[0].activate(x + width // 2, y + height + 2)
+
+    with patch.object(
+        game.systems, "collisions", wraps=game.systems.collisions
+    ) as collisions:
+        game.step()
+    game.systems.shutdown()
+
+    assert any(call.args[2] is not None for call in collisions.call_args_list)
+    assert invader not in game.invaders
+
+
+def test_parallel_game_matches_serial_game():
+    """Test that a game stepped on a pool plays out exactly like a serial one."""
+    config = Config(invader_shoot_chance=5, invader_shoot_delay=10)
+    games = [Game(config, headless=True), Game(config, headless=True)]
+    games[1].systems = SystemPool(4, min_chunk=4)
+
+    outcomes = []
+    for game in games:
+        game.random.seed(3)
+        for tick in range(300):
+            game.step(tick % 90 < 45, tick % 90 >= 45, tick % 7 == 0)
+        outcomes.append(
+            (
+                game.score,
+                game.game_lost,
+                game.player.x,
+                [(invader.x, invader.y) for invader in game.invaders],
+                [shield.health for shield in game.shields],
+                game.world["invader_bullets"].active.tolist(),
+            )
+        )
+    games[1].systems.shutdown()
+
+    assert outcomes[0] == outcomes[1]
+    assert outcomes[0][0] > 0
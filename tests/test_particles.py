@@ -0,0 +1,159 @@
+"""Tests for the particle system."""
+
+import numpy as np
+import pygame
+import pytest
+
+from pyginvaders.config import DEFAULT_CONFIG
+from pyginvaders.game import Game
+from pyginvaders.governor import QUALITY_LEVELS
+from pyginvaders.particles import GRAVITY, LIFETIME, ParticleSystem
+
+
+def make_particles(capacity: int = 100) -> ParticleSystem:
+    """Create a seeded particle system for an 800x600 screen."""
+    return ParticleSystem(capacity, 800, 600, seed=1)
+
+
+def test_burst_spawns_up_to_capacity():
+    """Test that bursts fill free slots and count what did not fit."""
+    particles = make_particles(capacity=50)
+    assert particles.burst(400, 300, 30, (255, 0, 0)) == 30
+    assert particles.burst(400, 300, 30, (255, 0, 0)) == 20
+    assert particles.count() == 50
+    assert particles.dropped == 10
+
+    storage = particles.storage
+    assert (storage["x"] == 400).all()
+    assert (storage["r"] <= 255).all() and (storage["r"] >= 255 * 0.7).all()
+    assert (storage["g"] == 0).all()
+
+
+def test_update_moves_fades_and_ages():
+    """Test that particles move by their velocity and fall and fade."""
+    particles = make_particles()
+    particles.burst(400, 300, 10, (200, 200, 200))
+    storage = particles.storage
+    vx, vy = storage["vx"].copy(), storage["vy"].copy()
+    ttl, red = storage["ttl"].copy(), storage["r"].copy()
+
+    particles.update()
+
+    live = storage.active
+    assert np.allclose(storage["x"][live], 400 + vx[live])
+    assert np.allclose(storage["y"][live], 300 + vy[live])
+    assert np.allclose(storage["vy"][live], vy[live] + GRAVITY)
+    assert (storage["ttl"][live] == ttl[live] - 1).all()
+    assert (storage["r"][live] < red[live]).all()
+
+
+def test_update_culls_expired_and_off_screen_particles():
+    """Test that particles die when their lifetime ends or they leave."""
+    particles = make_particles()
+    particles.burst(400, 300, 10, (255, 255, 255))
+    for _ in range(LIFETIME[1]):
+        particles.update()
+    assert particles.count() == 0
+
+    particles.burst(1, 300, 40, (255, 255, 255), speed=3.0)
+    particles.update()
+    # Some particles flew off the left edge at once
+    assert 0 < particles.count() < 40
+    assert (particles.storage["x"][particles.storage.active] >= 0).all()
+
+
+def test_draw_writes_particle_pixels():
+    """Test that each particle covers a small square in its color."""
+    particles = make_particles()
+    particles.burst(100, 50, 1, (255, 128, 0))
+    storage = particles.storage
+    storage["r"][0], storage["g"][0], storage["b"][0] = 255, 128, 0
+    surface = pygame.Surface((200, 100), depth=32)
+
+    particles.draw(surface)
+
+    for pixel in ((100, 50), (101, 50), (100, 51), (101, 51)):
+        assert surface.get_at(pixel)[:3] == (255, 128, 0)
+    assert surface.get_at((102, 50))[:3] == (0, 0, 0)
+    assert surface.get_at((99, 50))[:3] == (0, 0, 0)
+
+
+def test_draw_clamps_particles_at_the_edges():
+    """Test that particles at the far edges are drawn just inside them."""
+    particles = make_particles()
+    particles.burst(199.5, 99.5, 1, (255, 255, 255))
+    surface = pygame.Surface((200, 100), depth=32)
+
+    particles.draw(surface)
+
+    assert surface.get_at((199, 99))[:3] != (0, 0, 0)
+
+
+def test_draw_needs_32_bit_pixels():
+    """Test that drawing on a surface of another depth is rejected."""
+    particles = make_particles()
+    particles.burst(10, 10, 1, (255, 255, 255))
+    with pytest.raises(ValueError):
+        particles.draw(pygame.Surface((20, 20), depth=16))
+
+
+def test_copy_is_independent():
+    """Test that updating particles leaves an earlier copy alone."""
+    particles = make_particles()
+    particles.burst(400, 300, 10, (255, 255, 255))
+    copy = particles.copy()
+    particles.update()
+    assert (copy.storage["x"][copy.storage.active] == 400).all()
+
+
+def test_kills_and_shield_hits_burst():
+    """Test that kills and shield hits spawn their bursts."""
+    config = DEFAULT_CONFIG
+    game = Game()
+    invader = game.invaders[-1]
+    x, y, width, height = invader.get_rectangle()
+    game.player_bullets[0].activate(x + width // 2, y + height - 1)
+    game.check_player_bullet_collisions()
+    assert game.particles.count() == config.kill_particles
+
+    shield = game.shields[0]
+    x, y, width, _ = shield.get_rectangle()
+    bullet = game.invader_bullets[0]
+    bullet.activate(x + width // 2, y - 5)
+    bullet.prev_y = y - 10
+    game.check_invader_bullet_shield_collisions()
+    expected = config.kill_particles + config.shield_hit_particles
+    assert game.particles.count() == expected
+
+    game.reset_game()
+    assert game.particles.count() == 0
+    pygame.quit()
+
+
+def test_bursts_leave_the_random_stream_alone():
+    """Test that effects do not change the simulation's random stream."""
+    game = Game()
+    state = game.random.getstate()
+    game.burst(400, 300, 100, (255, 255, 255))
+    assert game.random.getstate() == state
+    pygame.quit()
+
+
+def test_effects_quality_skips_particles():
+    """Test that the governor's lowest qualities spawn and draw no particles."""
+    game = Game()
+    game.burst(400, 300, 10, (255, 255, 255))
+    game.quality = next(quality for quality in QUALITY_LEVELS if not quality.effects)
+    game.burst(400, 300, 10, (255, 255, 255))
+    assert game.particles.count() == 10
+
+    game.draw_game()
+    assert game.screen.get_at((400, 300))[:3] == (0, 0, 0)
+    pygame.quit()
+
+
+def test_headless_and_disabled_games_have_no_particles():
+    """Test that headless games and a zero capacity turn particles off."""
+    assert Game(headless=True).particles is None
+    assert Game(DEFAULT_CONFIG.with_overrides(particle_capacity=0)).particles is None
+    pygame.quit()
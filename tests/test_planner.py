@@ -0,0 +1,52 @@
+"""Tests for the lookahead planning bot."""
+
+from pyginvaders.game import Game
+from pyginvaders.planner import ACTIONS, Planner, play
+
+
+def test_decide_leaves_the_game_untouched():
+    """Test that planning changes neither the game nor the random stream."""
+    game = Game(headless=True, seed=3)
+    for tick in range(50):
+        game.step(False, True, tick % 7 == 0)
+    snapshot = game.snapshot()
+    rng_state = game.random.getstate()
+
+    Planner(budget_ms=5).decide(game)
+
+    assert game.snapshot() == snapshot
+    assert game.random.getstate() == rng_state
+
+
+def test_decide_completes_the_first_level_within_any_budget():
+    """Test that an exhausted budget still tries every action once."""
+    planner = Planner(budget_ms=0)
+    planner.decide(Game(headless=True))
+
+    assert planner.nodes_expanded == len(ACTIONS)
+    assert planner.mean_depth == 1
+    assert planner.nodes_per_second > 0
+
+
+def test_decide_dodges_a_falling_bullet():
+    """Test that the bot moves out of the way of an invader bullet."""
+    game = Game(headless=True)
+    player = game.player
+    game.fire_invader_bullet(player.x + game.config.player_width // 2, player.y - 80)
+
+    left, right, _ = Planner(budget_ms=50).decide(game)
+
+    assert left != right
+
+
+def test_play_scores_and_survives():
+    """Test that the bot drives a game, scoring and staying alive."""
+    game = Game(headless=True, seed=1)
+    planner = Planner(game.config, budget_ms=5)
+
+    run = play(planner, game, 400)
+
+    assert run.ticks == 400
+    assert run.score > 0
+    assert not run.lost
+    assert run.nodes_per_second > 0
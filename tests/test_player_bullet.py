@@ -1,5 +1,7 @@
 """Tests for the player_bullet module."""
 
+from pyginvaders.config import PLAYER_BULLET_SPEED
+from pyginvaders.ecs import World
 from pyginvaders.player_bullet import PlayerBullet
 
 
@@ -59,3 +61,15 @@ def test_bullet_remains_active_before_top():
     bullet.update()
     assert bullet.active is True
     assert bullet.y == 5
+
+
+def test_bullet_pool_shares_storage():
+    """Test that pooled bullets are views onto one archetype."""
+    world = World()
+    bullets = PlayerBullet.create_pool(world, "bullets", 3)
+    bullets[1].activate(100, 200)
+
+    storage = world["bullets"]
+    assert storage.active.tolist() == [False, True, False]
+    assert storage["x"][1] == 100
+    assert storage["vy"][1] == PLAYER_BULLET_SPEED
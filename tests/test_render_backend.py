@@ -0,0 +1,111 @@
+"""Tests for the render backends."""
+
+import copy
+
+import numpy as np
+import pygame
+import pytest
+
+from pyginvaders import render_backend
+from pyginvaders.config import DEFAULT_CONFIG
+from pyginvaders.game import Game
+from pyginvaders.render_backend import (
+    SurfaceBackend,
+    TextureBackend,
+    create_backend,
+)
+
+TEXTURE_CONFIG = DEFAULT_CONFIG.with_overrides(render_backend="texture")
+
+
+def frame_pixels(game: Game) -> np.ndarray:
+    """Get the game's last drawn frame as signed RGB values."""
+    return pygame.surfarray.array3d(game.screen).astype(np.int16)
+
+
+def play(game: Game, ticks: int) -> None:
+    """Step a game with the player firing every few ticks."""
+    for tick in range(ticks):
+        game.step(False, tick % 40 < 20, tick % 10 == 0)
+
+
+def test_headless_game_draws_on_an_offscreen_surface():
+    """Test that headless games use the surface backend without flipping."""
+    game = Game(headless=True)
+    assert isinstance(game.backend, SurfaceBackend)
+    assert game.backend.flip is False
+    assert game.screen is game.backend.screen
+
+
+def test_texture_backend_falls_back_to_software_renderer(monkeypatch):
+    """Test that the texture backend opens without a GPU renderer."""
+    renderer = render_backend.Renderer
+
+    def software_only(window: pygame.Window, accelerated: int = -1, **kwargs):
+        if accelerated == 1:
+            raise pygame.error("No accelerated renderer")
+        return renderer(window, accelerated=accelerated, **kwargs)
+
+    monkeypatch.setattr(render_backend, "Renderer", software_only)
+    game = Game(TEXTURE_CONFIG)
+    assert isinstance(game.backend, TextureBackend)
+    assert game.backend.accelerated is False
+    pygame.quit()
+
+
+def test_texture_backend_matches_surface_backend():
+    """Test that both backends draw the same frame."""
+    surface_game = Game(DEFAULT_CONFIG.with_overrides(shield_alpha_reduction=40))
+    play(surface_game, 120)
+    surface_game.draw_game()
+    expected = frame_pixels(surface_game)
+
+    texture_game = Game(TEXTURE_CONFIG.with_overrides(shield_alpha_reduction=40))
+    texture_game.restore(surface_game.snapshot())
+    # Particles are not part of snapshots
+    texture_game.particles = surface_game.particles
+    texture_game.draw_game()
+    # Blending may round differently, e.g. at the edges of text
+    assert np.abs(frame_pixels(texture_game) - expected).max() <= 1
+
+    texture_game.draw_game_over("Game over")
+    surface_game.draw_game_over("Game over")
+    expected = frame_pixels(surface_game)
+    assert np.abs(frame_pixels(texture_game) - expected).max() <= 1
+    pygame.quit()
+
+
+def test_texture_backend_uploads_shields_again_only_after_erosion():
+    """Test that shield textures are reused until the shield's pixels change."""
+    game = Game(TEXTURE_CONFIG)
+    backend = game.backend
+    assert isinstance(backend, TextureBackend)
+    shield = game.shields[0]
+
+    game.draw_game()
+    texture = backend._shields[(shield.x, shield.y)][1]
+    game.draw_game()
+    assert backend._shields[(shield.x, shield.y)][1] is texture
+
+    # A copy shows the same pixels
+    backend.draw_shields([copy.copy(shield)], True)
+    assert backend._shields[(shield.x, shield.y)][1] is texture
+
+    shield.erode(shield.x + 10, shield.y)
+    game.draw_game()
+    assert backend._shields[(shield.x, shield.y)][1] is not texture
+    pygame.quit()
+
+
+def test_texture_backend_cannot_be_pipelined():
+    """Test that the texture backend refuses to draw on a render thread."""
+    game = Game(TEXTURE_CONFIG)
+    with pytest.raises(ValueError, match="render thread"):
+        game.run(pipelined=True)
+    pygame.quit()
+
+
+def test_unknown_render_backend():
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError, match="Unknown render backend"):
+        create_backend("vulkan", DEFAULT_CONFIG)
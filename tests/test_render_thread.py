@@ -0,0 +1,103 @@
+"""Tests for the render_thread module."""
+
+import threading
+
+import pygame
+import pytest
+
+from pyginvaders.game import Game
+from pyginvaders.render_thread import RenderState, RenderThread
+
+
+def test_copied_state_is_unchanged_by_later_steps():
+    """Test that a copied render state keeps the frame it was captured at."""
+    game = Game(headless=True)
+    game.step(False, False, True)
+    state = game.capture_render_state(copy=True)
+    bullet_y = state.world["player_bullets"]["y"].copy()
+    player_x = state.player.x
+    invader_x = [invader.x for invader in state.invaders]
+
+    for _ in range(5):
+        game.step(True, False, False)
+    game.move_invaders()
+
+    assert state.player.x == player_x
+    assert [invader.x for invader in state.invaders] == invader_x
+    assert (state.world["player_bullets"]["y"] == bullet_y).all()
+
+
+def test_copied_states_share_unchanged_shields():
+    """Test that shield pixels are only copied again after the shield erodes."""
+    game = Game(headless=True)
+    shield = game.shields[0]
+    first = game.capture_render_state(copy=True)
+    second = game.capture_render_state(copy=True)
+    assert second.shields[0] is first.shields[0]
+
+    # The render thread builds the copy's surface once and keeps it
+    game.draw_render_state(first)
+    surface = first.shields[0].surface
+    game.draw_render_state(game.capture_render_state(copy=True))
+    assert first.shields[0].surface is surface
+
+    shield.erode(shield.x + 10, shield.y)
+    third = game.capture_render_state(copy=True)
+    assert third.shields[0] is not first.shields[0]
+    assert first.shields[0].intact.all()
+    assert third.shields[1] is first.shields[1]
+
+
+def test_capture_render_state_reports_game_over():
+    """Test that an ended game is captured with its message."""
+    game = Game(headless=True)
+    assert game.capture_render_state().message is None
+
+    game.player_won = True
+    assert game.capture_render_state().message == "You won!"
+
+    game.game_lost = True
+    assert game.capture_render_state().message == "Game over"
+
+
+def test_render_thread_draws_every_submitted_state():
+    """Test that the render thread draws states off the submitting thread."""
+    game = Game(headless=True)
+    drawn: list[tuple[int, str]] = []
+
+    def draw(state: RenderState) -> None:
+        drawn.append((state.score, threading.current_thread().name))
+
+    renderer = RenderThread(draw, present=False)
+    renderer.start()
+    for score in range(3):
+        game.score = score
+        renderer.submit(game.capture_render_state(copy=True))
+    renderer.stop()
+
+    assert drawn == [(0, "render"), (1, "render"), (2, "render")]
+    assert renderer.frames_drawn == 3
+
+
+def test_render_thread_reports_failures():
+    """Test that a failure on the render thread is raised on the caller."""
+    game = Game(headless=True)
+
+    def draw(state: RenderState) -> None:
+        raise ValueError("broken")
+
+    renderer = RenderThread(draw, present=False)
+    renderer.start()
+    renderer.submit(game.capture_render_state(copy=True))
+    with pytest.raises(RuntimeError):
+        renderer.stop()
+
+
+def test_run_pipelined_stops_on_quit():
+    """Test that the pipelined loop draws frames and ends on quit."""
+    game = Game(headless=True)
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    game.run(pipelined=True)
+
+    assert game.running is False
@@ -0,0 +1,109 @@
+"""Tests for the scenario module."""
+
+import pytest
+
+from pyginvaders.config import INVADER_COLS, Config, get_profile
+from pyginvaders.game import Game
+from pyginvaders.scenario import Scenario, load_scenario, parse_input_pattern
+
+
+def test_parse_input_pattern_expands_ticks():
+    """Test that steps expand into one input per tick."""
+    inputs = parse_input_pattern(("left 2", "right+fire", "idle"))
+    assert inputs == [
+        (True, False, False),
+        (True, False, False),
+        (False, True, True),
+        (False, False, False),
+    ]
+
+
+def test_parse_input_pattern_rejects_unknown_action():
+    """Test that unknown actions are reported."""
+    with pytest.raises(ValueError):
+        parse_input_pattern(("jump 3",))
+
+
+def test_parse_input_pattern_rejects_bad_tick_count():
+    """Test that a non-numeric tick count is reported."""
+    with pytest.raises(ValueError):
+        parse_input_pattern(("left many",))
+
+
+def test_input_script_repeats():
+    """Test that the input script cycles through the pattern."""
+    script = Scenario(input_pattern=("left", "right")).input_script()
+    assert [next(script)[0] for _ in range(4)] == [True, False, True, False]
+
+
+def test_load_scenario_overrides_defaults(tmp_path):
+    """Test that a TOML file overrides only the settings it names."""
+    path = tmp_path / "small.toml"
+    path.write_text(
+        'name = "small"\n'
+        "[formation]\nrows = 2\n"
+        "[pools]\ninvader_bullets = 3\n"
+        '[input]\npattern = ["fire 2"]\n'
+    )
+
+    scenario = load_scenario(path)
+
+    assert scenario.name == "small"
+    assert scenario.config.invader_rows == 2
+    assert scenario.config.invader_cols == INVADER_COLS
+    assert scenario.config.invader_bullet_pool_size == 3
+    assert scenario.input_pattern == ("fire 2",)
+
+
+def test_load_scenario_applies_profile_and_config_table(tmp_path):
+    """Test that a scenario starts from its profile and applies [config]."""
+    path = tmp_path / "coarse.toml"
+    path.write_text(
+        'profile = "coarse"\n'
+        "[config]\ninvader_speed_x = 7\nplayer_color = [1, 2, 3]\n"
+    )
+
+    scenario = load_scenario(path)
+
+    assert scenario.config == get_profile(
+        "coarse", invader_speed_x=7, player_color=(1, 2, 3)
+    )
+
+
+def test_load_scenario_rejects_unknown_keys(tmp_path):
+    """Test that typos in a scenario file are reported."""
+    path = tmp_path / "typo.toml"
+    path.write_text("[formation]\nrow = 2\n")
+    with pytest.raises(ValueError):
+        load_scenario(path)
+
+
+def test_scaled_multiplies_entity_counts():
+    """Test that scaling multiplies the formation columns and bullet pools."""
+    scenario = Scenario(config=Config(invader_rows=2, invader_cols=3))
+    scaled = scenario.scaled(3)
+    assert scaled.config.invader_rows == 2
+    assert scaled.config.invader_cols == 9
+    assert (
+        scaled.config.player_bullet_pool_size
+        == 3 * scenario.config.player_bullet_pool_size
+    )
+    assert scaled.entity_count() > scenario.entity_count()
+
+
+def test_scaled_formation_stays_on_screen_and_shoots():
+    """Test that a heavily scaled formation fits its width and keeps firing."""
+    scenario = Scenario(config=Config(invader_shoot_delay=1))
+    scaled = scenario.scaled(64)
+    config = scaled.config
+    assert config.invader_rows * config.invader_cols >= 64 * 55
+
+    original = Game(scenario.config, headless=True).formation
+    game = Game(config, headless=True, seed=scenario.seed)
+    assert game.formation.right <= original.right
+    assert game.formation.bottom <= original.bottom
+
+    for _ in range(10):
+        game.step()
+    assert not game.game_lost
+    assert game.world["invader_bullets"].count() > 0
@@ -1,6 +1,16 @@
 """Tests for the Shield class."""
 
-from pyginvaders.config import SHIELD_HEIGHT, SHIELD_INITIAL_HEALTH, SHIELD_WIDTH
+import copy
+
+import pygame
+
+from pyginvaders.config import (
+    SHIELD_COLOR,
+    SHIELD_CRATER_RADIUS,
+    SHIELD_HEIGHT,
+    SHIELD_INITIAL_HEALTH,
+    SHIELD_WIDTH,
+)
 from pyginvaders.shield import Shield
 
 
@@ -71,3 +81,91 @@ def test_shield_is_destroyed_true_when_health_zero():
     for _ in range(SHIELD_INITIAL_HEALTH):
         shield.take_damage()
     assert shield.is_destroyed() is True
+
+
+def test_shield_erode_carves_a_crater():
+    """Test that eroding clears the pixels around the impact, clipped to the shield."""
+    shield = Shield(100, 200)
+    shield.erode(100, 200)
+
+    radius = SHIELD_CRATER_RADIUS
+    assert not shield.intact[0, 0]
+    assert not shield.intact[radius, 0]
+    assert shield.intact[radius + 1, 0]
+    assert shield.intact[-1, -1]
+
+
+def test_shield_find_impact_skips_craters():
+    """Test that a bullet hits the first intact pixel on its path."""
+    shield = Shield(100, 200)
+    bullet = (110, 190, 4, 20)
+    assert shield.find_impact(bullet, 5) == (112, 200)
+
+    shield.intact[:30, :] = False
+    assert shield.find_impact(bullet, 5) is None
+    assert shield.find_impact(bullet, 30) == (112, 230)
+    assert shield.find_impact((0, 190, 4, 20), 5) is None
+
+
+def test_shield_draw_leaves_craters_transparent():
+    """Test that the cached surface is updated where the shield erodes."""
+    screen = pygame.Surface((SHIELD_WIDTH, SHIELD_HEIGHT))
+    shield = Shield(0, 0)
+    shield.draw(screen)
+    assert screen.get_at((40, 30))[:3] == SHIELD_COLOR
+
+    surface = shield.surface
+    shield.erode(40, 30)
+    screen.fill((0, 0, 0))
+    shield.draw(screen)
+
+    assert shield.surface is surface
+    assert screen.get_at((40, 30))[:3] == (0, 0, 0)
+    assert screen.get_at((10, 10))[:3] == SHIELD_COLOR
+
+
+def test_shield_revision_changes_with_its_pixels():
+    """Test that erosion and restoring pixels give a new revision, copies do not."""
+    shield = Shield(100, 200)
+    other = Shield(100, 200)
+    assert shield.revision != other.revision
+
+    revision = shield.revision
+    assert copy.copy(shield).revision == revision
+    shield.erode(0, 0)  # Misses the shield
+    assert shield.revision == revision
+
+    shield.erode(110, 200)
+    assert shield.revision != revision
+    revision = shield.revision
+    shield.set_intact(other.intact)
+    assert shield.revision != revision
+
+
+def test_shield_copy_is_reused_until_the_shield_changes():
+    """Test that copies share pixels until erosion or damage, then diverge."""
+    shield = Shield(100, 200)
+    first = copy.copy(shield)
+    assert first.intact is not shield.intact
+    assert copy.copy(shield) is first
+
+    shield.erode(110, 200)
+    second = copy.copy(shield)
+    assert second is not first
+    assert first.intact.all()
+    assert not second.intact.all()
+
+    shield.take_damage()
+    third = copy.copy(shield)
+    assert third is not second
+    assert third.health == shield.health
+    assert second.health == SHIELD_INITIAL_HEALTH
+
+
+def test_shield_alpha_fades_with_damage():
+    """Test the alpha of intact pixels."""
+    shield = Shield(0, 0)
+    assert shield.alpha() == 255
+    shield.take_damage()
+    assert shield.alpha() < 255
+    assert shield.alpha(translucent=False) == 255
@@ -187,3 +187,20 @@ def test_reset_game_creates_shields_with_full_health():
     # All shields should have full health
     for shield in game.shields:
         assert shield.health == SHIELD_INITIAL_HEALTH
+
+
+def test_bullets_pass_through_craters():
+    """Test that a bullet falls through the hole an earlier hit carved."""
+    game = Game()
+    shield = game.shields[0]
+    x, y, _, height = shield.get_rectangle()
+    shield.intact[:, 8:16] = False  # A channel right through the shield
+
+    bullet = game.invader_bullets[0]
+    bullet.activate(x + 10, y - 10)
+    for _ in range(height // 5 + 4):
+        bullet.update()
+        game.check_invader_bullet_shield_collisions()
+
+    assert bullet.active
+    assert shield.health == SHIELD_INITIAL_HEALTH
@@ -0,0 +1,86 @@
+"""Tests for the snapshot module."""
+
+import pytest
+
+from pyginvaders.config import Config
+from pyginvaders.game import Game
+
+
+def play(game: Game, ticks: int) -> None:
+    """Step a game with a fixed input pattern."""
+    for tick in range(ticks):
+        game.step(tick % 90 < 45, tick % 90 >= 45, tick % 7 == 0)
+
+
+def test_restore_replays_identically():
+    """Test that a restored game plays out exactly as it did the first time."""
+    config = Config(invader_shoot_delay=10)
+    game = Game(config, headless=True, seed=5)
+    play(game, 100)
+    snapshot = game.snapshot()
+
+    play(game, 200)
+    first = game.snapshot()
+    assert first != snapshot
+
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+    play(game, 200)
+    assert game.snapshot() == first
+
+
+def test_restore_revives_killed_invaders_and_shields():
+    """Test that entities removed after the snapshot come back."""
+    game = Game(headless=True)
+    snapshot = game.snapshot()
+    invader = game.invaders[-1]
+    game.invaders.remove(invader)
+    game.formation.remove(invader)
+    game.shields.pop()
+    game.shields[0].erode(game.shields[0].x, game.shields[0].y)
+    game.score = 10
+
+    game.restore(snapshot)
+
+    assert invader in game.invaders
+    assert game.formation.alive == len(game.all_invaders)
+    assert len(game.shields) == len(game.all_shields)
+    assert game.shields[0].intact.all()
+    assert game.score == 0
+
+
+def test_restore_into_another_game():
+    """Test that a snapshot can be restored into a game with the same settings."""
+    game = Game(headless=True)
+    play(game, 50)
+    clone = Game(headless=True)
+
+    clone.restore(game.snapshot())
+
+    assert clone.snapshot() == game.snapshot()
+    assert clone.player.x == game.player.x
+    assert [bullet.y for bullet in clone.player_bullets] == [
+        bullet.y for bullet in game.player_bullets
+    ]
+
+
+def test_restore_rejects_other_settings():
+    """Test that a snapshot of a differently sized game is refused."""
+    snapshot = Game(Config(invader_rows=2), headless=True).snapshot()
+    with pytest.raises(ValueError):
+        Game(headless=True).restore(snapshot)
+
+
+def test_restore_leaves_other_games_random_streams_alone():
+    """Test that restoring one game does not change another game's rolls."""
+    config = Config(invader_shoot_delay=10)
+    game, other, reference = (Game(config, headless=True, seed=7) for _ in range(3))
+    snapshot = Game(config, headless=True, seed=1).snapshot()
+
+    play(other, 50)
+    game.restore(snapshot)
+    play(other, 50)
+    play(reference, 50)
+    play(reference, 50)
+
+    assert other.snapshot() == reference.snapshot()
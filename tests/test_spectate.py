@@ -0,0 +1,148 @@
+"""Tests for the spectate module."""
+
+import asyncio
+
+import numpy as np
+
+from pyginvaders.game import Game
+from pyginvaders.spectate import (
+    SpectatorClient,
+    SpectatorServer,
+    _Spectator,
+    apply_frame,
+    capture_frame,
+    encode_delta,
+    encode_keyframe,
+)
+
+
+def play(game: Game, ticks: int) -> None:
+    """Step a game with a fixed input pattern."""
+    for tick in range(ticks):
+        game.step(tick % 90 < 45, tick % 90 >= 45, tick % 7 == 0)
+
+
+def test_apply_frame_reproduces_the_drawn_game():
+    """Test that a spectator game draws the same scene as the original."""
+    game = Game(headless=True)
+    play(game, 200)
+    spectator = Game(headless=True)
+
+    apply_frame(spectator, capture_frame(game))
+
+    assert (capture_frame(spectator) == capture_frame(game)).all()
+    game.draw_game()
+    spectator.draw_game()
+    assert pygame_bytes(spectator) == pygame_bytes(game)
+
+
+def pygame_bytes(game: Game) -> bytes:
+    """Get the pixels of a game's screen."""
+    return bytes(game.screen.get_view("1"))
+
+
+def test_delta_decodes_against_its_keyframe():
+    """Test that deltas only carry changed values and decode exactly."""
+    game = Game(headless=True)
+    keyframe = capture_frame(game)
+    play(game, 10)
+    frame = capture_frame(game)
+    client = SpectatorClient(Game(headless=True))
+
+    client.decode(encode_keyframe(0, keyframe)[4:])
+    delta = encode_delta(10, 0, keyframe, frame)
+    tick, decoded, is_keyframe = client.decode(delta[4:])
+
+    assert (tick, is_keyframe) == (10, False)
+    assert (decoded == frame).all()
+    assert len(delta) < len(encode_keyframe(10, frame))
+
+
+def test_slow_spectators_have_bounded_buffers():
+    """Test that publishing never queues more than the buffer per spectator."""
+
+    async def main() -> tuple[int, int]:
+        server = SpectatorServer(keyframe_interval=1, buffer_frames=4)
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        await asyncio.sleep(0.05)
+
+        # Publish without yielding, so the spectator cannot keep up
+        game = Game(headless=True)
+        for _ in range(20):
+            game.step()
+            server.publish(game)
+        (spectator,) = server.spectators
+        queued = spectator.queue.qsize()
+
+        writer.close()
+        await server.close()
+        return queued, server.frames_dropped
+
+    queued, dropped = asyncio.run(main())
+    assert queued == 4
+    assert dropped == 16
+
+
+def test_joining_spectators_share_a_keyframe():
+    """Test that a burst of joins keeps the keyframe others' deltas are based on."""
+    server = SpectatorServer(keyframe_interval=10, keyframes_kept=2)
+    game = Game(headless=True)
+    watching = _Spectator(None, asyncio.Queue())
+    server.spectators.add(watching)
+    server.publish(game)
+    watching.acked_tick = watching.awaiting_tick
+
+    joined = []
+    for _ in range(5):
+        joined.append(_Spectator(None, asyncio.Queue()))
+        server.spectators.add(joined[-1])
+        game.step()
+        server.publish(game)
+
+    assert list(server.keyframes) == [0]
+    assert [spectator.awaiting_tick for spectator in joined] == [0] * 5
+    assert watching.queue.qsize() == 6
+    client = SpectatorClient(Game(headless=True))
+    for spectator in joined:
+        tick, _, is_keyframe = client.decode(spectator.queue.get_nowait()[4:])
+        assert (tick, is_keyframe) == (0, True)
+    for _ in range(6):
+        tick, frame, _ = client.decode(watching.queue.get_nowait()[4:])
+    assert tick == 5
+    assert np.array_equal(frame, capture_frame(game))
+
+
+def test_many_spectators_follow_the_game():
+    """Test that hundreds of spectators all end up drawing the live game."""
+    spectator_count = 200
+
+    async def main() -> tuple[Game, list[SpectatorClient], SpectatorServer]:
+        server = SpectatorServer(keyframe_interval=10)
+        host, port = await server.start()
+        clients = [SpectatorClient(Game(headless=True)) for _ in range(spectator_count)]
+        await asyncio.gather(*(client.connect(host, port) for client in clients))
+        while len(server.spectators) < spectator_count:
+            await asyncio.sleep(0.01)
+
+        async def follow(client: SpectatorClient) -> None:
+            while client.tick < 59:
+                await client.receive()
+
+        followers = asyncio.gather(*(follow(client) for client in clients))
+        game = Game(headless=True)
+        for tick in range(60):
+            game.step(tick % 60 < 30, tick % 60 >= 30, tick % 7 == 0)
+            server.publish(game)
+            await asyncio.sleep(0.005)
+        await asyncio.wait_for(followers, 10)
+
+        await asyncio.gather(*(client.close() for client in clients))
+        await server.close()
+        return game, clients, server
+
+    game, clients, server = asyncio.run(main())
+    expected = capture_frame(game)
+    for client in clients:
+        assert np.array_equal(capture_frame(client.game), expected)
+    assert max(client.frames_received for client in clients) > 6
@@ -0,0 +1,139 @@
+"""Tests for the sprite atlas."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pygame
+import pytest
+
+from pyginvaders.config import DEFAULT_CONFIG
+from pyginvaders.ecs import World, render_system
+from pyginvaders.game import Game
+from pyginvaders.invader import Invader
+from pyginvaders.player_bullet import PlayerBullet
+from pyginvaders.render_backend import SurfaceBackend
+from pyginvaders.sprites import SpriteAtlas
+
+
+@pytest.fixture
+def display():
+    """Open the display, which the atlas converts to."""
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (DEFAULT_CONFIG.screen_width, DEFAULT_CONFIG.screen_height)
+    )
+    yield screen
+    pygame.quit()
+
+
+def pixels(surface: pygame.Surface) -> np.ndarray:
+    """Get a surface's RGB values."""
+    return pygame.surfarray.array3d(surface)
+
+
+def test_atlas_converted_and_sliced(display):
+    """Test that frames share the atlas's pixels in the display's format."""
+    atlas = SpriteAtlas()
+    assert atlas.image.get_bitsize() == display.get_bitsize()
+    for frames in atlas.frames.values():
+        for frame in frames:
+            assert frame.get_parent() is atlas.image
+
+    invader = atlas.frame("invaders")
+    assert invader is not None
+    assert invader.get_size() == (
+        DEFAULT_CONFIG.invader_width,
+        DEFAULT_CONFIG.invader_height,
+    )
+
+
+def test_frames_loop(display):
+    """Test that animation steps cycle through the frames."""
+    atlas = SpriteAtlas()
+    first, second = atlas.frames["invaders"]
+    assert atlas.frame("invaders", 0) is first
+    assert atlas.frame("invaders", 1) is second
+    assert atlas.frame("invaders", 2) is first
+    assert atlas.frame("player", 5) is atlas.frames["player"][0]
+    assert atlas.frame("motherships") is None
+
+
+def test_frames_scaled_to_entity_size(display):
+    """Test that frames are scaled once when the entity size differs."""
+    config = DEFAULT_CONFIG.with_overrides(invader_width=80, invader_height=60)
+    atlas = SpriteAtlas(config=config)
+    frame = atlas.frame("invaders")
+    assert frame is not None
+    assert frame.get_size() == (80, 60)
+
+
+def test_frame_outside_image(display, tmp_path):
+    """Test that a layout with a frame outside the image is rejected."""
+    pygame.image.save(pygame.Surface((8, 8)), str(tmp_path / "atlas.png"))
+    (tmp_path / "atlas.toml").write_text("player = [[4, 4, 8, 8]]\n")
+    with pytest.raises(ValueError):
+        SpriteAtlas(tmp_path / "atlas.png")
+
+
+def test_invader_drawn_with_its_frame(display):
+    """Test that an invader blits its animation frame instead of a rectangle."""
+    atlas = SpriteAtlas()
+    invader = Invader(100, 50)
+    frame = atlas.frame("invaders", invader.animation_step())
+    assert frame is not None
+    expected = pygame.Surface(frame.get_size())
+    expected.blit(frame, (0, 0))
+
+    screen = pygame.Surface((200, 100))
+    invader.draw(screen, atlas)
+    drawn = screen.subsurface(invader.get_rectangle())
+    assert (pixels(drawn) == pixels(expected)).all()
+    # Transparent pixels of the artwork leave the background showing
+    assert (pixels(drawn) == 0).all(axis=2).any()
+
+
+def test_invader_animates_as_it_marches():
+    """Test that every march moves an invader to its next animation frame."""
+    invader = Invader(100, 50)
+    step = invader.animation_step()
+    invader.update(1, DEFAULT_CONFIG.invader_speed_x)
+    assert invader.animation_step() == step + 1
+    invader.y += DEFAULT_CONFIG.invader_drop_distance
+    assert invader.animation_step() == step + 2
+
+
+def test_render_system_uses_archetype_sprites(display):
+    """Test that ECS entities with a sprite are blitted and others are not."""
+    atlas = SpriteAtlas()
+    world = World()
+    bullets = PlayerBullet.create_pool(world, "player_bullets", 1)
+    bullets[0].activate(10, 10)
+    unnamed = PlayerBullet.create_pool(world, "tracers", 1)
+    unnamed[0].activate(30, 10)
+
+    backend = SurfaceBackend(pygame.Surface((50, 50)), flip=False)
+    backend.sprites = atlas
+    with patch.object(pygame.draw, "rect", wraps=pygame.draw.rect) as draw_rect:
+        render_system(world, backend.screen, backend.sprite_for)
+    # Only the entity without a sprite is drawn as a rectangle
+    assert draw_rect.call_count == 1
+    assert draw_rect.call_args.args[2][0] == 30
+
+
+def test_game_loads_atlas_once():
+    """Test that a windowed game draws frames without loading images."""
+    game = Game()
+    assert game.backend.sprites is not None
+    with patch.object(pygame.image, "load") as load:
+        for _ in range(3):
+            game.step(fire=True)
+            game.draw_game()
+    load.assert_not_called()
+    pygame.quit()
+
+
+def test_headless_and_disabled_games_draw_rectangles():
+    """Test that headless games and games without sprites use no atlas."""
+    assert Game(headless=True).backend.sprites is None
+    assert Game(DEFAULT_CONFIG.with_overrides(sprites=False)).backend.sprites is None
+    pygame.quit()